@@ -0,0 +1,64 @@
+# Copyright (c) 2023-2024 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Benchmark for the hash algorithms which can be used for the artifact paths in the upload zip.
+
+Measures the throughput of get_hash_from_file for each algorithm on a large file, which is hashed
+several times so that it is served from the page cache. Algorithms of optional packages (blake3,
+xxhash) are skipped if the package is not installed. Run from the repository root:
+
+    python benchmarks/benchmark_hash_algorithms.py --size-mib 512 --repeat 3
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+# pylint: disable=wrong-import-position
+from testguide_report_generator.util.File import create_hasher, get_hash_from_file  # noqa: E402
+
+ALGORITHMS = ["md5", "sha1", "sha256", "blake2b", "blake2s", "blake3", "xxh64", "xxh3_64", "xxh3_128"]
+
+
+def main():
+    """
+    Runs the benchmark.
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mib", type=int, default=256, help="size of the hashed file in MiB")
+    parser.add_argument("--repeat", type=int, default=3, help="number of times the file is hashed")
+    parser.add_argument("--algorithms", nargs="+", default=ALGORITHMS, help="algorithms to be compared")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "large.bin")
+        chunk = os.urandom(64 * 1024 * 1024)
+        with open(path, "wb") as file:
+            for _ in range(args.size_mib // 64):
+                file.write(chunk)
+            file.write(chunk[:args.size_mib % 64 * 1024 * 1024])
+        # warm up the page cache
+        get_hash_from_file(path, "md5")
+
+        for algorithm in args.algorithms:
+            try:
+                create_hasher(algorithm)
+            except ValueError as error:
+                print(f"{algorithm:9s}: skipped, {error}")
+                continue
+
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                get_hash_from_file(path, algorithm)
+            duration = time.perf_counter() - start
+            print(f"{algorithm:9s}: {args.size_mib * args.repeat / duration:8.1f} MiB/s")
+
+
+if __name__ == "__main__":
+    main()
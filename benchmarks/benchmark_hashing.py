@@ -0,0 +1,89 @@
+# Copyright (c) 2023-2024 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Benchmark for hashing artifacts with get_md5_hash_from_file.
+
+Measures the throughput and the peak Python memory allocation for many small files and a few
+large files, and compares them with reading the whole file at once. Run from the repository root:
+
+    python benchmarks/benchmark_hashing.py --small 2000 --large-mib 4096
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+# pylint: disable=wrong-import-position
+from testguide_report_generator.util.File import get_md5_hash_from_file  # noqa: E402
+
+
+def read_whole_file(file_path):
+    """
+    Reference implementation, which reads the whole file before hashing it.
+    """
+    with open(file_path, "rb") as file:
+        return hashlib.md5(file.read()).hexdigest()
+
+
+def create_file(path, size):
+    """
+    Creates a file of the given size with random content, written in chunks of 64 MiB.
+    """
+    chunk = os.urandom(min(size, 64 * 1024 * 1024))
+    with open(path, "wb") as file:
+        remaining = size
+        while remaining > 0:
+            file.write(chunk[:remaining])
+            remaining -= len(chunk)
+
+
+def measure(function, paths):
+    """
+    :return: duration in seconds and peak traced memory in bytes for hashing all files
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    for path in paths:
+        function(path)
+    duration = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return duration, peak
+
+
+def main():
+    """
+    Runs the benchmark.
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--small", type=int, default=1000, help="number of small files (64 KiB each)")
+    parser.add_argument("--large", type=int, default=1, help="number of large files")
+    parser.add_argument("--large-mib", type=int, default=1024, help="size of each large file in MiB")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        small = [os.path.join(directory, f"small_{index}.bin") for index in range(args.small)]
+        large = [os.path.join(directory, f"large_{index}.bin") for index in range(args.large)]
+        for path in small:
+            create_file(path, 64 * 1024)
+        for path in large:
+            create_file(path, args.large_mib * 1024 * 1024)
+
+        for name, paths, size in (("small", small, 64 * 1024), ("large", large, args.large_mib * 1024 * 1024)):
+            total_mib = len(paths) * size / 1024 / 1024
+            for label, function in (("chunked", get_md5_hash_from_file), ("read all", read_whole_file)):
+                duration, peak = measure(function, paths)
+                print(f"{name:5s} {label:8s}: {len(paths):5d} files, {total_mib / duration:8.1f} MiB/s, "
+                      f"peak memory {peak / 1024 / 1024:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
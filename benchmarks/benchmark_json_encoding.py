@@ -0,0 +1,87 @@
+# Copyright (c) 2023-2024 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Benchmark for the encodings of the `.json` report.
+
+Creates a large synthetic testsuite and measures encode time and output size for several
+JsonEncoding configurations, both for the in-memory and the streaming serialization. Run from the
+repository root:
+
+    python benchmarks/benchmark_json_encoding.py --testcases 2000 --steps 50
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+# pylint: disable=wrong-import-position
+from testguide_report_generator import (  # noqa: E402
+    JsonEncoding, Parameter, Direction, TestCase, TestStep, TestStepFolder, TestSuite, Verdict
+)
+
+ENCODINGS = {
+    "indent=4 (default)": lambda: JsonEncoding(),
+    "compact, json": lambda: JsonEncoding.compact(backend="json"),
+    "compact, auto": lambda: JsonEncoding.compact(backend="auto"),
+}
+
+
+def create_testsuite(testcases, steps):
+    """
+    Creates a testsuite with the given number of testcases and teststeps per testcase.
+    """
+    testsuite = TestSuite("Benchmark", 1666698047000)
+    for index in range(testcases):
+        testcase = TestCase(f"TestCase_{index}", 1666698047001 + index, Verdict.PASSED)
+        testcase.set_description("Überprüfung der Bremsanlage bei Nässe")
+        testcase.add_parameter_set("set", [Parameter("speed", index, Direction.IN)])
+        testcase.add_attribute_pair("ReqId", f"REQ-{index}")
+        folder = TestStepFolder("Checks")
+        for step in range(steps):
+            folder.add_teststep(TestStep(f"Check signal {step}", Verdict.PASSED, f"value >= {step}"))
+        testcase.add_execution_teststep(folder)
+        testsuite.add_testcase(testcase)
+    return testsuite
+
+
+def measure(function):
+    """
+    :return: result and duration of the function call in seconds
+    """
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def main():
+    """
+    Runs the benchmark.
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--testcases", type=int, default=2000, help="number of testcases")
+    parser.add_argument("--steps", type=int, default=50, help="number of teststeps per testcase")
+    args = parser.parse_args()
+
+    testsuite = create_testsuite(args.testcases, args.steps)
+    json_repr, duration = measure(testsuite.create_json_repr)
+    print(f"{args.testcases} testcases with {args.steps} teststeps each, create_json_repr: {duration:.2f} s")
+
+    baseline = None
+    for name, create_encoding in ENCODINGS.items():
+        encoding = create_encoding()
+        content, dumps_duration = measure(lambda: encoding.dumps(json_repr))  # pylint: disable=cell-var-from-loop
+        _, stream_duration = measure(
+            lambda: "".join(encoding.create_stream_writer().iterencode(testsuite)))  # pylint: disable=cell-var-from-loop
+        size = len(content.encode("utf-8"))
+        baseline = baseline or size
+        print(f"{name:20s} [{encoding.get_backend():6s}]: dumps {dumps_duration:6.2f} s, "
+              f"streaming {stream_duration:6.2f} s, {size / 1024 / 1024:7.1f} MiB ({size / baseline:5.1%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# Copyright (c) 2023-2024 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Benchmark for the parallel artifact compression of the Generator.
+
+Creates a testsuite with many compressible artifacts and measures the export time for an
+increasing number of worker threads. Run from the repository root:
+
+    python benchmarks/benchmark_parallel_compression.py --artifacts 400 --size 2097152
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+# pylint: disable=wrong-import-position
+from testguide_report_generator import Generator, TestCase, TestSuite, Verdict  # noqa: E402
+
+
+def create_artifacts(directory, count, size):
+    """
+    Creates text-like artifacts, which compress similar to log files.
+    """
+    words = [f"signal_{index}=" for index in range(200)]
+    rng = random.Random(42)
+    paths = []
+    for index in range(count):
+        path = os.path.join(directory, f"log_{index}.txt")
+        with open(path, "w", encoding="utf-8") as file:
+            written = 0
+            while written < size:
+                line = f"{rng.choice(words)}{rng.random():.6f}\n"
+                file.write(line)
+                written += len(line)
+        paths.append(path)
+    return paths
+
+
+def create_testsuite(paths):
+    """
+    Creates a testsuite with one testcase per artifact.
+    """
+    testsuite = TestSuite("Benchmark", 1666698047000)
+    for index, path in enumerate(paths):
+        testsuite.add_testcase(TestCase(f"TestCase_{index}", 1666698047001, Verdict.PASSED).add_artifact(path))
+    return testsuite
+
+
+def main():
+    """
+    Runs the benchmark.
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--artifacts", type=int, default=200, help="number of artifacts")
+    parser.add_argument("--size", type=int, default=1024 * 1024, help="size of each artifact in bytes")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16], help="worker counts to measure")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        testsuite = create_testsuite(create_artifacts(directory, args.artifacts, args.size))
+        total_mib = args.artifacts * args.size / 1024 / 1024
+        print(f"{args.artifacts} artifacts, {total_mib:.0f} MiB, {os.cpu_count()} CPUs")
+
+        baseline = None
+        for workers in args.workers:
+            generator = Generator(testsuite, workers=workers)
+            start = time.perf_counter()
+            generator.export(os.path.join(directory, f"report_{workers}.json"), keep_json=False)
+            duration = time.perf_counter() - start
+            baseline = baseline or duration
+            print(f"workers={workers:3d}: {duration:7.2f} s, {total_mib / duration:8.1f} MiB/s, "
+                  f"speedup {baseline / duration:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# Copyright (c) 2023-2024 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Benchmark for finding the issues of large invalid reports in several processes.
+
+Creates a report with many testcases, some of which violate the schema, and measures how long
+JsonValidator takes to find all issues with an increasing number of processes. The first call of
+a validator includes starting its processes, the following calls reuse them. Valid reports are
+recognized by the compiled validator in the calling process and are not affected. Run from the
+repository root:
+
+    python benchmarks/benchmark_parallel_validation.py --testcases 5000 --repeat 5
+"""
+
+import argparse
+import copy
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+# pylint: disable=wrong-import-position
+from testguide_report_generator.model.TestCase import TestCase, TestStep, Verdict  # noqa: E402
+from testguide_report_generator.model.TestSuite import TestSuite  # noqa: E402
+from testguide_report_generator.util.JsonValidator import DEFAULT_JSON_SCHEMA_PATH, JsonValidator  # noqa: E402
+
+
+def create_invalid_report(testcases):
+    """
+    :return: JSON representation of a testsuite, in which every tenth testcase is invalid
+    """
+    testsuite = TestSuite("suite", 1666698047000)
+    for index in range(testcases):
+        testcase = TestCase(f"testcase {index}", 1666698047000, Verdict.PASSED)
+        for step in range(10):
+            testcase.add_execution_teststep(TestStep(f"step {step}", Verdict.PASSED, "expected"))
+        testsuite.add_testcase(testcase)
+    report = testsuite.create_json_repr()
+    for index in range(0, testcases, 10):
+        report["testcases"][index] = copy.deepcopy(report["testcases"][index])
+        report["testcases"][index]["verdict"] = "UNKNOWN"
+    return report
+
+
+def main():
+    """
+    Runs the benchmark.
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--testcases", type=int, default=5000, help="number of testcases of the report")
+    parser.add_argument("--repeat", type=int, default=5, help="number of validations per validator")
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 2, 4, 8], help="process counts to measure")
+    args = parser.parse_args()
+
+    report = create_invalid_report(args.testcases)
+    print(f"{args.testcases} testcases, {os.cpu_count()} CPUs")
+
+    baseline = None
+    for processes in args.processes:
+        with JsonValidator(DEFAULT_JSON_SCHEMA_PATH, processes) as validator:
+            durations = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                issues = validator.find_issues_parallel(report)
+                durations.append(time.perf_counter() - start)
+                assert len(issues) == len(range(0, args.testcases, 10))
+        reused = sum(durations[1:]) / max(len(durations) - 1, 1)
+        baseline = baseline or reused
+        print(f"processes={processes:3d}: first {durations[0]:7.3f} s, reused {reused:7.3f} s, "
+              f"speedup {baseline / reused:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
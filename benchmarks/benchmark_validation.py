@@ -0,0 +1,93 @@
+# Copyright (c) 2023-2024 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Benchmark for validating many small reports, as done by services which export hundreds of
+reports per minute.
+
+Compares reading the schema and creating a new jsonschema validator for each report with the
+process-wide validator cache used by JsonValidator and Generator, and the cached jsonschema
+validator with the validator compiled from the schema, which JsonValidator tries first. Run from
+the repository root:
+
+    python benchmarks/benchmark_validation.py --reports 1000 --testcases 5
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import jsonschema
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+# pylint: disable=wrong-import-position
+from testguide_report_generator.model.TestCase import TestCase, TestStep, Verdict  # noqa: E402
+from testguide_report_generator.model.TestSuite import TestSuite  # noqa: E402
+from testguide_report_generator.util.JsonValidator import (  # noqa: E402
+    DEFAULT_JSON_SCHEMA_PATH,
+    JsonValidator,
+    get_schema_validator,
+)
+
+
+def create_report(testcases):
+    """
+    :return: JSON representation of a small testsuite
+    """
+    testsuite = TestSuite("suite", 1666698047000)
+    for index in range(testcases):
+        testcase = TestCase(f"testcase {index}", 1666698047000, Verdict.PASSED)
+        testcase.add_execution_teststep(TestStep("step", Verdict.PASSED, "expected"))
+        testsuite.add_testcase(testcase)
+    return testsuite.create_json_repr()
+
+
+def validate_uncached(report):
+    """
+    Reference implementation, which reads the schema and creates a new validator for each report.
+    """
+    with open(DEFAULT_JSON_SCHEMA_PATH, "r", encoding="utf-8") as file:
+        validator = jsonschema.Draft7Validator(json.loads(file.read()))
+    return not any(validator.iter_errors(report))
+
+
+def validate_jsonschema(report):
+    """
+    Uses the cached jsonschema validator only, as JsonValidator did before validators were compiled.
+    """
+    return not any(get_schema_validator(DEFAULT_JSON_SCHEMA_PATH).iter_errors(report))
+
+
+def validate_cached(report):
+    """
+    Creates a new JsonValidator for each report, which reuses the cached validator.
+    """
+    return JsonValidator(DEFAULT_JSON_SCHEMA_PATH).validate_json(report)
+
+
+def main():
+    """
+    Runs the benchmark.
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--reports", type=int, default=500, help="number of validated reports")
+    parser.add_argument("--testcases", type=int, default=5, help="number of testcases per report")
+    args = parser.parse_args()
+
+    report = create_report(args.testcases)
+    for label, function in (("uncached", validate_uncached), ("jsonschema", validate_jsonschema),
+                            ("cached", validate_cached)):
+        start = time.perf_counter()
+        for _ in range(args.reports):
+            assert function(report)
+        duration = time.perf_counter() - start
+        print(f"{label:10s}: {args.reports / duration:8.1f} reports/s, "
+              f"{duration / args.reports * 1000:6.3f} ms per report")
+
+
+if __name__ == "__main__":
+    main()
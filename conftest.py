@@ -2,8 +2,10 @@
 #
 # SPDX-License-Identifier: MIT
 
+import copy
 import json
 import os
+import random
 from unittest.mock import patch
 
 import pytest
@@ -34,6 +36,58 @@ JSON_SCHEMA_PATH = "testguide_report_generator/schema/schema.json"
 PATH_TO_VALID_JSON = "tests/resources/valid.json"
 PATH_TO_INVALID_JSON = "tests/resources/invalid.json"
 
+# values which are close to the boundaries of the schema, e.g. to mutate reports or as arguments of the model
+FUZZ_VALUES = [None, True, False, 0, 1, -1, 1.0, 1.5, -0.5, 2 ** 53, "", "x", "x" * 64, "x" * 65, "x" * 120,
+               "x" * 121, "x" * 1024, "x" * 1025, "x" * 6145, "PASSED", "FAILED", "IMAGE", "IN", "teststep",
+               "teststepfolder", "testcase", "testcasefolder", "1abc", "a_b", "a__b", "key:with.dots", [], [""],
+               ["a", 1], {}, {"@type": "teststep", "name": "step", "verdict": "NONE"}]
+
+
+def collect_containers(value, result):
+    result.append(value)
+    children = value.values() if isinstance(value, dict) else value
+    for child in children:
+        if isinstance(child, (dict, list)):
+            collect_containers(child, result)
+    return result
+
+
+def mutate(report, rng):
+    containers = collect_containers(report, [])
+    container = rng.choice(containers)
+    if isinstance(container, dict):
+        key = rng.choice(list(container) or ["new"])
+        operation = rng.randrange(3)
+        if operation == 0 and key in container:
+            del container[key]
+        elif operation == 1:
+            container[key] = copy.deepcopy(rng.choice(FUZZ_VALUES))
+        else:
+            container[rng.choice(["extra", "@type", "name", "verdict", "timestamp"])] = \
+                copy.deepcopy(rng.choice(FUZZ_VALUES))
+    else:
+        operation = rng.randrange(3)
+        if operation == 0:
+            container.clear()
+        elif operation == 1 and container:
+            container[rng.randrange(len(container))] = copy.deepcopy(rng.choice(FUZZ_VALUES))
+        elif container:
+            container.append(copy.deepcopy(rng.choice(container)))
+
+
+def fuzz(report, count, seed):
+    rng = random.Random(seed)
+    for _ in range(count):
+        mutated = copy.deepcopy(report)
+        for _ in range(rng.randint(1, 3)):
+            mutate(mutated, rng)
+        yield mutated
+
+
+@pytest.fixture
+def fuzz_values():
+    return FUZZ_VALUES
+
 
 @pytest.fixture
 def artifact_path():
@@ -76,14 +130,14 @@ def artifact():
 
 
 @pytest.fixture
-@patch("testguide_report_generator.model.TestCase.get_md5_hash_from_file")
+@patch("testguide_report_generator.model.Artifact.get_md5_hash_from_file")
 def artifact_mock_hash(mock_hash):
     mock_hash.return_value = "hash"
     return Artifact(ARTIFACT_PATH)
 
 
 @pytest.fixture
-@patch("testguide_report_generator.model.TestCase.get_md5_hash_from_file")
+@patch("testguide_report_generator.model.Artifact.get_md5_hash_from_file")
 def teststep_artifact_mock_hash(mock_hash):
     mock_hash.return_value = "hash"
     return TestStepArtifact(ARTIFACT_PATH, TestStepArtifactType.IMAGE)
@@ -193,6 +247,20 @@ def testcase_folder(testcase):
     return tcf
 
 
+class SchemaViolatingTestCase(TestCase):
+    """
+    TestCase whose report violates the schema, which cannot be created with the model itself.
+    """
+
+    def create_lazy_json_repr(self):
+        return {**super().create_lazy_json_repr(), "timestamp": -1}
+
+
+@pytest.fixture
+def invalid_testcase():
+    return SchemaViolatingTestCase("invalid", 0, Verdict.PASSED)
+
+
 @pytest.fixture
 def testsuite():
     return TestSuite("MyTestSuite", 1666698047000)
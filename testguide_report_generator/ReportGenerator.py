@@ -6,18 +6,39 @@
 This module contains the JsonGenerator class.
 """
 
-import json
+import asyncio
+import io
 import os
+import threading
 
-from zipfile import ZipFile, ZIP_DEFLATED
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from typing import Optional
+from zipfile import ZIP_DEFLATED
 from testguide_report_generator.model.TestSuite import TestSuite
+from testguide_report_generator.model.Artifact import use_report_paths
 from testguide_report_generator.model.TestCase import TestCase
 from testguide_report_generator.model.TestCaseFolder import TestCaseFolder
-from testguide_report_generator.util.JsonValidator import JsonValidator
+from testguide_report_generator.util.CompressionPolicy import CompressionPolicy
+from testguide_report_generator.util.File import create_hasher
+from testguide_report_generator.util.JsonEncoding import JsonEncoding
+from testguide_report_generator.util.JsonValidator import VALIDATED_TESTCASE_PLACEHOLDER, JsonValidator
+from testguide_report_generator.util.TestSuiteSplitter import split_testsuite
+from testguide_report_generator.util.UploadZip import UploadZipFile, compress_file, supports_precompressed_entries
 
 DEFAULT_JSON_SCHEMA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "schema",
                                         "schema.json")
 
+# artifacts above this size are not compressed into memory by the worker threads
+MAX_IN_MEMORY_ARTIFACT_SIZE = 64 * 1024 * 1024
+
+
+class _ExportCancelled(Exception):
+    """
+    Raised inside the export, if an asynchronous export was cancelled.
+    """
+
 
 class Generator:
     """
@@ -31,7 +52,11 @@ class Generator:
     """
 
 
-    def __init__(self, testsuite: TestSuite, json_schema_path: str = DEFAULT_JSON_SCHEMA_PATH):
+    def __init__(self, testsuite: TestSuite, json_schema_path: str = DEFAULT_JSON_SCHEMA_PATH, *,
+                 streaming: bool = False, compression_policy: Optional[CompressionPolicy] = None,
+                 workers: int = 1, json_encoding: Optional[JsonEncoding] = None, hash_algorithm: Optional[str] = None,
+                 validation_processes: int = 1, trusted: bool = False):
+        # pylint: disable=R0913
         """
         Constructor
 
@@ -40,59 +65,785 @@ class Generator:
         :param json_schema_path: path to the json schema against which the generated `.json`
         report is checked
         :type json_schema_path: str
+        :param streaming: set to True, to validate and write the report one testcase at a time
+            instead of building the complete report in memory. The resulting `.json` is identical.
+        :type streaming: bool
+        :param compression_policy: decides how the artifacts are compressed in the `.zip` file. By
+            default, already compressed files like images are stored without compression.
+        :type compression_policy: CompressionPolicy or None
+        :param workers: number of threads which compress artifacts concurrently
+        :type workers: int
+        :param json_encoding: encoding of the `.json` report, by default indented by four spaces
+        :type json_encoding: JsonEncoding or None
+        :param hash_algorithm: algorithm with which all artifacts of the testsuite are hashed when
+            exporting, see :func:`create_hasher<testguide_report_generator.util.File.create_hasher>`.
+            The artifacts themselves are not changed, the hashes are only used for the exports of
+            this Generator. By default, each artifact keeps the algorithm it was created with,
+            which is MD5 unless changed by :meth:`Artifact.set_default_hash_algorithm`.
+        :type hash_algorithm: str or None
+        :param validation_processes: number of processes which search the top-level testcases of
+            an invalid report for errors, see :class:`JsonValidator<testguide_report_generator.JsonValidator>`.
+            Valid reports are recognized by the compiled validator without starting any process.
+            Only applies if the complete report is validated at once, so it is ignored in
+            streaming mode and if the testsuite validates its testcases when they are added.
+            The processes are kept for further exports of this Generator.
+        :type validation_processes: int
+        :param trusted: set to True, to skip the validation against the JSON schema. The model
+            classes only allow to create testcases which comply with the default schema, so that
+            only the one remaining constraint is checked on export: the testsuite must contain at
+            least one testcase. Only for the default schema and for testcases created with the
+            model classes themselves, not with subclasses which change their `.json` representation.
+        :type trusted: bool
+        :raises ValueError: workers or validation_processes is less than 1, the hash algorithm is
+            not available, or trusted is combined with another schema than the default one
         """
+        if validation_processes < 1:
+            raise ValueError(f"The number of validation processes must be at least 1. Was {validation_processes}")
+        if trusted and os.path.abspath(json_schema_path) != DEFAULT_JSON_SCHEMA_PATH:
+            raise ValueError(f"Trusted exports only support the default schema. Was {json_schema_path}")
+        self.__trusted = trusted
         self.__testsuite = testsuite
-        self.__validator = JsonValidator(json_schema_path)
+        self.__json_schema_path = json_schema_path
+        self.__validator = JsonValidator(json_schema_path, 1 if streaming else validation_processes)
+        self.__validation_processes = validation_processes
+        self.__streaming = streaming
+        self.__compression_policy = compression_policy or CompressionPolicy()
+        if workers < 1:
+            raise ValueError(f"The number of workers must be at least 1. Was {workers}")
+        self.__workers = workers
+        self.__json_encoding = json_encoding or JsonEncoding()
+        if hash_algorithm is not None:
+            create_hasher(hash_algorithm)
+        self.__hash_algorithm = hash_algorithm
+        # paths in the upload zip of the artifacts hashed with the algorithm of the Generator
+        self.__zip_paths: dict = {}
+        self.__zip_entries: set[str] = set()
+        self.__written_artifacts = 0
+        self.__skipped_duplicates = 0
+        self.__cancel_event: threading.Event | None = None
+        self.__checkpoint: str | None = None
 
-    def export(self, json_file_path: str):
+    def export(self, json_file_path: str, keep_json: bool = True):
         """
         This method generates both a test report in `.json` format from the testsuite and a
         `.zip` file containing that report, as well as possible further artifacts added to the
-        :class:`TestCase<testguide_report_generator.TestCase.TestCase>` objects.
+        :class:`TestCase<testguide_report_generator.TestCase.TestCase>` objects. The report is
+        serialized directly into the `.zip` file. Artifacts which have not been hashed yet are
+        hashed while they are compressed, in which case the report is written after them.
+
+        :param json_file_path: the path for the output `.json` file
+        :type json_file_path: str
+        :param keep_json: set to False, to only write the report into the `.zip` file without
+            creating the `.json` file next to it
+        :type keep_json: bool
+        :return: path to the exported `.zip` file
+        :rtype: str
+        """
+        self.__cancel_event = None
+        return self.__export(json_file_path, keep_json)
+
+    async def export_async(self, json_file_path: str, keep_json: bool = True):
+        """
+        Asynchronous variant of :meth:`export`, which runs the export in a worker thread and thus
+        does not block the event loop. The created `.zip` file is identical to the one of
+        :meth:`export`. If the coroutine is cancelled, the export is stopped at the next
+        testcase or artifact and the partially written files are removed. The files are removed
+        as well if the export has already been completed, so that no files remain after a
+        cancellation. Only one export per Generator may run at a time.
+
+        :param json_file_path: the path for the output `.json` file
+        :type json_file_path: str
+        :param keep_json: set to False, to only write the report into the `.zip` file without
+            creating the `.json` file next to it
+        :type keep_json: bool
+        :raises asyncio.CancelledError: the export was cancelled
+        :return: path to the exported `.zip` file
+        :rtype: str
+        """
+        self.__cancel_event = threading.Event()
+        future = asyncio.get_running_loop().run_in_executor(None, self.__export, json_file_path, keep_json)
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            self.__cancel_event.set()
+            try:
+                await future
+            except _ExportCancelled:
+                pass
+            else:
+                # the export was completed before it noticed the cancellation
+                self.__remove_outputs(json_file_path, keep_json)
+            raise
+
+    def export_sharded(self, json_file_path: str, max_testcases: Optional[int] = None,
+                       max_bytes: Optional[int] = None, keep_json: bool = True):
+        """
+        Splits the testsuite into several smaller testsuites and exports each of them into its own
+        `.zip` file, which only contains the artifacts of its own testcases. Each shard is a
+        complete, schema-compliant report which can be uploaded to test.guide on its own. With
+        more than one worker, the shards are exported concurrently.
+
+        :param json_file_path: the path for the output `.json` file, the shards are numbered
+            consecutively, e.g. `report_1.json`, `report_2.json`
+        :type json_file_path: str
+        :param max_testcases: maximum number of testcases per shard, None for no limit
+        :type max_testcases: int or None
+        :param max_bytes: maximum size of the encoded `.json` report plus the uncompressed size of
+            the artifacts per shard, None for no limit
+        :type max_bytes: int or None
+        :param keep_json: set to False, to only write the reports into the `.zip` files without
+            creating the `.json` files next to them
+        :type keep_json: bool
+        :raises ValueError: neither max_testcases nor max_bytes is given, or one of them is less
+            than 1
+        :return: paths to the exported `.zip` files, or None if the testsuite does not contain any
+            testcases or any of the shards is invalid
+        :rtype: list or None
+        """
+        if not self.__check_trusted():
+            # without testcases there is no shard which could report the invalid testsuite
+            return None
+
+        filename = self.__get_zip_file_path(json_file_path)[:-len(".zip")]
+        self.__zip_paths = {}
+        self.__resolve_hashes(self.__testsuite.get_testcases())
+        with use_report_paths(self.__zip_paths.get):
+            generators = [
+                Generator(shard, self.__json_schema_path, streaming=self.__streaming,
+                          compression_policy=self.__compression_policy, json_encoding=self.__json_encoding,
+                          hash_algorithm=self.__hash_algorithm, validation_processes=self.__validation_processes,
+                          trusted=self.__trusted)
+                for shard in split_testsuite(self.__testsuite, max_testcases, max_bytes, self.__json_encoding)
+            ]
+        shard_json_paths = [f"{filename}_{index}.json" for index in range(1, len(generators) + 1)]
+
+        def export_shard(generator, path):
+            # the shards share the hashes of this Generator
+            return generator.__export(path, keep_json, self.__zip_paths)  # pylint: disable=protected-access
+
+        with ThreadPoolExecutor(max_workers=self.__workers) as executor:
+            zip_file_paths = list(executor.map(export_shard, generators, shard_json_paths))
+
+        self.__written_artifacts = sum(generator.get_written_artifact_count() for generator in generators)
+        self.__skipped_duplicates = sum(generator.get_skipped_duplicate_count() for generator in generators)
+
+        if None in zip_file_paths:
+            for path in [*zip_file_paths, *shard_json_paths]:
+                if path is not None and os.path.exists(path):
+                    os.remove(path)
+            return None
+
+        return zip_file_paths
+
+    def export_incremental(self, json_file_path: str, keep_json: bool = True):
+        """
+        Exports a checkpoint of a testsuite which is still growing, for instance during a long
+        running test campaign. The first call creates the `.zip` file. Each further call with the
+        same path validates the testcases which were added or modified since the previous call,
+        also inside already exported folders, adds their new artifacts and rewrites the `.json`
+        report, which is always the last entry of the `.zip` file. If a checkpoint fails, the
+        `.zip` and `.json` files of the previous checkpoint are kept. Artifacts which have already
+        been exported must not be changed afterwards. If the running Python version does not
+        support removing entries from a `.zip` file, each call exports the complete testsuite
+        like :meth:`export`.
 
         :param json_file_path: the path for the output `.json` file
         :type json_file_path: str
+        :param keep_json: set to False, to only write the report into the `.zip` file without
+            creating the `.json` file next to it
+        :type keep_json: bool
         :return: path to the exported `.zip` file
         :rtype: str
         """
+        if not supports_precompressed_entries():
+            return self.export(json_file_path, keep_json)
+
+        zip_file_path = self.__get_zip_file_path(json_file_path)
+        testcases = self.__testsuite.get_testcases()
+        continuing = self.__checkpoint == json_file_path and os.path.exists(zip_file_path)
+        if not continuing:
+            self.__zip_paths = {}
+        self.__resolve_hashes(testcases)
+        with use_report_paths(self.__zip_paths.get):
+            if not self.__validate_checkpoint():
+                return None
+
+            self.__cancel_event = None
+            self.__written_artifacts = 0
+            self.__skipped_duplicates = 0
+            self.__write_checkpoint(zip_file_path, json_file_path, keep_json, continuing)
+
+        self.__checkpoint = json_file_path
+        return zip_file_path
+
+    def export_to_stream(self, stream, json_name: str = "report.json"):
+        """
+        Generates the `.zip` file like :meth:`export`, but writes it into the given binary stream
+        instead of a file, e.g. into an :class:`io.BytesIO`, a pipe or a socket. No files are
+        created. The stream does not need to be seekable.
+
+        :param stream: writable binary stream
+        :type stream: BinaryIO
+        :param json_name: name of the `.json` report inside the `.zip` file
+        :type json_name: str
+        :return: true if the report was valid and has been written, otherwise false
+        :rtype: boolean
+        """
+        self.__checkpoint = None
+        self.__cancel_event = None
+        self.__zip_paths = {}
+        self.__resolve_hashes(self.__testsuite.get_testcases())
+        with use_report_paths(self.__zip_paths.get):
+            json_repr, is_valid = self.__validate()
+            if is_valid:
+                self.__write_zip(stream, json_name, json_repr, None)
+        return is_valid
+
+    def __export(self, json_file_path, keep_json, zip_paths=None):
+        """
+        :see: :meth:`export`
+
+        :param zip_paths: paths in the upload zip of the artifacts which have already been hashed
+            with the algorithm of the Generator, or None
+        :type zip_paths: dict or None
+        """
+        self.__checkpoint = None
+        self.__check_cancelled()
+        zip_file_path = self.__get_zip_file_path(json_file_path)
+        json_name = os.path.basename(json_file_path)
+        self.__zip_paths = {} if zip_paths is None else zip_paths
+        try:
+            with use_report_paths(self.__zip_paths.get):
+                if self.__has_pending_hashes():
+                    # the artifacts have to be read before the report can be created
+                    is_valid = self.__write_zip_report_last(zip_file_path, json_name,
+                                                            json_file_path if keep_json else None)
+                    if not is_valid:
+                        os.remove(zip_file_path)
+                else:
+                    json_repr, is_valid = self.__validate()
+                    self.__check_cancelled()
+                    if is_valid:
+                        self.__write_zip(zip_file_path, json_name, json_repr,
+                                         json_file_path if keep_json else None)
+        except _ExportCancelled:
+            self.__remove_outputs(json_file_path, keep_json)
+            raise
+
+        return zip_file_path if is_valid else None
+
+    def __validate_checkpoint(self):
+        """
+        Validates the report of an incremental export. Only the testcases which have not been
+        validated by the same validator yet, or have been modified since, are validated along
+        with the structure of the report. Schemas without a `TestCase` definition are validated
+        one top-level testcase at a time.
+
+        :return: true if the validation was successful, otherwise false
+        :rtype: boolean
+        """
+        if self.__trusted:
+            return self.__check_trusted()
+        validator = self.__get_testcase_validator() or self.__validator
+        if validator.supports_testcase_validation():
+            return self.__validate_structure(validator)
+        return self.__validate_per_testcase()
+
+    def __write_checkpoint(self, zip_file_path, json_file_path, keep_json, continuing):
+        """
+        Writes the artifacts which are not contained in the upload zip yet and replaces the
+        report, which is the last entry. If this fails, the previous report is restored, or the
+        upload zip is removed, if it has just been created. The `.json` file is written to a
+        temporary file first, which replaces the previous one only when the upload zip is complete.
 
-        json_repr = self.__testsuite.create_json_repr()
+        :param zip_file_path: path to the `.zip` file
+        :type zip_file_path: str
+        :param json_file_path: the path for the output `.json` file
+        :type json_file_path: str
+        :param keep_json: True, if the `.json` file is created next to the `.zip` file
+        :type keep_json: bool
+        :param continuing: True, if the `.zip` file of the previous checkpoint is extended
+        :type continuing: bool
+        """
+        json_name = os.path.basename(json_file_path)
+        exported = self.__zip_entries if continuing else {json_name}
+        self.__zip_entries = set(exported)
+        temp_json_path = f"{json_file_path}.{os.getpid()}.tmp" if keep_json else None
+        try:
+            with UploadZipFile(zip_file_path, 'a' if continuing else 'w', ZIP_DEFLATED,
+                               compresslevel=self.__compression_policy.get_compresslevel()) as zip_obj:
+                previous_report = zip_obj.remove_last_entry(json_name) if continuing else None
+                try:
+                    self.__write_artifacts(zip_obj, self.__testsuite.get_testcases(), exported)
+                    self.__write_report(zip_obj, json_name, None, temp_json_path)
+                except BaseException:
+                    if previous_report is not None:
+                        zip_obj.remove_entries_from(previous_report[0].header_offset)
+                        zip_obj.write_compressed(*previous_report)
+                    raise
+        except BaseException:
+            self.__zip_entries = exported
+            if not continuing and os.path.exists(zip_file_path):
+                os.remove(zip_file_path)
+            if temp_json_path is not None and os.path.exists(temp_json_path):
+                os.remove(temp_json_path)
+            raise
+        if temp_json_path is not None:
+            os.replace(temp_json_path, json_file_path)
 
-        if self.__validator.validate_json(json_repr):
-            with open(json_file_path, 'w', encoding='utf-8') as file:
-                file.write(json.dumps(json_repr, indent=4))
+    def __validate(self):
+        """
+        Validates the report of the testsuite. If the testsuite validates its testcases when they
+        are added, only the structure of the report is validated. Trusted reports are not
+        validated against the schema at all.
 
-            filename = os.path.splitext(json_file_path)[0] if (json_file_path.endswith(".json")) \
-                else json_file_path
-            zip_file_path = f"{filename}.zip"
-            with ZipFile(zip_file_path, 'w') as zip_obj:
-                zip_obj.write(json_file_path, os.path.basename(json_file_path), ZIP_DEFLATED)
+        :return: the created report, or None in streaming mode, and the validation result
+        :rtype: tuple
+        """
+        json_repr = None if self.__streaming else self.__testsuite.create_json_repr()
+        if self.__trusted:
+            return json_repr, self.__check_trusted()
+        validator = self.__get_testcase_validator()
+        if validator is not None:
+            return json_repr, self.__validate_structure(validator)
+        if self.__streaming:
+            return None, self.__validate_per_testcase()
+        return json_repr, self.__validator.validate_json(json_repr)
 
-                for each_testcase in self.__testsuite.get_testcases():
-                    self.__add_artifact_to_zip(zip_obj, each_testcase)
+    def __check_trusted(self):
+        """
+        Checks the only constraint of the schema which the model classes cannot ensure while the
+        testsuite is created, namely that it contains at least one testcase.
 
-            return zip_file_path
+        :return: true if the testsuite contains a testcase, otherwise false
+        :rtype: boolean
+        """
+        if not self.__testsuite.get_testcases():
+            print("The testsuite must contain at least one TestCase or TestCaseFolder.")
+            return False
+        return True
 
+    def __get_testcase_validator(self):
+        """
+        :return: the validator with which the testsuite validates its testcases, if it uses the
+            same schema as the Generator, otherwise None
+        :rtype: JsonValidator or None
+        """
+        validator = self.__testsuite.get_validator()
+        if validator is not None \
+                and validator.get_json_schema_file_path() == os.path.abspath(self.__json_schema_path):
+            return validator
         return None
 
-    def __add_artifact_to_zip(self, zip_obj, node):
+    def __validate_structure(self, validator):
+        """
+        Validates the testcases which have not been validated yet, e.g. because they were added
+        to a TestCaseFolder without validator, and the structure of the report, in which each
+        testcase is replaced by a placeholder.
+
+        :param validator: validator whose schema contains a `TestCase` definition
+        :type validator: JsonValidator
+        :return: true if the validation was successful, otherwise false
+        :rtype: boolean
+        """
+        is_valid = True
+
+        def create_structure(node):
+            nonlocal is_valid
+            self.__check_cancelled()
+            if isinstance(node, TestCase):
+                is_valid = validator.validate_testcase(node) and is_valid
+                return VALIDATED_TESTCASE_PLACEHOLDER
+            return {**node.create_lazy_json_repr(), "testcases": [create_structure(child)
+                                                                  for child in node.get_testcases()]}
+
+        structure = create_structure(self.__testsuite)
+        return validator.validate_structure(structure) and is_valid
+
+    def __write_zip(self, zip_target, json_name, json_repr, json_file_path):
+        """
+        Writes the upload zip with the report and all artifacts of the testsuite.
+
+        :param zip_target: path to the `.zip` file or writable binary stream
+        :type zip_target: str or BinaryIO
+        :param json_name: name of the report inside the `.zip` file
+        :type json_name: str
+        :param json_repr: the already created report, or None to serialize the testsuite
+            incrementally
+        :type json_repr: dict or None
+        :param json_file_path: path for an additional `.json` file, or None
+        :type json_file_path: str or None
+        """
+        self.__zip_entries = {json_name}
+        self.__written_artifacts = 0
+        self.__skipped_duplicates = 0
+        with UploadZipFile(zip_target, 'w', ZIP_DEFLATED,
+                           compresslevel=self.__compression_policy.get_compresslevel()) as zip_obj:
+            self.__write_report(zip_obj, json_name, json_repr, json_file_path)
+            self.__write_artifacts(zip_obj, self.__testsuite.get_testcases())
+
+    def __write_zip_report_last(self, zip_file_path, json_name, json_file_path):
+        """
+        Writes the upload zip like :meth:`__write_zip`, but adds the artifacts first, so that
+        artifacts with deferred hashing are hashed while they are compressed and thus read only
+        once. Afterward, the report is validated and written as the last entry.
+
+        :param zip_file_path: path to the `.zip` file
+        :type zip_file_path: str
+        :param json_name: name of the report inside the `.zip` file
+        :type json_name: str
+        :param json_file_path: path for an additional `.json` file, or None
+        :type json_file_path: str or None
+        :return: true if the report was valid and has been written, otherwise false
+        :rtype: boolean
+        """
+        self.__zip_entries = {json_name}
+        self.__written_artifacts = 0
+        self.__skipped_duplicates = 0
+        with UploadZipFile(zip_file_path, 'w', ZIP_DEFLATED,
+                           compresslevel=self.__compression_policy.get_compresslevel()) as zip_obj:
+            self.__write_artifacts(zip_obj, self.__testsuite.get_testcases())
+            json_repr, is_valid = self.__validate()
+            self.__check_cancelled()
+            if is_valid:
+                self.__write_report(zip_obj, json_name, json_repr, json_file_path)
+        return is_valid
+
+    def __uses_own_hash(self, artifact):
+        """
+        :return: True, if the artifact is hashed with its own algorithm in the exports of this
+            Generator
+        :rtype: bool
+        """
+        return self.__hash_algorithm in (None, artifact.get_hash_algorithm())
+
+    def __get_zip_path(self, artifact):
+        """
+        :return: path of the artifact in the upload zip of the current export, or None if the
+            artifact has not been hashed yet
+        :rtype: str or None
         """
-        Adds the already captured artifact to the upload zip.
+        if self.__uses_own_hash(artifact):
+            return None if artifact.is_hash_pending() else artifact.get_path_in_upload_zip()
+        return self.__zip_paths.get(artifact)
+
+    def __set_content_hash(self, artifact, file_hash):
+        """
+        Stores the hash of an artifact, which has been computed while it was compressed.
+
+        :param file_hash: hexadecimal digest, computed with the algorithm of :meth:`__create_hasher`
+        :type file_hash: str
+        """
+        if self.__uses_own_hash(artifact):
+            artifact.set_content_hash(file_hash)
+        else:
+            self.__zip_paths[artifact] = f"{file_hash}/{artifact.get_name()}"
+
+    def __create_hasher(self, artifact):
+        """
+        :return: hasher for the algorithm with which the artifact is hashed in the current export
+        :rtype: hashlib._Hash
+        """
+        return create_hasher(artifact.get_hash_algorithm() if self.__uses_own_hash(artifact)
+                             else self.__hash_algorithm)
+
+    def __resolve_hashes(self, testcases):
+        """
+        Hashes the artifacts of the given testcases, whose paths in the upload zip are not known
+        yet, in a thread pool.
+
+        :param testcases: TestCases or TestCaseFolders
+        :type testcases: list
+        :raises OSError: an artifact file cannot be read anymore
+        """
+        pending = list(dict.fromkeys(artifact for testcase in testcases
+                                     for artifact in self.__collect_artifacts(testcase)
+                                     if self.__get_zip_path(artifact) is None))
+        if pending:
+            with ThreadPoolExecutor() as executor:
+                for _ in executor.map(self.__resolve_hash, pending):
+                    pass
+
+    def __resolve_hash(self, artifact):
+        """
+        Hashes an artifact, whose path in the upload zip is not known yet.
+
+        :raises OSError: the artifact file cannot be read anymore
+        """
+        if self.__uses_own_hash(artifact):
+            artifact.resolve_hash()
+        else:
+            self.__zip_paths[artifact] = artifact.create_path_in_upload_zip(self.__hash_algorithm)
+
+    def __has_pending_hashes(self):
+        """
+        :return: True, if any artifact of the testsuite has not been hashed yet
+        :rtype: bool
+        """
+        return any(self.__get_zip_path(artifact) is None for testcase in self.__testsuite.get_testcases()
+                   for artifact in self.__collect_artifacts(testcase))
+
+    def get_written_artifact_count(self):
+        """
+        :return: number of artifacts added to the most recently exported `.zip` file
+        :rtype: int
+        """
+        return self.__written_artifacts
+
+    def get_skipped_duplicate_count(self):
+        """
+        :return: number of artifacts which were not added to the most recently exported `.zip`
+            file, because an artifact with the same content and name had already been added
+        :rtype: int
+        """
+        return self.__skipped_duplicates
+
+    @staticmethod
+    def __get_zip_file_path(json_file_path):
+        """
+        :return: path to the `.zip` file belonging to the `.json` file
+        :rtype: str
+        """
+        filename = os.path.splitext(json_file_path)[0] if (json_file_path.endswith(".json")) \
+            else json_file_path
+        return f"{filename}.zip"
+
+    def __remove_outputs(self, json_file_path, keep_json):
+        """
+        Removes the `.zip` file and, if it is kept, the `.json` file of a cancelled export.
+
+        :param json_file_path: the path for the output `.json` file
+        :type json_file_path: str
+        :param keep_json: True, if the `.json` file is created next to the `.zip` file
+        :type keep_json: bool
+        """
+        zip_file_path = self.__get_zip_file_path(json_file_path)
+        for path in (zip_file_path, json_file_path) if keep_json else (zip_file_path,):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def __check_cancelled(self):
+        """
+        :raises _ExportCancelled: the running asynchronous export was cancelled
+        """
+        if self.__cancel_event is not None and self.__cancel_event.is_set():
+            raise _ExportCancelled()
+
+    def __write_report(self, zip_obj, json_name, json_repr, json_file_path):
+        """
+        Serializes the report into the upload zip and, optionally, into a `.json` file at the
+        same time.
 
         :param zip_obj: Open zipfile object
-        :type zip_obj: ZipFile
+        :type zip_obj: UploadZipFile
+        :param json_name: name of the report inside the `.zip` file
+        :type json_name: str
+        :param json_repr: the already created report, or None to serialize the testsuite
+            incrementally
+        :type json_repr: dict or None
+        :param json_file_path: path for an additional `.json` file, or None
+        :type json_file_path: str or None
+        """
+        with ExitStack() as stack:
+            entry = stack.enter_context(zip_obj.open(json_name, 'w'))
+            files = [stack.enter_context(io.TextIOWrapper(entry, encoding='utf-8'))]
+            if json_file_path is not None:
+                files.append(stack.enter_context(open(json_file_path, 'w', encoding='utf-8')))
+
+            if json_repr is None:
+                self.__json_encoding.create_stream_writer().write(self.__testsuite, *files)
+            else:
+                content = self.__json_encoding.dumps(json_repr)
+                for file in files:
+                    file.write(content)
+
+    def __validate_per_testcase(self):
+        """
+        Validates the report one top-level testcase at a time. Each testcase is embedded in an
+        otherwise identical report, so that only a single testcase has to be held in memory.
+
+        :return: true if the validation was successful, otherwise false
+        :rtype: boolean
+        """
+        suite_repr = self.__testsuite.create_lazy_json_repr()
+        testcases = suite_repr["testcases"]
+        if not testcases:
+            return self.__validator.validate_json({**suite_repr, "testcases": []})
+
+        is_valid = True
+        for testcase in testcases:
+            self.__check_cancelled()
+            chunk = {**suite_repr, "testcases": [testcase.create_json_repr()]}
+            is_valid = self.__validator.validate_json(chunk) and is_valid
+        return is_valid
+
+    def __write_artifacts(self, zip_obj, testcases, exported=frozenset()):
+        """
+        Adds all artifacts of the given testcases to the upload zip. With more than one worker,
+        the artifacts are compressed concurrently, while they are still appended to the upload zip
+        in the same order as in the sequential case. The artifacts are always written sequentially,
+        if the running Python version does not support entries which are compressed elsewhere.
+
+        :param zip_obj: Open zipfile object
+        :type zip_obj: UploadZipFile
+        :param testcases: TestCases or TestCaseFolders
+        :type testcases: list
+        :param exported: paths in the upload zip of the artifacts which a previous checkpoint
+            has already added to it
+        :type exported: set or frozenset
+        """
+        if self.__workers == 1 or not supports_precompressed_entries():
+            for artifact in self.__new_artifacts(testcases, exported):
+                self.__write_artifact(zip_obj, artifact)
+            return
+
+        with ThreadPoolExecutor(max_workers=self.__workers) as executor:
+            pending: deque = deque()
+            for artifact in self.__new_artifacts(testcases, exported):
+                pending.append((artifact, executor.submit(self.__compress_artifact, artifact)))
+                if len(pending) > 2 * self.__workers:
+                    artifact, future = pending.popleft()
+                    self.__write_compressed_artifact(zip_obj, artifact, future.result())
+            while pending:
+                artifact, future = pending.popleft()
+                self.__write_compressed_artifact(zip_obj, artifact, future.result())
+
+    def __write_artifact(self, zip_obj, artifact):
+        """
+        Adds an artifact to the upload zip in the calling thread. An artifact whose hash is still
+        pending is compressed into memory while it is hashed, so that its entry is written once
+        under its final name. Artifacts which are too large for this are hashed first, as are all
+        artifacts if the running Python version does not support entries which are compressed
+        elsewhere.
+        """
+        source, (compress_type, compresslevel) = self.__get_source(artifact)
+        path_in_zip = self.__get_zip_path(artifact)
+        if path_in_zip is None:
+            if supports_precompressed_entries() and \
+                    (not isinstance(source, str) or os.path.getsize(source) <= MAX_IN_MEMORY_ARTIFACT_SIZE):
+                self.__write_compressed_artifact(zip_obj, artifact, self.__compress_artifact(artifact))
+                return
+            self.__resolve_hash(artifact)
+            if not self.__add_zip_entry(artifact):
+                return
+            path_in_zip = self.__get_zip_path(artifact)
+
+        if isinstance(source, str):
+            zip_obj.write(source, path_in_zip, compress_type, compresslevel)
+        else:
+            zip_obj.writestr(path_in_zip, source, compress_type, compresslevel)
+
+    def __compress_artifact(self, artifact):
+        """
+        Compresses the artifact into memory, if it is small enough or already kept in memory. An
+        artifact whose hash is still pending is hashed in the same pass.
+
+        :return: the entry information and the compressed data, and the digest of a pending hash
+            or None, or None for large artifacts
+        :rtype: tuple or None
+        """
+        source, (compress_type, compresslevel) = self.__get_source(artifact)
+        if isinstance(source, str) and os.path.getsize(source) > MAX_IN_MEMORY_ARTIFACT_SIZE:
+            return None
+        path_in_zip = self.__get_zip_path(artifact)
+        if path_in_zip is not None:
+            return compress_file(source, path_in_zip, compress_type, compresslevel), None
+
+        # the entry is named as soon as the hash is known
+        hasher = self.__create_hasher(artifact)
+        compressed = compress_file(source, artifact.get_name(), compress_type, compresslevel, hasher)
+        return compressed, hasher.hexdigest()
+
+    def __get_source(self, artifact):
+        """
+        :return: path to the file of the artifact or its content if it is kept in memory, and its
+            compression type and level
+        :rtype: tuple
+        """
+        data = artifact.get_data()
+        if data is None:
+            return artifact.get_file_path(), self.__compression_policy.get_compression(artifact.get_file_path())
+        return data, self.__compression_policy.get_compression(artifact.get_name(), data)
+
+    def __write_compressed_artifact(self, zip_obj, artifact, result):
+        """
+        Adds an artifact which has been compressed by :meth:`__compress_artifact` to the upload
+        zip, or writes it in the calling thread, if it was too large.
+        """
+        if result is None:
+            self.__write_artifact(zip_obj, artifact)
+            return
+
+        (zinfo, data), file_hash = result
+        if file_hash is not None:
+            self.__set_content_hash(artifact, file_hash)
+            if not self.__add_zip_entry(artifact):
+                return
+            zinfo.filename = zinfo.orig_filename = self.__get_zip_path(artifact)
+        zip_obj.write_compressed(zinfo, data)
+
+    def __new_artifacts(self, testcases, exported=frozenset()):
+        """
+        Yields each artifact of the given testcases which has not been added to the upload zip
+        yet.
+
+        :param testcases: TestCases or TestCaseFolders
+        :type testcases: list
+        :param exported: paths in the upload zip of the artifacts which a previous checkpoint
+            has already added to it, and which are neither written nor counted as duplicates
+        :type exported: set or frozenset
+        :return: generator of artifacts
+        :rtype: Iterator[Artifact]
+        """
+        pending_artifacts = set()
+        for each_testcase in testcases:
+            for artifact in self.__collect_artifacts(each_testcase):
+                self.__check_cancelled()
+                if self.__get_zip_path(artifact) is None:
+                    # duplicates are only recognized after hashing, see __add_zip_entry
+                    if artifact in pending_artifacts:
+                        self.__skipped_duplicates += 1
+                        continue
+                    pending_artifacts.add(artifact)
+                    yield artifact
+                elif self.__get_zip_path(artifact) in exported:
+                    continue
+                elif self.__add_zip_entry(artifact):
+                    yield artifact
+
+    def __add_zip_entry(self, artifact):
+        """
+        Registers the artifact as an entry of the upload zip, unless an artifact with the same
+        path in the upload zip has already been added.
+
+        :return: True, if the artifact has to be added to the upload zip, otherwise False
+        :rtype: bool
+        """
+        path_in_zip = self.__get_zip_path(artifact)
+        if path_in_zip in self.__zip_entries:
+            self.__skipped_duplicates += 1
+            return False
+        self.__zip_entries.add(path_in_zip)
+        self.__written_artifacts += 1
+        return True
+
+    def __collect_artifacts(self, node):
+        """
+        Collects the already captured artifacts of a testcase or of all testcases in a folder.
+
         :param node: TestCase object or TestCaseFolder object
         :type node: TestCase or TestCaseFolder
+        :raises TypeError: node is neither a TestCase nor a TestCaseFolder
+        :return: generator of artifacts
+        :rtype: Iterator[Artifact]
         """
 
         if not isinstance(node, (TestCase, TestCaseFolder)):
             raise TypeError("Argument 'node' must be of type 'TestCase' or 'TestCaseFolder'.")
 
         if isinstance(node, TestCase):
-            for artifact in node.get_artifacts():
-                if artifact.get_path_in_upload_zip() not in zip_obj.namelist():
-                    zip_obj.write(artifact.get_file_path(), artifact.get_path_in_upload_zip(), ZIP_DEFLATED)
+            yield from node.get_artifacts()
         else:
             # TestCaseFolder
             for testcase in node.get_testcases():
-                self.__add_artifact_to_zip(zip_obj, testcase)
+                yield from self.__collect_artifacts(testcase)
@@ -9,9 +9,15 @@ This module provides essential imports for the testguide_report_generator packag
 from .ReportGenerator import Generator
 from .model.TestSuite import TestSuite
 from .model.TestCase import TestCase, TestStep, TestStepFolder, Verdict, Parameter, \
-    Direction, Review, TestStepArtifactType, Artifact, TestStepArtifact, Attribute
+    Direction, Review, Attribute
+from .model.Artifact import TestStepArtifactType, Artifact, TestStepArtifact
 from .model.TestCaseFolder import TestCaseFolder
-from .util.JsonValidator import JsonValidator
+from .model.ArtifactRegistry import ArtifactRegistry
+from .util.JsonValidator import JsonValidator, ValidationIssue, ValidationResult
+from .util.CompressionPolicy import CompressionPolicy
+from .util.JsonEncoding import JsonEncoding
+from .util.HashCache import HashCache
+from .util.ArtifactData import ArtifactData
 
 __all__ = [
     "Generator",
@@ -28,5 +34,12 @@ __all__ = [
     "TestStepArtifact",
     "Attribute",
     "TestCaseFolder",
-    "JsonValidator"
+    "ArtifactRegistry",
+    "JsonValidator",
+    "ValidationIssue",
+    "ValidationResult",
+    "CompressionPolicy",
+    "JsonEncoding",
+    "HashCache",
+    "ArtifactData"
 ]
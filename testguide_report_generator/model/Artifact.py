@@ -0,0 +1,408 @@
+# Copyright (c) 2023-2024 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+# -*- coding: utf-8 -*-
+
+"""
+This module contains the artifact classes of a testcase and the creation of artifacts from the
+files of a directory, including:
+    Artifact
+    TestStepArtifact
+    TestStepArtifactType
+"""
+
+import errno
+import fnmatch
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum
+from typing import Optional, Union
+from testguide_report_generator.util.Json2AtxRepr import Json2AtxRepr
+from testguide_report_generator.util.File import create_hasher, get_hash_from_file, get_md5_hash_from_file
+from testguide_report_generator.util.ArtifactData import ArtifactData
+from testguide_report_generator.util.HashCache import HashCache
+
+_report_paths: ContextVar = ContextVar("report_paths", default=None)
+
+
+@contextmanager
+def use_report_paths(get_path):
+    """
+    Overrides the paths with which the artifacts are referenced in the `.json` report within the
+    current context, e.g. while a Generator which hashes the artifacts with its own algorithm
+    creates the report. The artifacts themselves are not changed.
+
+    :param get_path: returns the path of an artifact in the upload zip, or None to use
+        :meth:`Artifact.get_path_in_upload_zip`
+    :type get_path: Callable[[Artifact], str or None]
+    """
+    token = _report_paths.set(get_path)
+    try:
+        yield
+    finally:
+        _report_paths.reset(token)
+
+
+class TestStepArtifactType(Enum):
+    """
+    Possible types of artifacts attached to test steps
+    """
+
+    __test__ = False  # pytest ignore
+
+    IMAGE = 1
+
+
+class Artifact(Json2AtxRepr):
+    """
+    TestCase artifact.
+    """
+
+    __hash_cache: Optional[HashCache] = None
+    __default_hash_algorithm = "md5"
+
+    def __init__(self, file_path: Union[str, ArtifactData, os.DirEntry], lazy: bool = False):
+        """
+        Constructor
+
+        :param file_path: file path to artifact, the content of an artifact which does not exist
+            as a file, or an entry of :func:`os.scandir`, whose cached file type and status are
+            reused
+        :type file_path: str or ArtifactData or os.DirEntry
+        :param lazy: set to True, to defer hashing the file until its path in the upload zip is
+            needed for the first time. The exports hash the deferred artifacts of their testcases
+            concurrently.
+        :type lazy: bool
+        :raises OSError: file_path is not a valid path to a file
+        """
+        self.__dir_entry: os.DirEntry | None = None
+        if isinstance(file_path, ArtifactData):
+            self.__data: ArtifactData | None = file_path
+            self.__file_path = file_path.get_file_path()
+            self.__name = file_path.get_name()
+        elif isinstance(file_path, os.DirEntry):
+            if not file_path.is_file():
+                raise OSError(errno.ENOENT, "File does not exist or path does not point to a file", file_path.path)
+            self.__data = None
+            self.__dir_entry = file_path
+            self.__file_path = file_path.path
+            self.__name = file_path.name
+        else:
+            if not os.path.isfile(file_path):
+                raise OSError(errno.ENOENT, "File does not exist or path does not point to a file", file_path)
+            self.__data = None
+            self.__file_path = file_path
+            self.__name = os.path.basename(file_path)
+
+        self.__hash_algorithm = Artifact.__default_hash_algorithm
+        self.__zip_file_path: str | None = None
+        self.__lock = threading.Lock()
+        if not lazy:
+            self.__zip_file_path = self.__create_zip_file_path(self.__hash_algorithm)
+
+    @staticmethod
+    def set_hash_cache(hash_cache: Optional[HashCache]):
+        """
+        Sets a cache which is consulted whenever the file of an artifact is hashed, so that
+        unchanged files are not hashed again. The file is hashed when the artifact is created or,
+        for a lazy artifact, when its hash is resolved.
+
+        :param hash_cache: the cache, or None to hash every file
+        :type hash_cache: HashCache or None
+        """
+        Artifact.__hash_cache = hash_cache
+
+    @staticmethod
+    def set_default_hash_algorithm(algorithm: str):
+        """
+        Sets the algorithm which is used to hash all artifacts created afterwards. The hash is the
+        name of the directory of the artifact in the upload zip. MD5 is the default.
+
+        :param algorithm: hash algorithm, see
+            :func:`create_hasher<testguide_report_generator.util.File.create_hasher>`
+        :type algorithm: str
+        :raises ValueError: the algorithm is not available
+        """
+        create_hasher(algorithm)
+        Artifact.__default_hash_algorithm = algorithm
+
+    def __create_zip_file_path(self, algorithm):
+        """
+        Determines the path to be created in the upload zip.
+
+        :param algorithm: hash algorithm
+        :type algorithm: str
+        :return: path in upload zip
+        :rtype: str
+        """
+        data = self.get_data()
+        if data is not None:
+            hasher = create_hasher(algorithm)
+            hasher.update(data)
+            file_hash = hasher.hexdigest()
+        elif Artifact.__hash_cache is not None and self.__data is None:
+            file_hash = Artifact.__hash_cache.get_hash(self.__dir_entry or self.__file_path, algorithm)
+        elif algorithm == "md5":
+            file_hash = get_md5_hash_from_file(self.__file_path)
+        else:
+            file_hash = get_hash_from_file(self.__file_path, algorithm)
+        return f"{file_hash}/{self.__name}"
+
+    def get_file_path(self):
+        """
+        :return: path to file, or None if the artifact is kept in memory
+        :rtype: str or None
+        """
+        return self.__file_path
+
+    def get_name(self):
+        """
+        :return: file name of the artifact in the upload zip
+        :rtype: str
+        """
+        return self.__name
+
+    def get_data(self):
+        """
+        :return: the content of an artifact created from :class:`ArtifactData`, or None if the
+            artifact is read from a file
+        :rtype: memoryview or None
+        """
+        return None if self.__data is None else self.__data.get_data()
+
+    def get_size(self):
+        """
+        :return: size of the artifact in bytes
+        :rtype: int
+        """
+        if self.__data is not None:
+            return self.__data.get_size()
+        return os.path.getsize(self.__file_path)
+
+    def is_hash_pending(self):
+        """
+        :return: True, if the artifact was created with lazy=True and has not been hashed yet
+        :rtype: bool
+        """
+        return self.__zip_file_path is None
+
+    def get_hash_algorithm(self):
+        """
+        :return: algorithm with which the artifact is hashed
+        :rtype: str
+        """
+        return self.__hash_algorithm
+
+    def set_content_hash(self, file_hash: str):
+        """
+        Sets the hash of a lazily created artifact, which has been computed elsewhere, e.g. while
+        the artifact was compressed into the upload zip.
+
+        :param file_hash: hexadecimal digest of the file content, computed with the algorithm of
+            :meth:`get_hash_algorithm`
+        :type file_hash: str
+        """
+        with self.__lock:
+            self.__zip_file_path = f"{file_hash}/{self.__name}"
+
+    def resolve_hash(self):
+        """
+        Hashes the artifact right away, if its hash is still pending. Concurrent calls hash the
+        file only once.
+
+        :raises OSError: the artifact file cannot be read
+        """
+        if self.__zip_file_path is None:
+            with self.__lock:
+                if self.__zip_file_path is None:
+                    self.__zip_file_path = self.__create_zip_file_path(self.__hash_algorithm)
+
+    def create_path_in_upload_zip(self, algorithm: str):
+        """
+        Hashes the artifact with another algorithm than its own one. The artifact is not
+        changed, the result is only valid for the caller.
+
+        :param algorithm: hash algorithm, see
+            :func:`create_hasher<testguide_report_generator.util.File.create_hasher>`
+        :type algorithm: str
+        :raises ValueError: the algorithm is not available
+        :raises OSError: the artifact file cannot be read
+        :return: hash-encoded path in the `.zip` file
+        :rtype: str
+        """
+        create_hasher(algorithm)
+        return self.__create_zip_file_path(algorithm)
+
+    def get_path_in_upload_zip(self):
+        """
+        Hashes the artifact first, if its hash is still pending. Other artifacts are not hashed.
+
+        :return: hash-encoded path in the `.zip` file
+        :rtype: str
+        """
+        self.resolve_hash()
+        return self.__zip_file_path
+
+    def get_path_in_report(self):
+        """
+        :return: path with which the artifact is referenced in the `.json` report, which is the
+            path in the `.zip` file unless it is overridden by :func:`use_report_paths`
+        :rtype: str
+        """
+        get_path = _report_paths.get()
+        path = None if get_path is None else get_path(self)
+        return self.get_path_in_upload_zip() if path is None else path
+
+    def create_json_repr(self):
+        """
+        :see: :class:`Json2AtxRepr<testguide_report_generator.Json2AtxRepr>`
+        """
+        result = self.get_path_in_report()
+        return result
+
+
+class TestStepArtifact(Artifact):
+    """
+    Artifact attached to an ATX-TestStep
+    """
+
+    __test__ = False  # pytest ignore
+
+    def __init__(self, file_path: Union[str, ArtifactData], artifact_type: TestStepArtifactType,
+                 lazy: bool = False):
+        """
+        Constructor
+
+        :param file_path: file path to the artifact, or the content of an artifact which does not
+            exist as a file
+        :type file_path: str or ArtifactData
+        :param artifact_type: Type of the artifact (currently only images are supported)
+        :type artifact_type: TestStepArtifactType
+        :param lazy: set to True, to defer hashing the file, see :class:`Artifact`
+        :type lazy: bool
+        :raises TypeError: artifact_type is not of type TestStepArtifactType
+        :raises OSError: file_path is not a valid path to a file
+        """
+        super().__init__(file_path, lazy)
+
+        if not isinstance(artifact_type, TestStepArtifactType):
+            raise TypeError("Argument 'artifact_type' must be of type 'TestStepArtifactType'.")
+
+        self.__artifact_type = artifact_type
+
+    def get_artifact_type(self):
+        """
+        returns the artifacts type
+
+        :rtype: TestStepArtifactType
+        """
+        return self.__artifact_type
+
+    def create_json_repr(self):
+        """
+        :see: :class:`Json2AtxRepr<testguide_report_generator.Json2AtxRepr>`
+        """
+        return {"path": self.get_path_in_report(), "artifactType": self.__artifact_type.name}
+
+
+def _resolve_hashes(artifacts, failed):
+    """
+    Hashes the artifacts concurrently.
+
+    :param failed: list to which the file paths and errors of artifacts which could not be hashed
+        are appended
+    :type failed: list
+    :return: the successfully hashed artifacts
+    :rtype: list
+    """
+    def resolve_hash(artifact):
+        try:
+            artifact.resolve_hash()
+            return None
+        except OSError as error:
+            return error
+
+    with ThreadPoolExecutor() as executor:
+        errors = list(executor.map(resolve_hash, artifacts))
+    failed.extend((artifact.get_file_path(), error) for artifact, error in zip(artifacts, errors) if error)
+    return [artifact for artifact, error in zip(artifacts, errors) if error is None]
+
+
+def _create_artifacts(entries, create_artifact, registry, failed):
+    """
+    Creates the artifacts of the directory entries which are files, or takes them from the
+    registry if they have already been interned.
+
+    :param failed: list to which the file paths and errors of invalid files are appended
+    :type failed: list
+    :return: the artifacts, and the directory entries of the artifacts which are not interned yet
+    :rtype: tuple
+    """
+    artifacts = []
+    new_entries = {}
+    for entry in entries:
+        try:
+            if entry.is_dir():
+                continue
+            artifact = create_artifact(entry)
+            if registry is not None:
+                artifact_type = artifact.get_artifact_type() if isinstance(artifact, TestStepArtifact) else None
+                shared = registry.find_artifact(entry, artifact_type)
+                if shared is None:
+                    new_entries[artifact] = entry
+                else:
+                    artifact = shared
+            artifacts.append(artifact)
+        except OSError as error:
+            failed.append((entry.path, error))
+    return artifacts, new_entries
+
+
+def create_artifacts_from_dir(directory, pattern, create_artifact, ignore_on_error, lazy, owner, registry=None):
+    # pylint: disable=R0913
+    """
+    Creates the artifacts of all files in the directory whose names match the pattern, in a
+    single pass over the directory. Subdirectories are not included. Unless lazy is set, the
+    files are hashed concurrently. The new artifacts are only interned in the registry after all
+    files have been added, so that nothing is interned if an error is raised.
+
+    :param create_artifact: creates an artifact from a directory entry with deferred hashing
+    :type create_artifact: Callable[[os.DirEntry], Artifact]
+    :param owner: description of the testcase or teststep for warnings
+    :type owner: str
+    :param registry: registry whose artifacts are reused and in which the new artifacts are
+        interned, or None
+    :type registry: ArtifactRegistry or None
+    :raises OSError: the directory or a file is invalid, only when ignore_on_error = False
+    :return: the created artifacts sorted by file name and the paths of the skipped files
+    :rtype: tuple
+    """
+    try:
+        with os.scandir(directory) as entries:
+            matching = sorted((entry for entry in entries if fnmatch.fnmatch(entry.name, pattern)),
+                              key=lambda entry: entry.name)
+    except OSError:
+        if not ignore_on_error:
+            raise
+        logging.warning(f"Artifact directory '{directory}' for {owner} is invalid, will be ignored!")
+        return [], [directory]
+
+    failed: list[tuple[str, OSError]] = []
+    artifacts, new_entries = _create_artifacts(matching, create_artifact, registry, failed)
+
+    if not lazy and artifacts:
+        artifacts = _resolve_hashes(artifacts, failed)
+
+    if failed and not ignore_on_error:
+        raise failed[0][1]
+    if new_entries:
+        artifacts = [registry.intern_artifact(new_entries[artifact], artifact) if artifact in new_entries
+                     else artifact for artifact in artifacts]
+    for file_path, _ in failed:
+        logging.warning(f"Artifact path '{file_path}' for {owner} is invalid, will be ignored!")
+    return artifacts, [file_path for file_path, _ in failed]
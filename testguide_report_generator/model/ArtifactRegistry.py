@@ -0,0 +1,161 @@
+# Copyright (c) 2023-2024 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+# -*- coding: utf-8 -*-
+
+"""
+This module contains the ArtifactRegistry class.
+"""
+
+import errno
+import os
+import stat
+import threading
+from typing import Optional, Union
+
+from testguide_report_generator.model.Artifact import Artifact, TestStepArtifact, TestStepArtifactType
+from testguide_report_generator.util.File import get_stat_result
+
+
+class ArtifactRegistry:
+    """
+    Interns the artifacts of a testsuite. Each file is checked and hashed only once, and all
+    references to it share a single :class:`Artifact<testguide_report_generator.model.Artifact.Artifact>`
+    object, even if it is referenced by different paths, e.g. via symbolic links. Files must not
+    be changed after they have been added.
+    """
+
+    def __init__(self):
+        self.__by_path: dict = {}
+        self.__by_identity: dict = {}
+        self.__lock = threading.Lock()
+
+    def get_artifact(self, file_path: Union[str, os.DirEntry], lazy: bool = False):
+        """
+        Returns the artifact of the given file, which is created on the first call for this file.
+
+        :param file_path: file path to artifact, or an entry of :func:`os.scandir`, whose cached
+            file type and status are reused
+        :type file_path: str or os.DirEntry
+        :param lazy: set to True, to defer hashing the file, see
+            :class:`Artifact<testguide_report_generator.model.Artifact.Artifact>`
+        :type lazy: bool
+        :raises OSError: file_path is not a valid path to a file
+        :return: the shared artifact
+        :rtype: Artifact
+        """
+        return self.__intern(file_path, None, lazy)
+
+    def get_teststep_artifact(self, file_path: Union[str, os.DirEntry], artifact_type: TestStepArtifactType,
+                              lazy: bool = False):
+        """
+        Returns the teststep artifact of the given file and type, which is created on the first
+        call for this file and type.
+
+        :param file_path: file path to artifact, or an entry of :func:`os.scandir`, whose cached
+            file type and status are reused
+        :type file_path: str or os.DirEntry
+        :param artifact_type: type of the artifact
+        :type artifact_type: TestStepArtifactType
+        :param lazy: set to True, to defer hashing the file, see
+            :class:`Artifact<testguide_report_generator.model.Artifact.Artifact>`
+        :type lazy: bool
+        :raises TypeError: artifact_type is not of type TestStepArtifactType
+        :raises OSError: file_path is not a valid path to a file
+        :return: the shared artifact
+        :rtype: TestStepArtifact
+        """
+        if not isinstance(artifact_type, TestStepArtifactType):
+            raise TypeError("Argument 'artifact_type' must be of type 'TestStepArtifactType'.")
+        return self.__intern(file_path, artifact_type, lazy)
+
+    def find_artifact(self, file_path: Union[str, os.DirEntry], artifact_type: Optional[TestStepArtifactType] = None):
+        """
+        Returns the artifact of the given file and type, if it has already been interned.
+
+        :param file_path: file path to artifact, or an entry of :func:`os.scandir`
+        :type file_path: str or os.DirEntry
+        :param artifact_type: type of the teststep artifact, None for a plain Artifact
+        :type artifact_type: TestStepArtifactType or None
+        :raises OSError: file_path is not a valid path to a file
+        :return: the shared artifact, or None
+        :rtype: Artifact or None
+        """
+        with self.__lock:
+            artifact = self.__by_path.get((self.__get_path(file_path), artifact_type))
+        if artifact is not None:
+            return artifact
+
+        identity = self.__get_identity(file_path, artifact_type)
+        with self.__lock:
+            return self.__by_identity.get(identity)
+
+    def intern_artifact(self, file_path: Union[str, os.DirEntry], artifact: Artifact):
+        """
+        Interns an artifact which has been created for the given file, unless an artifact of the
+        same file and type has been interned before.
+
+        :param file_path: file path to artifact, or an entry of :func:`os.scandir`
+        :type file_path: str or os.DirEntry
+        :param artifact: the artifact of the file
+        :type artifact: Artifact
+        :raises OSError: file_path is not a valid path to a file
+        :return: the shared artifact
+        :rtype: Artifact
+        """
+        artifact_type = artifact.get_artifact_type() if isinstance(artifact, TestStepArtifact) else None
+        identity = self.__get_identity(file_path, artifact_type)
+        with self.__lock:
+            # another thread may have created the same artifact in the meantime
+            artifact = self.__by_identity.setdefault(identity, artifact)
+            self.__by_path[(self.__get_path(file_path), artifact_type)] = artifact
+        return artifact
+
+    def __len__(self):
+        return len(self.__by_identity)
+
+    def __intern(self, file_path, artifact_type, lazy):
+        """
+        :param artifact_type: type of the teststep artifact, None for a plain Artifact
+        :type artifact_type: TestStepArtifactType or None
+        :return: the shared artifact for the file path and artifact type
+        :rtype: Artifact
+        """
+        artifact = self.find_artifact(file_path, artifact_type)
+        if artifact is not None:
+            return artifact
+        if artifact_type is None:
+            artifact = Artifact(file_path, lazy)
+        else:
+            artifact = TestStepArtifact(file_path, artifact_type, lazy)
+        return self.intern_artifact(file_path, artifact)
+
+    @staticmethod
+    def __get_path(file_path):
+        """
+        :return: the path of a file path or directory entry
+        :rtype: str
+        """
+        return file_path.path if isinstance(file_path, os.DirEntry) else file_path
+
+    @staticmethod
+    def __get_identity(file_path, artifact_type):
+        """
+        :raises OSError: file_path is not a valid path to a file
+        :return: device and inode of the file, or its resolved path if the file system does not
+            provide inodes, its name and the artifact type
+        :rtype: tuple
+        """
+        path = ArtifactRegistry.__get_path(file_path)
+        try:
+            stat_result = get_stat_result(file_path)
+        except OSError as error:
+            raise OSError(errno.ENOENT, "File does not exist or path does not point to a file", path) from error
+        if not stat.S_ISREG(stat_result.st_mode):
+            raise OSError(errno.ENOENT, "File does not exist or path does not point to a file", path)
+
+        file_identity = (stat_result.st_dev, stat_result.st_ino)
+        if stat_result.st_ino == 0:
+            file_identity = (stat_result.st_dev, os.path.realpath(path))
+        return *file_identity, os.path.basename(path), artifact_type
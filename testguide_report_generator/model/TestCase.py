@@ -7,10 +7,7 @@
 """
 This module contains the TestCase class and all other classes for the creation of a testcase,
 including:
-    Artifact
     TestStep
-    TestStepArtifact
-    TestStepArtifactType
     TestStepFolder
     Parameter
     Direction
@@ -18,16 +15,31 @@ including:
     Attribute
     Review
     Verdict
+
+The artifact classes are defined in :mod:`testguide_report_generator.model.Artifact` and can be
+imported from here as well.
 """
-import errno
+
 import logging
-import os
+import math
 import re
 from enum import Enum
 from typing import List, Union
-from testguide_report_generator.util.Json2AtxRepr import Json2AtxRepr
-from testguide_report_generator.util.File import get_md5_hash_from_file
-from testguide_report_generator.util.ValidityChecks import check_string_length, validate_new_teststep
+from testguide_report_generator.model.Artifact import (  # noqa: F401
+    Artifact,
+    TestStepArtifact,
+    TestStepArtifactType,
+    create_artifacts_from_dir,
+)
+from testguide_report_generator.util.Json2AtxRepr import Json2AtxRepr, resolve_json_repr
+from testguide_report_generator.util.ArtifactData import ArtifactData
+from testguide_report_generator.util.ValidityChecks import (
+    check_non_negative_integer,
+    check_optional_string_length,
+    check_string_length,
+    check_string_or_string_list,
+    validate_new_teststep,
+)
 
 
 class Verdict(Enum):
@@ -42,68 +54,6 @@ class Verdict(Enum):
     ERROR = 5
 
 
-class TestStepArtifactType(Enum):
-    """
-    Possible types of artifacts attached to test steps
-    """
-
-    __test__ = False  # pytest ignore
-
-    IMAGE = 1
-
-
-class Artifact(Json2AtxRepr):
-    """
-    TestCase artifact.
-    """
-
-    def __init__(self, file_path: str):
-        """
-        Constructor
-
-        :param file_path: file path to artifact
-        :type file_path: str
-        :raises OSError: file_path is not a valid path to a file
-        """
-        if not os.path.isfile(file_path):
-            raise OSError(errno.ENOENT, "File does not exist or path does not point to a file", file_path)
-
-        self.__file_path = file_path
-        self.__zip_file_path = self.__create_zip_file_path()
-
-    def __create_zip_file_path(self):
-        """
-        Determines the path to be created in the upload zip.
-
-        :return: path in upload zip
-        :rtype: str
-        """
-        md5_hash = get_md5_hash_from_file(self.__file_path)
-        basename = os.path.basename(self.__file_path)
-        return f"{md5_hash}/{basename}"
-
-    def get_file_path(self):
-        """
-        :return: path to file
-        :rtype: str
-        """
-        return self.__file_path
-
-    def get_path_in_upload_zip(self):
-        """
-        :return: hash-encoded path in the `.zip` file
-        :rtype: str
-        """
-        return self.__zip_file_path
-
-    def create_json_repr(self):
-        """
-        :see: :class:`Json2AtxRepr<testguide_report_generator.Json2AtxRepr>`
-        """
-        result = self.__zip_file_path
-        return result
-
-
 class Direction(Enum):
     """
     Parameter directions.
@@ -126,11 +76,21 @@ class Parameter(Json2AtxRepr):
         :param name: parameter name
         :type name: str
         :param value: parameter value
-        :type value: str or int
+        :type value: str, bool, int or float
         :param direction: parameter direction
         :type direction: Direction
+        :raises TypeError: the value or direction has the wrong type
+        :raises ValueError: the name is too long or empty, or the value is not a finite number
         """
-        self.__name = name
+        self.__name = check_string_length(name, 1, 120, "Parameter", "name")
+
+        if not isinstance(value, (str, bool, int, float)):
+            raise TypeError("Argument 'value' must be of type 'str', 'bool', 'int' or 'float'.")
+        if isinstance(value, float) and not math.isfinite(value):
+            raise ValueError(f"Argument 'value' must be a finite number. Was {value}")
+        if not isinstance(direction, Direction):
+            raise TypeError("Argument 'direction' must be of type 'Direction'.")
+
         self.__value = value
         self.__direction = direction
 
@@ -156,14 +116,15 @@ class Constant(Json2AtxRepr):
         :param key: Constant key
         :type key: str
         :param value: Constant value
-        :type value: str
+        :type value: str or list
+        :raises TypeError: the value is neither a string nor a list of strings
         """
         pattern = re.compile(Constant.PATTERN)
         if not pattern.match(key):
             raise ValueError(f"Constant keys need to be structured following this pattern: {Constant.PATTERN}")
         check_string_length(key, 1, 128, "Constant", "key")
         self.__key = key
-        self.__value = value
+        self.__value = check_string_or_string_list(value, "Constant", "value")
 
     def create_json_repr(self):
         """
@@ -190,14 +151,15 @@ class Attribute(Json2AtxRepr):
         :param key: Attribute key
         :type key: str
         :param value: Attribute value
-        :type value: str
+        :type value: str or list
+        :raises TypeError: the value is neither a string nor a list of strings
         """
         pattern = re.compile(Attribute.PATTERN)
         if not pattern.match(key):
             raise ValueError(f"Attribute keys need to be structured following this pattern: {Attribute.PATTERN}")
         check_string_length(key, 1, 255, "Attribute", "key")
         self.__key = key
-        self.__value = value
+        self.__value = check_string_or_string_list(value, "Attribute", "value")
 
     def create_json_repr(self):
         """
@@ -228,7 +190,7 @@ class Review(Json2AtxRepr):
 
         self.__comment = comment
         self.__author = author
-        self.__timestamp = timestamp
+        self.__timestamp = check_non_negative_integer(timestamp, "Review", "timestamp")
         self.__summary: str | None = None
         self.__verdict: Verdict | None = None
         self.__defect: str | None = None
@@ -301,6 +263,7 @@ class Review(Json2AtxRepr):
         :return: this object
         :rtype: Review
         """
+        tickets = list(tickets)
         for ticket in tickets:
             check_string_length(ticket, 0, 512, "Review", "ticket")
         self.__tickets.extend(tickets)
@@ -312,9 +275,12 @@ class Review(Json2AtxRepr):
 
         :param invalid: Review invalid
         :type invalid: bool
+        :raises TypeError: the argument is not a bool
         :return: this object
         :rtype: Review
         """
+        if not isinstance(invalid, bool):
+            raise TypeError("Argument 'invalid' must be of type 'bool'.")
         self.__invalid_run = invalid
         return self
 
@@ -337,9 +303,13 @@ class Review(Json2AtxRepr):
 
         :param tags: list of Review tags
         :type tags: list
+        :raises TypeError: a tag is not a string
         :return: this object
         :rtype: Review
         """
+        tags = list(tags)
+        if not all(isinstance(tag, str) for tag in tags):
+            raise TypeError("Review tags must be of type 'str'.")
         self.__tags.extend(tags)
         return self
 
@@ -351,6 +321,7 @@ class Review(Json2AtxRepr):
         :return: this object
         :rtype: Review
         """
+        contacts = list(contacts)
         for contact in contacts:
             check_string_length(contact, 0, 255, "Review", "contact")
         self.__contacts.extend(contacts)
@@ -381,46 +352,6 @@ class Review(Json2AtxRepr):
         return result
 
 
-class TestStepArtifact(Artifact):
-    """
-    Artifact attached to an ATX-TestStep
-    """
-
-    __test__ = False  # pytest ignore
-
-    def __init__(self, file_path: str, artifact_type: TestStepArtifactType):
-        """
-        Constructor
-
-        :param file_path: file path to the artifact
-        :type file_path: str
-        :param artifact_type: Type of the artifact (currently only images are supported)
-        :type artifact_type: TestStepArtifactType
-        :raises TypeError: artifact_type is not of type TestStepArtifactType
-        :raises OSError: file_path is not a valid path to a file
-        """
-        super().__init__(file_path)
-
-        if not isinstance(artifact_type, TestStepArtifactType):
-            raise TypeError("Argument 'artifact_type' must be of type 'TestStepArtifactType'.")
-
-        self.__artifact_type = artifact_type
-
-    def get_artifact_type(self):
-        """
-        returns the artifacts type
-
-        :rtype: TestStepArtifactType
-        """
-        return self.__artifact_type
-
-    def create_json_repr(self):
-        """
-        :see: :class:`Json2AtxRepr<testguide_report_generator.Json2AtxRepr>`
-        """
-        return {"path": self.get_path_in_upload_zip(), "artifactType": self.__artifact_type.name}
-
-
 class TestStep(Json2AtxRepr):
     """
     ATX-TestStep.
@@ -455,30 +386,41 @@ class TestStep(Json2AtxRepr):
         Set the test case description.
 
         :param desc: teststep description
-        :type desc: str
+        :type desc: str or None
         :return: this object
         :rtype: teststep
         """
-        self.__description = desc
+        self.__description = check_optional_string_length(desc, 6144, "TestStep", "description")
         return self
 
-    def add_artifact(self, file_path: str, artifact_type: TestStepArtifactType, ignore_on_error: bool = False):
+    def add_artifact(self, file_path: Union[str, ArtifactData], artifact_type: TestStepArtifactType,
+                     ignore_on_error: bool = False, lazy: bool = False, registry=None):
+        # pylint: disable=R0913
         """
         Add an artifact to the TestStep. Allows to ignore the artifact, if it does not exist.
 
-        :param file_path: path to artifact
-        :type file_path: str
+        :param file_path: path to artifact, or the content of an artifact which does not exist as a
+            file
+        :type file_path: str or ArtifactData
         :param artifact_type: type of the artifact
         :type artifact_type: TestStepArtifactType
         :param ignore_on_error: set to True, to skip this artifact if it does not exist (will not raise an error)
         :type ignore_on_error: bool
+        :param lazy: set to True, to defer hashing the artifact until the export, see :class:`Artifact`
+        :type lazy: bool
+        :param registry: registry in which the artifact is interned, usually the one of the
+            testsuite, or None to create a new artifact. Not used for ArtifactData.
+        :type registry: ArtifactRegistry or None
         :raises OSError: file_path is invalid, only when ignore_on_error = False
         :raises TypeError: artifact_type is not of type TestStepArtifactType
         :return: this object
         :rtype: TestStep
         """
         try:
-            artifact = TestStepArtifact(file_path, artifact_type)
+            if registry is not None and not isinstance(file_path, ArtifactData):
+                artifact = registry.get_teststep_artifact(file_path, artifact_type, lazy)
+            else:
+                artifact = TestStepArtifact(file_path, artifact_type, lazy)
             self.__artifacts.append(artifact)
         except OSError as error:
             if not ignore_on_error:
@@ -488,6 +430,43 @@ class TestStep(Json2AtxRepr):
             )
         return self
 
+    def add_artifacts_from_dir(self, directory: str, artifact_type: TestStepArtifactType, pattern: str = "*",
+                               ignore_on_error: bool = False, lazy: bool = False, registry=None):
+        # pylint: disable=R0913
+        """
+        Adds all files of a directory whose names match the pattern to the TestStep, sorted by
+        their names. The directory is scanned only once, subdirectories are not included, and the
+        files are hashed concurrently.
+
+        :param directory: path to the directory
+        :type directory: str
+        :param artifact_type: type of the artifacts
+        :type artifact_type: TestStepArtifactType
+        :param pattern: shell-style pattern for the file names, see :mod:`fnmatch`
+        :type pattern: str
+        :param ignore_on_error: set to True, to skip files which cannot be added, or all files if
+            the directory does not exist (will not raise an error)
+        :type ignore_on_error: bool
+        :param lazy: set to True, to defer hashing the artifacts until the export, see :class:`Artifact`
+        :type lazy: bool
+        :param registry: registry in which the artifacts are interned, or None to create new
+            artifacts
+        :type registry: ArtifactRegistry or None
+        :raises OSError: the directory or a file is invalid, only when ignore_on_error = False.
+            No artifact is added in this case.
+        :raises TypeError: artifact_type is not of type TestStepArtifactType
+        :return: paths of the skipped files or of the skipped directory
+        :rtype: list
+        """
+        if not isinstance(artifact_type, TestStepArtifactType):
+            raise TypeError("Argument 'artifact_type' must be of type 'TestStepArtifactType'.")
+
+        artifacts, skipped = create_artifacts_from_dir(directory, pattern,
+                                                       lambda entry: TestStepArtifact(entry, artifact_type, True),
+                                                       ignore_on_error, lazy, f"teststep '{self.__name}'", registry)
+        self.__artifacts.extend(artifacts)
+        return skipped
+
     def get_artifacts(self):
         """
         Get the TestSteps artifacts
@@ -498,6 +477,12 @@ class TestStep(Json2AtxRepr):
         return self.__artifacts
 
     def create_json_repr(self):
+        """
+        :see: :class:`Json2AtxRepr<testguide_report_generator.Json2AtxRepr>`
+        """
+        return resolve_json_repr(self.create_lazy_json_repr())
+
+    def create_lazy_json_repr(self):
         """
         :see: :class:`Json2AtxRepr<testguide_report_generator.Json2AtxRepr>`
         """
@@ -507,7 +492,7 @@ class TestStep(Json2AtxRepr):
             "description": self.__description,
             "verdict": self.__verdict.name,
             "expected_result": self.__expected_result,
-            "testStepArtifacts": [each.create_json_repr() for each in self.__artifacts],
+            "testStepArtifacts": self.__artifacts,
         }
         return result
 
@@ -536,11 +521,11 @@ class TestStepFolder(Json2AtxRepr):
         Set the test case description.
 
         :param desc: teststep description
-        :type desc: str
+        :type desc: str or None
         :return: this object
         :rtype: teststep
         """
-        self.__description = desc
+        self.__description = check_optional_string_length(desc, 6144, "TestStepFolder", "description")
         return self
 
     def add_teststep(self, teststep):
@@ -550,11 +535,14 @@ class TestStepFolder(Json2AtxRepr):
         :param teststep: TestStep to be added
         :type teststep: TestStep or TestStepFolder
         :raises TypeError: the argument is not a TestStep or TestStepFolder
+        :raises ValueError: the argument is an empty TestStepFolder
         :return: this object
         :rtype: TestStepFolder
         """
         if not isinstance(teststep, (TestStep, TestStepFolder)):
             raise TypeError("Argument teststep must be of type TestStep or TestStepFolder.")
+        if isinstance(teststep, TestStepFolder) and not teststep.get_teststeps():
+            raise ValueError("TestStepFolder may not be empty.")
 
         self.__teststeps.append(teststep)
         return self
@@ -567,6 +555,12 @@ class TestStepFolder(Json2AtxRepr):
         return self.__teststeps
 
     def create_json_repr(self):
+        """
+        :see: :class:`Json2AtxRepr<testguide_report_generator.Json2AtxRepr>`
+        """
+        return resolve_json_repr(self.create_lazy_json_repr())
+
+    def create_lazy_json_repr(self):
         """
         :see: :class:`Json2AtxRepr<testguide_report_generator.Json2AtxRepr>`
         """
@@ -574,7 +568,7 @@ class TestStepFolder(Json2AtxRepr):
             "@type": "teststepfolder",
             "name": self.__name,
             "description": self.__description,
-            "teststeps": [each.create_json_repr() for each in self.__teststeps],
+            "teststeps": self.__teststeps,
         }
         return result
 
@@ -598,11 +592,13 @@ class TestCase(Json2AtxRepr):
         :type timestamp: int
         :param verdict: testcase verdict
         :type verdict: Verdict
-        :raises: TypeError, if the argument 'verdict' is not of type Verdict
+        :raises: TypeError, if the argument 'verdict' is not of type Verdict or the timestamp is
+            not an integer
+        :raises: ValueError, if the name is too long or empty, or the timestamp is negative
         """
 
         self.__name = check_string_length(name, 1, 120, "TestCase", "name")
-        self.__timestamp = timestamp
+        self.__timestamp = check_non_negative_integer(timestamp, "TestCase", "timestamp")
 
         if not isinstance(verdict, Verdict):
             raise TypeError("Argument 'verdict' must be of type 'Verdict'.")
@@ -624,29 +620,34 @@ class TestCase(Json2AtxRepr):
         self.__artifacts: list[Artifact] = []
 
         self.__review: Review | None = None
+        self.__modification_count = 0
 
     def set_description(self, desc: str):
         """
         Set the test case description.
 
         :param desc: testcase description
-        :type desc: str
+        :type desc: str or None
         :return: this object
         :rtype: TestCase
         """
-        self.__description = desc
+        self.__description = check_optional_string_length(desc, 6144, "TestCase", "description")
+        self.__modification_count += 1
         return self
 
     def set_execution_time_in_sec(self, exec_time: int):
         """
         Set the execution time of the testcase.
 
-        :param exec_time: execution time in seconds > 0
+        :param exec_time: execution time in seconds >= 0
         :type exec_time: int
+        :raises TypeError: the argument is not an integer
+        :raises ValueError: the argument is negative
         :return: this object
         :rtype: TestCase
         """
-        self.__execution_time = exec_time
+        self.__execution_time = check_non_negative_integer(exec_time, "TestCase", "executionTime")
+        self.__modification_count += 1
         return self
 
     def add_parameter_set(self, param_set: str, params: List[Parameter]):
@@ -661,13 +662,15 @@ class TestCase(Json2AtxRepr):
         :return: this object
         :rtype: TestCase
         """
-        check_string_length(param_set, 0, 1024, "TestCase", "paramSet")
-        self.__param_set = param_set
+        check_optional_string_length(param_set, 1024, "TestCase", "paramSet")
+        params = list(params)
 
         if not all(isinstance(param, Parameter) for param in params):
             raise TypeError("Argument params must be of type list from Parameter.")
 
+        self.__param_set = param_set
         self.__parameters = params
+        self.__modification_count += 1
         return self
 
     def add_constants(self, constants: List[Constant]):
@@ -703,6 +706,7 @@ class TestCase(Json2AtxRepr):
         if not isinstance(constant, Constant):
             raise TypeError("Argument constant must be of type Constant.")
         self.__constants.append(constant)
+        self.__modification_count += 1
         return self
 
     def add_constant_pair(self, key: str, value: str):
@@ -731,6 +735,7 @@ class TestCase(Json2AtxRepr):
         :rtype: TestCase
         """
         self.__attributes.append(Attribute(key, value))
+        self.__modification_count += 1
         return self
 
     def add_setup_teststep(self, teststep: Union[TestStep, TestStepFolder]):
@@ -746,6 +751,7 @@ class TestCase(Json2AtxRepr):
         """
         if validate_new_teststep(teststep, TestStep, TestStepFolder):
             self.__setup_teststeps.append(teststep)
+            self.__modification_count += 1
         return self
 
     def add_execution_teststep(self, teststep: Union[TestStep, TestStepFolder]):
@@ -761,6 +767,7 @@ class TestCase(Json2AtxRepr):
         """
         if validate_new_teststep(teststep, TestStep, TestStepFolder):
             self.__execution_teststeps.append(teststep)
+            self.__modification_count += 1
         return self
 
     def add_teardown_teststep(self, teststep: Union[TestStep, TestStepFolder]):
@@ -776,24 +783,36 @@ class TestCase(Json2AtxRepr):
         """
         if validate_new_teststep(teststep, TestStep, TestStepFolder):
             self.__teardown_teststeps.append(teststep)
+            self.__modification_count += 1
         return self
 
-    def add_artifact(self, artifact_file_path: str, ignore_on_error: bool = False):
+    def add_artifact(self, artifact_file_path: Union[str, ArtifactData], ignore_on_error: bool = False,
+                     lazy: bool = False, registry=None):
         """
         Adds an arbitrary artifact to the testcase execution.
 
-        :param artifact_file_path: artifact file path
-        :type artifact_file_path: str
+        :param artifact_file_path: artifact file path, or the content of an artifact which does not
+            exist as a file
+        :type artifact_file_path: str or ArtifactData
         :param ignore_on_error: True, if this file should simply be ignored if the file path is
             accessed incorrectly, otherwise False.
         :type ignore_on_error: bool
+        :param lazy: True, to defer hashing the artifact until the export, see :class:`Artifact`
+        :type lazy: bool
+        :param registry: registry in which the artifact is interned, usually the one of the
+            testsuite, or None to create a new artifact. Not used for ArtifactData.
+        :type registry: ArtifactRegistry or None
         :raises OSError: file_path is invalid, only when ignore_on_error = False
         :return: this object
         :rtype: TestStep
         """
         try:
-            artifact = Artifact(artifact_file_path)
+            if registry is not None and not isinstance(artifact_file_path, ArtifactData):
+                artifact = registry.get_artifact(artifact_file_path, lazy)
+            else:
+                artifact = Artifact(artifact_file_path, lazy)
             self.__artifacts.append(artifact)
+            self.__modification_count += 1
         except OSError as error:
             if not ignore_on_error:
                 raise error
@@ -802,6 +821,53 @@ class TestCase(Json2AtxRepr):
             )
         return self
 
+    def add_artifacts_from_dir(self, directory: str, pattern: str = "*", ignore_on_error: bool = False,
+                               lazy: bool = False, registry=None):
+        # pylint: disable=R0913
+        """
+        Adds all files of a directory whose names match the pattern to the testcase, sorted by
+        their names. The directory is scanned only once, subdirectories are not included, and the
+        files are hashed concurrently.
+
+        :param directory: path to the directory
+        :type directory: str
+        :param pattern: shell-style pattern for the file names, see :mod:`fnmatch`
+        :type pattern: str
+        :param ignore_on_error: True, if files which cannot be added, or all files if the directory
+            does not exist, should simply be ignored, otherwise False.
+        :type ignore_on_error: bool
+        :param lazy: True, to defer hashing the artifacts until the export, see :class:`Artifact`
+        :type lazy: bool
+        :param registry: registry in which the artifacts are interned, or None to create new
+            artifacts
+        :type registry: ArtifactRegistry or None
+        :raises OSError: the directory or a file is invalid, only when ignore_on_error = False.
+            No artifact is added in this case.
+        :return: paths of the skipped files or of the skipped directory
+        :rtype: list
+        """
+        artifacts, skipped = create_artifacts_from_dir(directory, pattern, lambda entry: Artifact(entry, True),
+                                                       ignore_on_error, lazy, f"testcase '{self.__name}'", registry)
+        self.__artifacts.extend(artifacts)
+        self.__modification_count += 1
+        return skipped
+
+    def get_name(self):
+        """
+        :return: name of the testcase
+        :rtype: str
+        """
+        return self.__name
+
+    def get_modification_count(self):
+        """
+        :return: number of modifications by the methods of the testcase since its creation, which
+            tells whether it has been modified after it was validated. Modifications of its
+            teststeps or other nested objects are not counted.
+        :rtype: int
+        """
+        return self.__modification_count
+
     def get_artifacts(self):
         """
         :return: Attached files to the testcase and its test steps.
@@ -828,9 +894,16 @@ class TestCase(Json2AtxRepr):
         if not isinstance(review, Review):
             raise TypeError("Argument review must be of type Review.")
         self.__review = review
+        self.__modification_count += 1
         return self
 
     def create_json_repr(self):
+        """
+        :see: :class:`Json2AtxRepr<testguide_report_generator.Json2AtxRepr>`
+        """
+        return resolve_json_repr(self.create_lazy_json_repr())
+
+    def create_lazy_json_repr(self):
         """
         :see: :class:`Json2AtxRepr<testguide_report_generator.Json2AtxRepr>`
         """
@@ -841,18 +914,18 @@ class TestCase(Json2AtxRepr):
             "description": self.__description,
             "timestamp": self.__timestamp,
             "executionTime": self.__execution_time,
-            "parameters": [each.create_json_repr() for each in self.__parameters],
+            "parameters": self.__parameters,
             "paramSet": self.__param_set,
-            "setupTestSteps": [each.create_json_repr() for each in self.__setup_teststeps],
-            "executionTestSteps": [each.create_json_repr() for each in self.__execution_teststeps],
-            "teardownTestSteps": [each.create_json_repr() for each in self.__teardown_teststeps],
-            "attributes": [each.create_json_repr() for each in self.__attributes],
-            "constants": [each.create_json_repr() for each in self.__constants],
+            "setupTestSteps": self.__setup_teststeps,
+            "executionTestSteps": self.__execution_teststeps,
+            "teardownTestSteps": self.__teardown_teststeps,
+            "attributes": self.__attributes,
+            "constants": self.__constants,
             "environments": [],
-            "artifacts": [each.create_json_repr() for each in self.__artifacts],
+            "artifacts": self.__artifacts,
         }
         if self.__review:
-            result["review"] = self.__review.create_json_repr()
+            result["review"] = self.__review
         return result
 
     def __collect_teststep_artifacts(self, teststep) -> list:
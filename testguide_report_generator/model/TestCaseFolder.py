@@ -8,10 +8,13 @@
 This module contains the TestCaseFolder class.
 """
 
+from typing import Optional
 from typing_extensions import Self
 from testguide_report_generator.model.TestCase import TestCase
-from testguide_report_generator.util.Json2AtxRepr import Json2AtxRepr
-from testguide_report_generator.util.ValidityChecks import check_string_length, validate_testcase
+from testguide_report_generator.util.Json2AtxRepr import Json2AtxRepr, resolve_json_repr
+from testguide_report_generator.util.JsonValidator import JsonValidator
+from testguide_report_generator.util.ValidityChecks import check_string_length, validate_testcase, \
+    validate_testcase_schema
 
 
 class TestCaseFolder(Json2AtxRepr):
@@ -24,15 +27,19 @@ class TestCaseFolder(Json2AtxRepr):
 
     __test__ = False  # pytest ignore
 
-    def __init__(self, name: str):
+    def __init__(self, name: str, validator: Optional[JsonValidator] = None):
         """
         Constructor
 
         :param name: name of the testcase folder
         :type name: str
+        :param validator: set to validate each TestCase against the schema when it is added, see
+            :class:`TestSuite<testguide_report_generator.TestSuite.TestSuite>`
+        :type validator: JsonValidator or None
         """
         self.__name = check_string_length(name, 1, 120, "TestCaseFolder", "name")
         self.__testcases: list[TestCase | TestCaseFolder] = []
+        self.__validator = validator
 
     def add_testcase(self, testcase: TestCase | Self) -> Self:
         # pylint: disable=R0801
@@ -41,14 +48,23 @@ class TestCaseFolder(Json2AtxRepr):
 
         :param testcase: testcase to be added
         :type testcase: TestCase or TestCaseFolder
-        :raises: ValueError, if the argument is not a TestCase or TestCaseFolder
+        :raises: ValueError, if the argument is not a TestCase or TestCaseFolder, or if a TestCase
+            does not comply with the schema of the validator
         :return: this object
         :rtype: TestCaseFolder
         """
-        if validate_testcase(testcase, TestCase, TestCaseFolder):
+        if validate_testcase(testcase, TestCase, TestCaseFolder) and \
+                (self.__validator is None or validate_testcase_schema(testcase, self.__validator, TestCaseFolder)):
             self.__testcases.append(testcase)
         return self
 
+    def get_name(self):
+        """
+        :return: name of the testcase folder
+        :rtype: str
+        """
+        return self.__name
+
     def get_testcases(self):
         """
         :return: Testcases or TestCaseFolders
@@ -57,12 +73,18 @@ class TestCaseFolder(Json2AtxRepr):
         return self.__testcases
 
     def create_json_repr(self):
+        """
+        :see: :class:`Json2AtxRepr<testguide_report_generator.Json2AtxRepr>`
+        """
+        return resolve_json_repr(self.create_lazy_json_repr())
+
+    def create_lazy_json_repr(self):
         """
         :see: :class:`Json2AtxRepr<testguide_report_generator.Json2AtxRepr>`
         """
         result = {
             "@type": "testcasefolder",
             "name": self.__name,
-            "testcases": [each.create_json_repr() for each in self.__testcases],
+            "testcases": self.__testcases,
         }
         return result
@@ -8,12 +8,15 @@
 This module contains the TestSuite class.
 """
 
-from typing import Union
+from typing import Optional, Union
 
+from testguide_report_generator.model.ArtifactRegistry import ArtifactRegistry
 from testguide_report_generator.model.TestCase import TestCase
 from testguide_report_generator.model.TestCaseFolder import TestCaseFolder
-from testguide_report_generator.util.Json2AtxRepr import Json2AtxRepr
-from testguide_report_generator.util.ValidityChecks import check_string_length, validate_testcase
+from testguide_report_generator.util.Json2AtxRepr import Json2AtxRepr, resolve_json_repr
+from testguide_report_generator.util.JsonValidator import JsonValidator
+from testguide_report_generator.util.ValidityChecks import check_non_negative_integer, check_string_length, \
+    validate_testcase, validate_testcase_schema
 
 
 class TestSuite(Json2AtxRepr):
@@ -25,7 +28,7 @@ class TestSuite(Json2AtxRepr):
 
     __test__ = False  # pytest ignore
 
-    def __init__(self, name: str, timestamp: int):
+    def __init__(self, name: str, timestamp: int, validator: Optional[JsonValidator] = None):
         """
         Constructor
 
@@ -33,10 +36,21 @@ class TestSuite(Json2AtxRepr):
         :type name: str
         :param timestamp: timestamp in milliseconds
         :type timestamp: int
+        :param validator: set to validate each TestCase against the schema when it is added, so
+            that errors are found early and the export only has to check the structure of the
+            report. TestCases should be complete when they are added. TestCases modified by their
+            own methods afterwards are validated again on export, their teststeps must not be
+            modified anymore. Pass the same validator to the TestCaseFolders, to validate their
+            TestCases only once.
+        :type validator: JsonValidator or None
+        :raises TypeError: the name is not a string or the timestamp is not an integer
+        :raises ValueError: the name is too long or empty, or the timestamp is negative
         """
         self.__name = check_string_length(name, 1, 120, "TestSuite", "name")
-        self.__timestamp = timestamp
+        self.__timestamp = check_non_negative_integer(timestamp, "TestSuite", "timestamp")
         self.__testcases: list[Union[TestCase, TestCaseFolder]] = []
+        self.__artifact_registry = ArtifactRegistry()
+        self.__validator = validator
 
     def add_testcase(self, testcase: Union[TestCase, TestCaseFolder]):
         """
@@ -44,15 +58,46 @@ class TestSuite(Json2AtxRepr):
 
         :param testcase: testcase to be added
         :type testcase: TestCase or TestCaseFolder
-        :raises: ValueError, if the argument is not a TestCase or TestCaseFolder, or if an empty
-            TestCaseFolder was added
+        :raises: ValueError, if the argument is not a TestCase or TestCaseFolder, if an empty
+            TestCaseFolder was added, or if a TestCase does not comply with the schema of the
+            validator
         :return: this object
         :rtype: TestSuite
         """
-        if validate_testcase(testcase, TestCase, TestCaseFolder):
+        if validate_testcase(testcase, TestCase, TestCaseFolder) and \
+                (self.__validator is None or validate_testcase_schema(testcase, self.__validator, TestCaseFolder)):
             self.__testcases.append(testcase)
         return self
 
+    def get_name(self) -> str:
+        """
+        :return: name of the TestSuite
+        :rtype: str
+        """
+        return self.__name
+
+    def get_timestamp(self) -> int:
+        """
+        :return: timestamp in milliseconds
+        :rtype: int
+        """
+        return self.__timestamp
+
+    def get_validator(self) -> Optional[JsonValidator]:
+        """
+        :return: validator which validates each TestCase when it is added, or None
+        :rtype: JsonValidator or None
+        """
+        return self.__validator
+
+    def get_artifact_registry(self) -> ArtifactRegistry:
+        """
+        :return: registry which shares the artifacts of files attached to several testcases or
+            teststeps of this TestSuite, see the registry argument of `add_artifact`
+        :rtype: ArtifactRegistry
+        """
+        return self.__artifact_registry
+
     def get_testcases(self) -> list:
         """
         :return: Testcases or TestCaseFolders
@@ -61,12 +106,18 @@ class TestSuite(Json2AtxRepr):
         return self.__testcases
 
     def create_json_repr(self) -> dict:
+        """
+        @see: :class:`Json2AtxRepr<testguide_report_generator.Json2AtxRepr>`
+        """
+        return resolve_json_repr(self.create_lazy_json_repr())
+
+    def create_lazy_json_repr(self) -> dict:
         """
         @see: :class:`Json2AtxRepr<testguide_report_generator.Json2AtxRepr>`
         """
         result = {
             'name': self.__name,
             'timestamp': self.__timestamp,
-            'testcases':  [each.create_json_repr() for each in self.__testcases]
+            'testcases': self.__testcases
             }
         return result
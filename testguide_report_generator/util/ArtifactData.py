@@ -0,0 +1,180 @@
+# Copyright (c) 2023-2024 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+# -*- coding: utf-8 -*-
+
+"""
+This module contains the ArtifactData class.
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import weakref
+from typing import Optional
+
+READ_CHUNK_SIZE = 1024 * 1024
+DEFAULT_MEMORY_BUDGET = 256 * 1024 * 1024
+
+
+class ArtifactData:
+    """
+    Content of an artifact which does not exist as a file, e.g. a screenshot captured in memory.
+    The content is kept in memory as long as the memory budget shared by all ArtifactData objects
+    permits. Otherwise, it is spilled to a temporary file, which is deleted together with the
+    object.
+    """
+
+    __lock = threading.Lock()
+    __memory_budget = DEFAULT_MEMORY_BUDGET
+    __memory_used = 0
+    __spill_directory: Optional[str] = None
+
+    def __init__(self, name: str, content):
+        """
+        Constructor. Streams and iterators are consumed completely.
+
+        :param name: file name of the artifact in the upload zip
+        :type name: str
+        :param content: the content as bytes-like object, readable binary stream or iterable of
+            bytes-like chunks. Only bytes objects are kept without copying them.
+        :type content: bytes or bytearray or memoryview or BinaryIO or Iterable[bytes]
+        :raises ValueError: name is empty or contains a directory
+        :raises TypeError: content is none of the supported types
+        """
+        if not name or name in (".", "..") or "/" in name or "\\" in name:
+            raise ValueError(f"Argument 'name' must be a file name without directories. Was '{name}'")
+
+        self.__name = name
+        self.__data: bytes | None = None
+        self.__file_path: str | None = None
+        self.__size = 0
+        self.__consume(self.__iter_chunks(content))
+
+    @staticmethod
+    def set_memory_budget(max_bytes: int, spill_directory: Optional[str] = None):
+        """
+        Sets the number of bytes which all ArtifactData objects may keep in memory together.
+        Content created afterwards, which exceeds the budget, is spilled to a temporary file.
+
+        :param max_bytes: the memory budget, 0 to spill every content to disk
+        :type max_bytes: int
+        :param spill_directory: directory for the temporary files, None for the default
+            temporary directory
+        :type spill_directory: str or None
+        :raises ValueError: max_bytes is negative
+        """
+        if max_bytes < 0:
+            raise ValueError(f"Argument 'max_bytes' must not be negative. Was {max_bytes}")
+        with ArtifactData.__lock:
+            ArtifactData.__memory_budget = max_bytes
+            ArtifactData.__spill_directory = spill_directory
+
+    @staticmethod
+    def get_memory_used():
+        """
+        :return: number of bytes which all ArtifactData objects currently keep in memory
+        :rtype: int
+        """
+        return ArtifactData.__memory_used
+
+    def get_name(self):
+        """
+        :return: file name of the artifact
+        :rtype: str
+        """
+        return self.__name
+
+    def get_size(self):
+        """
+        :return: size of the content in bytes
+        :rtype: int
+        """
+        return self.__size
+
+    def get_data(self):
+        """
+        :return: the content, or None if it has been spilled to a file
+        :rtype: memoryview or None
+        """
+        return None if self.__data is None else memoryview(self.__data)
+
+    def get_file_path(self):
+        """
+        :return: path to the temporary file named like the artifact, or None if the content is
+            kept in memory
+        :rtype: str or None
+        """
+        return self.__file_path
+
+    @staticmethod
+    def __iter_chunks(content):
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            return [content]
+        if hasattr(content, "read"):
+            return iter(lambda: content.read(READ_CHUNK_SIZE), b"")
+        try:
+            return iter(content)
+        except TypeError as error:
+            raise TypeError("Argument 'content' must be bytes-like, a binary stream or an iterable of bytes.") \
+                from error
+
+    def __consume(self, chunks):
+        """
+        Keeps the chunks in memory until the memory budget is exhausted and spills them to a
+        temporary file afterwards.
+        """
+        buffered: list = []
+        reserved = 0
+        spill_file = None
+        consumed = False
+        try:
+            for chunk in chunks:
+                if not isinstance(chunk, bytes):
+                    chunk = bytes(memoryview(chunk).cast("B"))
+                self.__size += len(chunk)
+                if spill_file is None and ArtifactData.__reserve(len(chunk)):
+                    reserved += len(chunk)
+                    buffered.append(chunk)
+                    continue
+
+                if spill_file is None:
+                    spill_file = self.__create_spill_file()
+                    spill_file.writelines(buffered)
+                    buffered.clear()
+                    ArtifactData.__release(reserved, None)
+                    reserved = 0
+                spill_file.write(chunk)
+            consumed = True
+        finally:
+            # the spill file must be closed before its directory is removed, which fails for open
+            # files on Windows
+            if spill_file is not None:
+                spill_file.close()
+            if not consumed:
+                ArtifactData.__release(reserved, self.__file_path)
+
+        if spill_file is None:
+            self.__data = buffered[0] if len(buffered) == 1 else b"".join(buffered)
+        weakref.finalize(self, ArtifactData.__release, reserved, self.__file_path)
+
+    def __create_spill_file(self):
+        self.__file_path = os.path.join(tempfile.mkdtemp(dir=ArtifactData.__spill_directory), self.__name)
+        return open(self.__file_path, "wb")  # pylint: disable=consider-using-with
+
+    @staticmethod
+    def __reserve(size):
+        with ArtifactData.__lock:
+            if ArtifactData.__memory_used + size > ArtifactData.__memory_budget:
+                return False
+            ArtifactData.__memory_used += size
+            return True
+
+    @staticmethod
+    def __release(size, file_path):
+        with ArtifactData.__lock:
+            ArtifactData.__memory_used -= size
+        if file_path is not None:
+            shutil.rmtree(os.path.dirname(file_path), ignore_errors=True)
@@ -0,0 +1,106 @@
+# Copyright (c) 2023-2024 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+# -*- coding: utf-8 -*-
+
+"""
+This module contains the CompressionPolicy class.
+"""
+
+import os
+import zlib
+from typing import Optional
+from zipfile import ZIP_DEFLATED, ZIP_STORED
+
+from testguide_report_generator.util.File import get_extended_windows_path
+
+DEFAULT_STORED_EXTENSIONS = frozenset({
+    # images
+    ".png", ".jpg", ".jpeg", ".gif", ".webp",
+    # audio and video
+    ".mp3", ".mp4", ".m4v", ".avi", ".mkv", ".mov", ".webm",
+    # archives
+    ".zip", ".gz", ".tgz", ".bz2", ".xz", ".7z", ".zst", ".rar",
+})
+
+
+class CompressionPolicy:
+    """
+    Decides how an artifact is compressed inside the upload `.zip` file. Compressing files which
+    are already compressed, such as images, videos or archives, costs a lot of time for hardly
+    any gain, so these are stored uncompressed.
+    """
+
+    def __init__(self, compresslevel: Optional[int] = None, stored_extensions=DEFAULT_STORED_EXTENSIONS,
+                 sample_size: int = 0, min_sample_ratio: float = 0.9):
+        """
+        Constructor
+
+        :param compresslevel: zlib compression level between 0 and 9 for compressed entries, None
+            for the zlib default
+        :type compresslevel: int or None
+        :param stored_extensions: file extensions (lower case, including the dot) of files which
+            are stored without compression
+        :type stored_extensions: Iterable[str]
+        :param sample_size: number of bytes from the beginning of other files which are test
+            compressed to decide whether compressing the whole file is worthwhile, 0 to disable
+        :type sample_size: int
+        :param min_sample_ratio: files are stored without compression if their compressed sample is
+            larger than this fraction of the original sample
+        :type min_sample_ratio: float
+        :raises ValueError: compresslevel is not between 0 and 9
+        """
+        if compresslevel is not None and compresslevel not in range(0, 10):
+            raise ValueError(f"The compresslevel must be between 0 and 9. Was {compresslevel}")
+
+        self.__compresslevel = compresslevel
+        self.__stored_extensions = frozenset(stored_extensions)
+        self.__sample_size = sample_size
+        self.__min_sample_ratio = min_sample_ratio
+
+    def get_compresslevel(self):
+        """
+        :return: zlib compression level for compressed entries, None for the zlib default
+        :rtype: int or None
+        """
+        return self.__compresslevel
+
+    def get_compression(self, file_path: str, data=None):
+        """
+        Determines the compression of the given file in the upload zip.
+
+        :param file_path: path to the file, or only its name if data is given
+        :type file_path: str
+        :param data: content of the file, if it is kept in memory instead of a file
+        :type data: bytes or memoryview or None
+        :return: compression type (ZIP_STORED or ZIP_DEFLATED) and compression level
+        :rtype: tuple
+        """
+        if self.is_compressible(file_path, data):
+            return ZIP_DEFLATED, self.__compresslevel
+        return ZIP_STORED, None
+
+    def is_compressible(self, file_path: str, data=None):
+        """
+        :param file_path: path to the file, or only its name if data is given
+        :type file_path: str
+        :param data: content of the file, if it is kept in memory instead of a file
+        :type data: bytes or memoryview or None
+        :return: True, if compressing the file is considered worthwhile, otherwise False
+        :rtype: bool
+        """
+        extension = os.path.splitext(file_path)[1].lower()
+        if extension in self.__stored_extensions:
+            return False
+
+        if self.__sample_size > 0:
+            if data is not None:
+                sample = bytes(data[:self.__sample_size])
+            else:
+                with open(get_extended_windows_path(file_path), 'rb') as file:
+                    sample = file.read(self.__sample_size)
+            if sample:
+                return len(zlib.compress(sample, 1)) <= len(sample) * self.__min_sample_ratio
+
+        return True
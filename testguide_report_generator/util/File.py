@@ -9,7 +9,19 @@ This module contains some utility methods.
 """
 
 import hashlib
+import importlib
 import os
+from typing import Union
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# algorithms of optional third-party packages, in addition to the algorithms of hashlib
+OPTIONAL_HASH_ALGORITHMS = {
+    "blake3": ("blake3", "blake3"),
+    "xxh64": ("xxhash", "xxh64"),
+    "xxh3_64": ("xxhash", "xxh3_64"),
+    "xxh3_128": ("xxhash", "xxh3_128"),
+}
 
 
 def get_extended_windows_path(source_path: str):
@@ -34,6 +46,76 @@ def get_extended_windows_path(source_path: str):
     return source_path
 
 
+def get_stat_result(file_path: Union[str, os.DirEntry]):
+    """
+    Returns the status of a file, following symbolic links. The status of an entry of
+    :func:`os.scandir` is taken from its cache, unless it lacks the inode, as on Windows.
+
+    :param file_path: file path, or an entry of :func:`os.scandir`
+    :type file_path: str or os.DirEntry
+    :raises OSError: the file cannot be accessed
+    :return: status of the file
+    :rtype: os.stat_result
+    """
+    if not isinstance(file_path, os.DirEntry):
+        return os.stat(get_extended_windows_path(file_path))
+    stat_result = file_path.stat()
+    if stat_result.st_ino == 0:
+        return os.stat(get_extended_windows_path(file_path.path))
+    return stat_result
+
+
+def create_hasher(algorithm: str):
+    """
+    Creates a hash object with the `update`, `hexdigest` and `digest_size` interface of
+    :mod:`hashlib`.
+
+    :param algorithm: name of an algorithm of hashlib, e.g. "md5", "sha1", "blake2b", or of an
+        optional package, i.e. "blake3" or "xxh64", "xxh3_64", "xxh3_128"
+    :type algorithm: str
+    :raises ValueError: the algorithm is unknown, its package is not installed, or it has no fixed
+        digest size
+    :return: the hash object
+    :rtype: hashlib._Hash
+    """
+    if algorithm in OPTIONAL_HASH_ALGORITHMS:
+        module_name, constructor = OPTIONAL_HASH_ALGORITHMS[algorithm]
+        try:
+            return getattr(importlib.import_module(module_name), constructor)()
+        except ImportError as error:
+            raise ValueError(f"The hash algorithm '{algorithm}' requires the package '{module_name}'.") from error
+
+    if algorithm.startswith("shake_"):
+        raise ValueError(f"The hash algorithm '{algorithm}' has no fixed digest size.")
+    try:
+        return hashlib.new(algorithm)
+    except ValueError as error:
+        raise ValueError(f"Unknown hash algorithm '{algorithm}'.") from error
+
+
+def get_hash_from_file(file_path, algorithm: str = "md5"):
+    """
+    Calculates the hash of the file. The file is read in chunks into a reused buffer, so the
+    memory consumption does not depend on the file size.
+
+    :param file_path: file path
+    :type file_path: str
+    :param algorithm: hash algorithm, see :func:`create_hasher`
+    :type algorithm: str
+    :raises ValueError: the algorithm is not available
+    :return: hexadecimal digest
+    :rtype: str
+    """
+    hasher = create_hasher(algorithm)
+    with open(get_extended_windows_path(file_path), 'rb', buffering=0) as afile:
+        # small files are read at once without allocating a full chunk
+        buf = bytearray(min(HASH_CHUNK_SIZE, max(os.fstat(afile.fileno()).st_size, 4096)))
+        view = memoryview(buf)
+        while size := afile.readinto(buf):
+            hasher.update(view[:size])
+    return hasher.hexdigest()
+
+
 def get_md5_hash_from_file(file_path):
     """
     Calculates the MD5 hash of the file.
@@ -43,8 +125,4 @@ def get_md5_hash_from_file(file_path):
     :return: MD5 hash
     :rtype: str
     """
-    hasher = hashlib.md5()
-    with open(get_extended_windows_path(file_path), 'rb') as afile:
-        buf = afile.read()
-        hasher.update(buf)
-    return hasher.hexdigest()
+    return get_hash_from_file(file_path, "md5")
@@ -0,0 +1,163 @@
+# Copyright (c) 2023-2024 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+# -*- coding: utf-8 -*-
+
+"""
+This module contains the HashCache class.
+"""
+
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Union
+
+from testguide_report_generator.util.File import get_hash_from_file, get_stat_result
+
+CACHE_FORMAT_VERSION = 1
+
+
+class HashCache:
+    """
+    Persistent cache of artifact hashes. A file is only hashed again if its size, modification
+    time or inode has changed since it was hashed last, which saves reading large reference files
+    that are attached to many testcases on every run. When the number of entries exceeds the
+    limit, the least recently used entries are evicted.
+    """
+
+    def __init__(self, cache_file_path: str, max_entries: int = 100000):
+        """
+        Constructor. Loads the entries of a previous run if the cache file exists.
+
+        :param cache_file_path: path to the `.json` file in which the cache is stored
+        :type cache_file_path: str
+        :param max_entries: maximum number of cached files
+        :type max_entries: int
+        :raises ValueError: max_entries is less than 1
+        """
+        if max_entries < 1:
+            raise ValueError(f"Argument 'max_entries' must be at least 1. Was {max_entries}")
+
+        self.__cache_file_path = cache_file_path
+        self.__max_entries = max_entries
+        self.__entries: OrderedDict = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+        self.__load()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.save()
+
+    def get_md5_hash(self, file_path: str):
+        """
+        Returns the MD5 hash of the file, from the cache if the file is unchanged.
+
+        :param file_path: file path
+        :type file_path: str
+        :return: MD5 hash
+        :rtype: str
+        """
+        return self.get_hash(file_path, "md5")
+
+    def get_hash(self, file_path: Union[str, os.DirEntry], algorithm: str):
+        """
+        Returns the hash of the file, from the cache if the file is unchanged and has already
+        been hashed with the same algorithm. A file which changes while it is hashed is not
+        cached.
+
+        :param file_path: file path, or an entry of :func:`os.scandir`, whose cached status is
+            reused
+        :type file_path: str or os.DirEntry
+        :param algorithm: hash algorithm, see :func:`create_hasher<testguide_report_generator.util.File.create_hasher>`
+        :type algorithm: str
+        :return: hexadecimal digest
+        :rtype: str
+        """
+        identity = self.__get_identity(file_path)
+        if isinstance(file_path, os.DirEntry):
+            file_path = file_path.path
+        key = f"{algorithm}:{os.path.abspath(file_path)}"
+
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None and entry[:3] == identity:
+                self.__entries.move_to_end(key)
+                self.__hits += 1
+                return entry[3]
+            self.__misses += 1
+
+        digest = get_hash_from_file(file_path, algorithm)
+        if self.__get_identity(file_path) != identity:
+            # the digest may belong to neither version of the file
+            return digest
+        with self.__lock:
+            self.__entries[key] = [*identity, digest]
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__max_entries:
+                self.__entries.popitem(last=False)
+        return digest
+
+    @staticmethod
+    def __get_identity(file_path):
+        """
+        :return: size, modification time and inode of the file, which change with its content
+        :rtype: list
+        """
+        stat = get_stat_result(file_path)
+        return [stat.st_size, stat.st_mtime_ns, stat.st_ino]
+
+    def get_hits(self):
+        """
+        :return: number of hashes taken from the cache since the cache was created
+        :rtype: int
+        """
+        return self.__hits
+
+    def get_misses(self):
+        """
+        :return: number of files which had to be hashed since the cache was created
+        :rtype: int
+        """
+        return self.__misses
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def save(self):
+        """
+        Writes the cache to its file. The file is replaced atomically, so a concurrent or
+        interrupted run never leaves a partially written cache behind.
+        """
+        with self.__lock:
+            content = {"version": CACHE_FORMAT_VERSION, "entries": self.__entries}
+            temp_file_path = f"{self.__cache_file_path}.{os.getpid()}.tmp"
+            with open(temp_file_path, "w", encoding="utf-8") as file:
+                json.dump(content, file)
+        os.replace(temp_file_path, self.__cache_file_path)
+
+    def __load(self):
+        """
+        Loads the entries from the cache file. An unreadable cache file is ignored.
+        """
+        if not os.path.exists(self.__cache_file_path):
+            return
+
+        try:
+            with open(self.__cache_file_path, "r", encoding="utf-8") as file:
+                content = json.load(file)
+            if content.get("version") != CACHE_FORMAT_VERSION:
+                raise ValueError(f"unsupported version {content.get('version')}")
+            entries = content["entries"]
+        except (OSError, ValueError, KeyError, AttributeError) as error:
+            logging.warning(f"Hash cache '{self.__cache_file_path}' could not be read and is ignored: {error}")
+            return
+
+        for key, entry in list(entries.items())[-self.__max_entries:]:
+            self.__entries[key] = entry
@@ -23,3 +23,34 @@ class Json2AtxRepr(ABC):
         :rtype: dict
         """
         raise NotImplementedError("To be implemented")  # pragma: no cover
+
+    def create_lazy_json_repr(self):
+        """
+        Same as :meth:`create_json_repr`, but nested Json2AtxRepr objects may be returned as they
+        are instead of being translated. This allows serializing large object trees one element
+        after another.
+
+        :return: the JSON ATX representation, possibly containing untranslated children.
+        :rtype: dict
+        """
+        return self.create_json_repr()
+
+
+def resolve_json_repr(lazy_repr: dict) -> dict:
+    """
+    Translates all Json2AtxRepr objects contained in the values of a lazy JSON ATX representation.
+
+    :param lazy_repr: representation as returned by
+        :meth:`create_lazy_json_repr<Json2AtxRepr.create_lazy_json_repr>`
+    :type lazy_repr: dict
+    :return: the JSON ATX representation.
+    :rtype: dict
+    """
+    result = {}
+    for key, value in lazy_repr.items():
+        if isinstance(value, Json2AtxRepr):
+            value = value.create_json_repr()
+        elif isinstance(value, list):
+            value = [each.create_json_repr() if isinstance(each, Json2AtxRepr) else each for each in value]
+        result[key] = value
+    return result
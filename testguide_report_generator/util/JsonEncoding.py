@@ -0,0 +1,124 @@
+# Copyright (c) 2023-2024 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+# -*- coding: utf-8 -*-
+
+"""
+This module contains the JsonEncoding class.
+"""
+
+import importlib
+import json
+import logging
+from typing import Optional
+
+from testguide_report_generator.util.JsonStreamWriter import JsonStreamWriter
+
+BACKENDS = ("json", "orjson", "ujson", "auto")
+
+
+class JsonEncoding:
+    """
+    Determines how the `.json` report is encoded. By default, the report is indented by four spaces
+    and all non-ASCII characters are escaped. A compact encoding without indentation and escaping
+    is considerably smaller and faster to generate. Optionally, the fast third-party encoders
+    `orjson` or `ujson` are used if they are installed. Otherwise, the encoding falls back to the
+    json module of the standard library.
+    """
+
+    def __init__(self, indent: Optional[int] = 4, ensure_ascii: bool = True, backend: str = "json"):
+        """
+        Constructor
+
+        :param indent: number of spaces used for indentation, None for the most compact output
+        :type indent: int or None
+        :param ensure_ascii: set to False, to write non-ASCII characters as they are instead of
+            escaping them
+        :type ensure_ascii: bool
+        :param backend: "json" for the standard library, "orjson" or "ujson" for the respective
+            third-party encoder, or "auto" for the fastest installed encoder supporting the options
+        :type backend: str
+        :raises ValueError: backend is unknown
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Argument 'backend' must be one of {', '.join(BACKENDS)}. Was {backend}")
+
+        self.__indent = indent
+        self.__ensure_ascii = ensure_ascii
+        self.__backend, self.__dumps = self.__select_backend(backend)
+
+    @classmethod
+    def compact(cls, backend: str = "auto"):
+        """
+        :param backend: see constructor
+        :type backend: str
+        :return: encoding without indentation and escaping of non-ASCII characters
+        :rtype: JsonEncoding
+        """
+        return cls(indent=None, ensure_ascii=False, backend=backend)
+
+    def get_backend(self):
+        """
+        :return: name of the encoder which is actually used
+        :rtype: str
+        """
+        return self.__backend
+
+    def dumps(self, json_repr):
+        """
+        Encodes the given JSON representation.
+
+        :param json_repr: the JSON representation
+        :type json_repr: dict
+        :return: the encoded JSON
+        :rtype: str
+        """
+        return self.__dumps(json_repr)
+
+    def create_stream_writer(self):
+        """
+        :return: writer which produces the same encoding incrementally
+        :rtype: JsonStreamWriter
+        """
+        return JsonStreamWriter(self.__indent, self.__ensure_ascii)
+
+    def __select_backend(self, backend):
+        """
+        :return: name and encoding function of the first available backend
+        :rtype: tuple
+        """
+        candidates = ["orjson", "ujson"] if backend == "auto" else [backend]
+        for candidate in candidates:
+            if candidate == "json":
+                break
+            dumps = self.__load_backend(candidate)
+            if dumps is not None:
+                return candidate, dumps
+            if backend != "auto":
+                logging.warning(f"JSON encoder '{candidate}' is not installed or does not support the "
+                                f"requested options, falling back to 'json'.")
+
+        separators = (",", ":") if self.__indent is None else None
+        return "json", lambda json_repr: json.dumps(json_repr, indent=self.__indent, separators=separators,
+                                                    ensure_ascii=self.__ensure_ascii)
+
+    def __load_backend(self, name):
+        """
+        :return: encoding function of the third-party encoder, or None if it is not installed or
+            does not support the options
+        :rtype: Callable or None
+        """
+        try:
+            module = importlib.import_module(name)
+        except ImportError:
+            return None
+
+        if name == "orjson":
+            if self.__ensure_ascii or self.__indent not in (None, 2):
+                return None
+            option = module.OPT_INDENT_2 if self.__indent == 2 else 0
+            return lambda json_repr: module.dumps(json_repr, option=option).decode("utf-8")
+
+        return lambda json_repr: module.dumps(json_repr, indent=self.__indent or 0, ensure_ascii=self.__ensure_ascii,
+                                              escape_forward_slashes=False)
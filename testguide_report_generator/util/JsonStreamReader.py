@@ -0,0 +1,230 @@
+# Copyright (c) 2023-2024 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+# -*- coding: utf-8 -*-
+
+"""
+This module contains the JsonStreamReader class.
+"""
+
+import json
+import re
+
+READ_BUFFER_SIZE = 1024 * 1024
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class JsonStreamReader:
+    """
+    Reads a `.json` report incrementally. The testsuite, its testcase folders and their
+    `testcases` arrays are tokenized piece by piece, while each testcase is decoded as a whole
+    and handed out as soon as it is complete. Thus, only a single testcase has to be held in
+    memory, plus a placeholder reference per testcase for the structure of the report.
+    """
+
+    def __init__(self, file, placeholder=None):
+        """
+        Constructor
+
+        :param file: file object opened in text mode
+        :type file: TextIO
+        :param placeholder: value which replaces each testcase in the structure of the report
+        :type placeholder: object
+        """
+        self.__file = file
+        self.__placeholder = placeholder
+        self.__decoder = json.JSONDecoder()
+        self.__buffer = ""
+        self.__position = 0
+        # number of characters and lines dropped from the buffer, to report errors relative to
+        # the file
+        self.__offset = 0
+        self.__line = 0
+        self.__line_start = 0
+        self.__eof = False
+        self.__structure = None
+
+    def iter_testcases(self):
+        """
+        Reads the report and yields each testcase, i.e. each element of a `testcases` array which
+        does not contain a `testcases` array itself, once it has been decoded. Testcase folders
+        are not yielded, but their testcases are.
+
+        :raises json.JSONDecodeError: the file does not contain valid JSON
+        :return: generator of the path to the testcase in the report and the testcase
+        :rtype: Iterator[tuple[tuple, object]]
+        """
+        self.__skip_whitespace()
+        if self.__peek() == "{":
+            self.__structure = yield from self.__read_object((), False)
+        else:
+            self.__structure = self.__decode_value()
+        self.__skip_whitespace()
+        if self.__peek() != "":
+            self.__raise_error("Extra data")
+
+    def get_structure(self):
+        """
+        :return: the report read by :meth:`iter_testcases`, in which each testcase is replaced by
+            the placeholder
+        :rtype: object
+        """
+        return self.__structure
+
+    def __read_object(self, path, is_testcase):
+        """
+        Reads an object member by member and streams its `testcases` array.
+
+        :param path: path to the object in the report
+        :type path: tuple
+        :param is_testcase: True, if the object is an element of a `testcases` array
+        :type is_testcase: bool
+        :return: the object, the placeholder for a testcase
+        :rtype: object
+        """
+        self.__expect("{")
+        members: dict = {}
+        is_folder = False
+        self.__skip_whitespace()
+        if self.__peek() == "}":
+            self.__position += 1
+        else:
+            while True:
+                self.__skip_whitespace()
+                key = self.__decode_value()
+                if not isinstance(key, str):
+                    self.__raise_error("Expecting property name enclosed in double quotes")
+                self.__skip_whitespace()
+                self.__expect(":")
+                self.__skip_whitespace()
+                if key == "testcases" and self.__peek() == "[":
+                    members[key] = yield from self.__read_testcases((*path, key))
+                    is_folder = True
+                else:
+                    members[key] = self.__decode_value()
+                self.__skip_whitespace()
+                if self.__peek() == "}":
+                    self.__position += 1
+                    break
+                self.__expect(",")
+
+        if is_testcase and not is_folder:
+            yield path, members
+            return self.__placeholder
+        return members
+
+    def __read_testcases(self, path):
+        """
+        Reads a `testcases` array element by element.
+
+        :param path: path to the array in the report
+        :type path: tuple
+        :return: the array, in which each testcase is replaced by the placeholder
+        :rtype: list
+        """
+        self.__expect("[")
+        elements = []
+        self.__skip_whitespace()
+        if self.__peek() == "]":
+            self.__position += 1
+            return elements
+
+        while True:
+            self.__skip_whitespace()
+            element_path = (*path, len(elements))
+            if self.__peek() == "{":
+                elements.append((yield from self.__read_object(element_path, True)))
+            else:
+                yield element_path, self.__decode_value()
+                elements.append(self.__placeholder)
+            self.__skip_whitespace()
+            if self.__peek() == "]":
+                self.__position += 1
+                return elements
+            self.__expect(",")
+
+    def __decode_value(self):
+        """
+        Decodes the complete value at the current position, reading further data as needed.
+
+        :raises json.JSONDecodeError: the value is not valid JSON
+        :return: the value
+        :rtype: object
+        """
+        while True:
+            try:
+                value, end = self.__decoder.raw_decode(self.__buffer, self.__position)
+                # a number at the end of the buffer may continue in the next chunk
+                if end < len(self.__buffer) or self.__eof:
+                    self.__position = end
+                    return value
+            except json.JSONDecodeError as error:
+                if self.__eof:
+                    raise self.__create_error(error.msg, error.pos) from None
+            # reads at least as much as is buffered, so that large values are decoded only a few times
+            self.__read(max(READ_BUFFER_SIZE, len(self.__buffer) - self.__position))
+
+    def __read(self, size):
+        """
+        Appends the next chunk of the file to the buffer and drops the consumed data.
+        """
+        chunk = self.__file.read(size)
+        self.__eof = chunk == ""
+        newlines = self.__buffer.count("\n", 0, self.__position)
+        if newlines:
+            self.__line += newlines
+            self.__line_start = self.__offset + self.__buffer.rindex("\n", 0, self.__position) + 1
+        self.__offset += self.__position
+        self.__buffer = self.__buffer[self.__position:] + chunk
+        self.__position = 0
+
+    def __peek(self):
+        """
+        :return: the character at the current position, an empty string at the end of the file
+        :rtype: str
+        """
+        if self.__position == len(self.__buffer) and not self.__eof:
+            self.__read(READ_BUFFER_SIZE)
+        return self.__buffer[self.__position:self.__position + 1]
+
+    def __expect(self, character):
+        """
+        Consumes the expected character at the current position.
+
+        :raises json.JSONDecodeError: the current character is not the expected one
+        """
+        if self.__peek() != character:
+            self.__raise_error(f"Expecting '{character}' delimiter")
+        self.__position += 1
+
+    def __skip_whitespace(self):
+        while True:
+            self.__position = WHITESPACE.match(self.__buffer, self.__position).end()
+            if self.__position < len(self.__buffer) or self.__eof:
+                return
+            self.__read(READ_BUFFER_SIZE)
+
+    def __raise_error(self, message):
+        """
+        :raises json.JSONDecodeError: always, with the given message
+        """
+        raise self.__create_error(message, self.__position)
+
+    def __create_error(self, message, position):
+        """
+        :param message: description of the error
+        :type message: str
+        :param position: position of the error in the buffer
+        :type position: int
+        :return: error with the position, line and column in the file instead of the buffer
+        :rtype: json.JSONDecodeError
+        """
+        error = json.JSONDecodeError(message, self.__buffer, position)
+        newline = self.__buffer.rfind("\n", 0, position)
+        line_start = self.__line_start if newline < 0 else self.__offset + newline + 1
+        error.pos = self.__offset + position
+        error.lineno = self.__line + self.__buffer.count("\n", 0, position) + 1
+        error.colno = error.pos - line_start + 1
+        error.args = (f"{message}: line {error.lineno} column {error.colno} (char {error.pos})",)
+        return error
@@ -0,0 +1,126 @@
+# Copyright (c) 2023-2024 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+# -*- coding: utf-8 -*-
+
+"""
+This module contains the JsonStreamWriter class.
+"""
+
+import json
+from json.encoder import encode_basestring, encode_basestring_ascii
+from typing import Optional
+
+from testguide_report_generator.util.Json2AtxRepr import Json2AtxRepr
+
+WRITE_BUFFER_SIZE = 64 * 1024
+
+
+class JsonStreamWriter:
+    """
+    Serializes a tree of :class:`Json2AtxRepr<testguide_report_generator.util.Json2AtxRepr.Json2AtxRepr>`
+    objects incrementally. Each element is translated only when it is about to be written, so the
+    memory consumption does not grow with the size of the tree. The output is identical to
+    ``json.dumps(node.create_json_repr(), indent=indent, ensure_ascii=ensure_ascii)``, or to the
+    most compact output with ``separators=(",", ":")`` if indent is None.
+    """
+
+    def __init__(self, indent: Optional[int] = 4, ensure_ascii: bool = True):
+        """
+        Constructor
+
+        :param indent: number of spaces used for indentation, None for the most compact output
+        :type indent: int or None
+        :param ensure_ascii: set to False, to write non-ASCII characters as they are instead of
+            escaping them
+        :type ensure_ascii: bool
+        """
+        self.__indent = None if indent is None else " " * indent
+        self.__encode_string = encode_basestring_ascii if ensure_ascii else encode_basestring
+        self.__scalar_encoder = json.JSONEncoder()
+
+    def iterencode(self, node):
+        """
+        Encodes the given node piece by piece.
+
+        :param node: object to be serialized, usually a TestSuite
+        :type node: Json2AtxRepr or dict or list or str or int or float or bool or None
+        :return: generator of JSON string chunks
+        :rtype: Iterator[str]
+        """
+        return self.__iterencode(node, 0)
+
+    def write(self, node, *files):
+        """
+        Writes the JSON representation of the given node to one or more text files in a single
+        pass.
+
+        :param node: object to be serialized, usually a TestSuite
+        :type node: Json2AtxRepr or dict or list or str or int or float or bool or None
+        :param files: file objects opened in text mode
+        :type files: TextIO
+        """
+        buffer = []
+        buffered = 0
+        for chunk in self.iterencode(node):
+            buffer.append(chunk)
+            buffered += len(chunk)
+            if buffered >= WRITE_BUFFER_SIZE:
+                self.__write_to_all("".join(buffer), files)
+                buffer.clear()
+                buffered = 0
+        self.__write_to_all("".join(buffer), files)
+
+    @staticmethod
+    def __write_to_all(content, files):
+        for file in files:
+            file.write(content)
+
+    def __iterencode(self, value, level):
+        if isinstance(value, Json2AtxRepr):
+            value = value.create_lazy_json_repr()
+
+        if isinstance(value, str):
+            yield self.__encode_string(value)
+        elif isinstance(value, dict):
+            yield from self.__iterencode_dict(value, level)
+        elif isinstance(value, (list, tuple)):
+            yield from self.__iterencode_list(value, level)
+        else:
+            yield self.__scalar_encoder.encode(value)
+
+    def __iterencode_dict(self, value, level):
+        if not value:
+            yield "{}"
+            return
+
+        separator, item_separator, closing = self.__get_separators("{", "}", level)
+        key_separator = ":" if self.__indent is None else ": "
+        for key, item in value.items():
+            yield separator + self.__encode_string(key) + key_separator
+            yield from self.__iterencode(item, level + 1)
+            separator = item_separator
+        yield closing
+
+    def __iterencode_list(self, value, level):
+        if not value:
+            yield "[]"
+            return
+
+        separator, item_separator, closing = self.__get_separators("[", "]", level)
+        for item in value:
+            yield separator
+            yield from self.__iterencode(item, level + 1)
+            separator = item_separator
+        yield closing
+
+    def __get_separators(self, opening, closing, level):
+        """
+        :return: the string before the first item, between two items and after the last item
+        :rtype: tuple
+        """
+        if self.__indent is None:
+            return opening, ",", closing
+        newline_indent = "\n" + self.__indent * (level + 1)
+        return opening + newline_indent, "," + newline_indent, "\n" + self.__indent * level + closing
@@ -8,30 +8,375 @@
 This module contains the JsonValidator class.
 """
 
+import itertools
 import json
+import logging
+import math
+import sys
 import os
+import threading
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple, Optional
 
 import jsonschema
 
+from testguide_report_generator.model.Artifact import use_report_paths
+from testguide_report_generator.util.JsonStreamReader import JsonStreamReader
+from testguide_report_generator.util.SchemaCompiler import UnsupportedSchemaError, compile_validator
+
 DEFAULT_JSON_SCHEMA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..",
                                         "schema", "schema.json")
 
+# (schema path, kind) -> (modification time, (validator, compiled validator or None))
+_validator_cache: dict = {}
+_validator_cache_lock = threading.Lock()
+_STRUCTURE = "#structure"
+
+# longer messages are shortened by ValidationResult.print_issues, since they may contain a whole testcase
+MAX_PRINTED_MESSAGE_LENGTH = 300
+
+# placeholder which replaces an already validated TestCase when checking the report structure
+VALIDATED_TESTCASE_PLACEHOLDER = {"@type": "testcase"}
+
+# reports with fewer top-level testcases are validated in the calling process, since passing the
+# testcases to the processes takes longer than validating them
+MIN_PARALLEL_TESTCASES = 200
+
+
+def _get_placeholder_path(artifact):
+    """
+    :return: path with the shape of a path in the upload zip, which replaces the real path when a
+        single testcase is validated, so that lazy artifacts need not be hashed
+    :rtype: str
+    """
+    return f"{'0' * 32}/{artifact.get_name()}"
+
+
+def get_schema_validator(json_schema_file_path: str = DEFAULT_JSON_SCHEMA_PATH, definition: Optional[str] = None):
+    """
+    Returns a validator for the schema, which is shared by the whole process. The schema file is
+    only read again if it has been modified since.
+
+    :param json_schema_file_path: path to Json schema file
+    :type json_schema_file_path: str
+    :param definition: name of a definition of the schema, e.g. `TestCase`, to get a validator
+        for this sub-schema only, None for the complete report
+    :type definition: str or None
+    :raises KeyError: the schema does not contain the definition
+    :return: the validator
+    :rtype: jsonschema.Draft7Validator
+    """
+    return _get_cached_validators(json_schema_file_path, definition)[0]
+
+
+def get_compiled_validator(json_schema_file_path: str = DEFAULT_JSON_SCHEMA_PATH, definition: Optional[str] = None):
+    """
+    Returns a validator compiled from the schema into Python code, see
+    :func:`compile_validator<testguide_report_generator.util.SchemaCompiler.compile_validator>`,
+    which is shared by the whole process like :func:`get_schema_validator`.
+
+    :param json_schema_file_path: path to Json schema file
+    :type json_schema_file_path: str
+    :param definition: name of a definition of the schema, None for the complete report
+    :type definition: str or None
+    :raises KeyError: the schema does not contain the definition
+    :return: function which returns True if the given Json object is valid, or None if the
+        schema uses keywords which cannot be compiled
+    :rtype: Callable[[object], bool] or None
+    """
+    return _get_cached_validators(json_schema_file_path, definition)[1]
+
+
+def get_structure_validator(json_schema_file_path: str = DEFAULT_JSON_SCHEMA_PATH):
+    """
+    Returns a validator for the structure of the report, i.e. the testsuite and its
+    testcase folders, which is shared by the whole process. Each testcase is expected to be
+    replaced by :data:`VALIDATED_TESTCASE_PLACEHOLDER`, since it has already been validated on
+    its own.
+
+    :param json_schema_file_path: path to Json schema file
+    :type json_schema_file_path: str
+    :return: the validator
+    :rtype: jsonschema.Draft7Validator
+    """
+    return _get_cached_validators(json_schema_file_path, _STRUCTURE)[0]
+
+
+def clear_schema_validator_cache():
+    """
+    Removes all validators from the cache of :func:`get_schema_validator`.
+    """
+    with _validator_cache_lock:
+        _validator_cache.clear()
+
+
+class ValidationIssue(NamedTuple):
+    """
+    A schema violation, which, unlike a jsonschema error, can be passed between processes.
+    """
+
+    path: tuple
+    """absolute path to the invalid value in the report"""
+    message: str
+    """description of the violation"""
+    schema_path: tuple
+    """path to the violated keyword in the schema"""
+    context: tuple
+    """violations of the subschemas of `anyOf` and `oneOf`, sorted by their schema path"""
+
+
+def _create_issue(error, map_path):
+    """
+    :param error: the jsonschema error
+    :type error: jsonschema.ValidationError
+    :param map_path: function which maps the path of the error to the absolute path
+    :type map_path: Callable[[tuple], tuple]
+    :return: the issue corresponding to the error
+    :rtype: ValidationIssue
+    """
+    context = sorted(error.context, key=lambda e: e.schema_path)
+    return ValidationIssue(map_path(tuple(error.absolute_path)), error.message, tuple(error.schema_path),
+                           tuple(_create_issue(sub_error, map_path) for sub_error in context))
+
+
+def _validate_testcase_chunk(json_schema_file_path, start, chunk, max_issues=None):
+    """
+    Validates a chunk of the testcases array of a report in a worker process.
+
+    :param json_schema_file_path: path to Json schema file
+    :type json_schema_file_path: str
+    :param start: index of the first testcase of the chunk in the report
+    :type start: int
+    :param chunk: the testcases
+    :type chunk: list
+    :param max_issues: maximum number of returned issues, None for all
+    :type max_issues: int or None
+    :return: the issues, with absolute paths
+    :rtype: list
+    """
+    validator, compiled = _get_cached_validators(json_schema_file_path, "TestCases")
+    if compiled is not None and compiled(chunk):
+        return []
+
+    def map_path(path):
+        return ("testcases", start + path[0], *path[1:]) if path else ("testcases",)
+
+    return [_create_issue(error, map_path) for error in itertools.islice(validator.iter_errors(chunk), max_issues)]
+
+
+class ValidationResult:
+    """
+    Result of :meth:`JsonValidator.check_json`. The issues are only determined as far as they are
+    requested, e.g. :meth:`is_valid` stops validating at the first issue. Iterating the result
+    yields the issues in the order in which they are found, which is not necessarily the order of
+    their paths.
+    """
+
+    def __init__(self, issues, max_issues: Optional[int] = None):
+        """
+        Constructor.
+
+        :param issues: iterator of the issues, which is consumed lazily
+        :type issues: Iterator[ValidationIssue]
+        :param max_issues: maximum number of issues, None for all
+        :type max_issues: int or None
+        """
+
+        self.__pending = issues
+        self.__issues: list[ValidationIssue] = []
+        self.__max_issues = max_issues
+        self.__truncated: bool | None = None
+
+    def __iter__(self):
+        index = 0
+        while True:
+            if index == len(self.__issues) and not self.__fetch():
+                return
+            yield self.__issues[index]
+            index += 1
+
+    def __bool__(self):
+        return self.is_valid()
+
+    def is_valid(self):
+        """
+        :return: true if the validation was successful, otherwise false
+        :rtype: boolean
+        """
+        return not self.__issues and not self.__fetch()
+
+    def get_issues(self):
+        """
+        :return: the schema violations, at most the maximum number of issues
+        :rtype: list[ValidationIssue]
+        """
+        return list(self)
+
+    def is_truncated(self):
+        """
+        :return: True, if there are more issues than the maximum number of issues
+        :rtype: bool
+        """
+        if self.__truncated is None:
+            self.get_issues()
+            self.__truncated = self.__pending is not None and next(self.__pending, None) is not None
+            self.__close()
+        return self.__truncated
+
+    def print_issues(self, file=None):
+        """
+        Prints the issues, one line per issue and indented lines for the issues of its subschemas.
+        Long messages are shortened.
+
+        :param file: text stream, by default stdout
+        :type file: TextIO or None
+        """
+        file = file or sys.stdout
+        for issue in self:
+            self.__print_issue(issue, 0, file)
+        if self.is_truncated():
+            print(f"Stopped after {self.__max_issues} issues.", file=file)
+
+    @staticmethod
+    def __print_issue(issue, depth, file):
+        message = issue.message
+        if len(message) > MAX_PRINTED_MESSAGE_LENGTH:
+            message = f"{message[:MAX_PRINTED_MESSAGE_LENGTH - 3]}..."
+        print(f"{'  ' * depth}{'/'.join(map(str, issue.path))}: {message}", file=file)
+        for sub_issue in issue.context:
+            ValidationResult.__print_issue(sub_issue, depth + 1, file)
+
+    def __fetch(self):
+        """
+        Fetches the next issue, unless the maximum number of issues has been reached.
+
+        :return: False, if there are no further issues
+        :rtype: bool
+        """
+        if self.__pending is None:
+            return False
+        if self.__max_issues is not None and len(self.__issues) >= self.__max_issues:
+            return False
+        issue = next(self.__pending, None)
+        if issue is None:
+            self.__truncated = False
+            self.__close()
+            return False
+        self.__issues.append(issue)
+        return True
+
+    def __close(self):
+        """
+        Stops the validation, e.g. cancels pending chunks of a parallel validation.
+        """
+        if self.__pending is not None and hasattr(self.__pending, "close"):
+            self.__pending.close()
+        self.__pending = None
+
+
+def _shutdown_executor(executor):
+    """
+    Stops the processes of the executor without waiting for the chunks which have not been
+    started yet. Python 3.8 cannot cancel them on shutdown, so there they are only cancelled by
+    the generator which submitted them, when it is closed.
+
+    :param executor: the process pool
+    :type executor: ProcessPoolExecutor
+    """
+    if sys.version_info >= (3, 9):
+        executor.shutdown(cancel_futures=True)
+    else:
+        executor.shutdown()
+
+
+def _get_cached_validators(json_schema_file_path, kind):
+    """
+    :return: the cached validator of the given kind, created from the current schema file, and
+        its compiled counterpart, or None if the schema cannot be compiled
+    :rtype: tuple
+    """
+    path = os.path.abspath(json_schema_file_path)
+    mtime = os.stat(path).st_mtime_ns
+    with _validator_cache_lock:
+        cached = _validator_cache.get((path, kind))
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with open(path, 'r', encoding='utf-8') as file:
+        schema = json.loads(file.read())
+    if kind == _STRUCTURE:
+        schema["definitions"]["TestCase"] = {"const": VALIDATED_TESTCASE_PLACEHOLDER}
+    elif kind is not None:
+        if kind not in schema.get("definitions", {}):
+            raise KeyError(f"The schema '{path}' does not contain the definition '{kind}'.")
+        schema = {"$ref": f"#/definitions/{kind}", "definitions": schema["definitions"]}
+    try:
+        compiled = compile_validator(schema)
+    except UnsupportedSchemaError as error:
+        logging.debug(f"Schema '{path}' is validated without compiled validator: {error}")
+        compiled = None
+    validators = (jsonschema.Draft7Validator(schema), compiled)
+    with _validator_cache_lock:
+        _validator_cache[(path, kind)] = (mtime, validators)
+    return validators
+
 
 class JsonValidator:
     """
     Validator for the Json2Atx file.
     """
 
-    def __init__(self, json_schema_file_path: str = DEFAULT_JSON_SCHEMA_PATH):
+    def __init__(self, json_schema_file_path: str = DEFAULT_JSON_SCHEMA_PATH, processes: int = 1):
         """
         Constructor.
 
         :param json_schema_file_path: path to Json schema file
         :type json_schema_file_path: str
+        :param processes: number of processes which validate the testcases of a report
+            concurrently with :meth:`validate_json` and :meth:`validate_file`. Valid reports are
+            usually recognized by the validator compiled from the schema without starting any
+            process, so the processes mainly speed up finding the errors of large invalid reports,
+            or validating against schemas which cannot be compiled. Reports with fewer than
+            :data:`MIN_PARALLEL_TESTCASES` top-level testcases are validated in the calling
+            process. The processes are started when they are needed first and are kept until
+            :meth:`close` is called.
+        :type processes: int
+        :raises ValueError: processes is less than 1
         """
 
-        with open(json_schema_file_path, 'r', encoding='utf-8') as file:
-            self.__schema = json.loads(file.read())
+        if processes < 1:
+            raise ValueError(f"The number of processes must be at least 1. Was {processes}")
+        self.__json_schema_file_path = os.path.abspath(json_schema_file_path)
+        self.__processes = processes
+        self.__validators = _get_cached_validators(json_schema_file_path, None)
+        self.__testcase_validators = None
+        self.__testcase_results: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self.__lock = threading.Lock()
+        self.__executor: ProcessPoolExecutor | None = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Stops the processes of the validator. The validator remains usable and starts new
+        processes when they are needed again.
+        """
+        with self.__lock:
+            executor, self.__executor = self.__executor, None
+        if executor is not None:
+            _shutdown_executor(executor)
+
+    def get_json_schema_file_path(self):
+        """
+        :return: absolute path to the Json schema file
+        :rtype: str
+        """
+        return self.__json_schema_file_path
 
     def validate_file(self, json_file_path: str):
         """
@@ -46,13 +391,7 @@ class JsonValidator:
         with open(json_file_path, 'r', encoding='utf-8') as file:
             json_content = json.loads(file.read())
 
-        validator = jsonschema.Draft7Validator(self.__schema)
-        errors = sorted(validator.iter_errors(json_content), key=lambda e: e.path)
-        for error in errors:
-            for sub_error in sorted(error.context, key=lambda e: e.schema_path):
-                print(list(sub_error.schema_path), sub_error.message, sep=", ")
-
-        return len(errors) == 0
+        return self.validate_json(json_content)
 
     def validate_json(self, json_object: dict):
         """
@@ -64,7 +403,248 @@ class JsonValidator:
         :rtype: boolean
         """
 
-        validator = jsonschema.Draft7Validator(self.__schema)
+        if self.__uses_processes(json_object):
+            issues = self.find_issues_parallel(json_object)
+            for issue in issues:
+                for sub_issue in issue.context:
+                    print(list(sub_issue.schema_path), sub_issue.message, sep=", ")
+            return len(issues) == 0
+
+        return self.__check(self.__validators, json_object)
+
+    def check_json(self, json_object: dict, max_issues: Optional[int] = None, fail_fast: bool = False):
+        """
+        Validates the given json object against the schema without printing anything. The
+        validation only proceeds as far as the returned result is evaluated.
+
+        :param json_object: dictionary which represents json formatted data
+        :type json_object: dict
+        :param max_issues: maximum number of reported issues, None for all
+        :type max_issues: int or None
+        :param fail_fast: set to True, to stop at the first issue, same as max_issues=1
+        :type fail_fast: bool
+        :raises ValueError: max_issues is less than 1
+        :return: the validation result
+        :rtype: ValidationResult
+        """
+
+        if fail_fast:
+            max_issues = 1
+        if max_issues is not None and max_issues < 1:
+            raise ValueError(f"Argument 'max_issues' must be at least 1. Was {max_issues}")
+        return ValidationResult(self.__iter_issues(json_object, max_issues), max_issues)
+
+    def check_file(self, json_file_path: str, max_issues: Optional[int] = None, fail_fast: bool = False,
+                   streaming: bool = False):
+        """
+        Validates the given json file against the schema without printing anything, see
+        :meth:`check_json`.
+
+        :param json_file_path: path to generated json schema
+        :type json_file_path: str
+        :param max_issues: maximum number of reported issues, None for all
+        :type max_issues: int or None
+        :param fail_fast: set to True, to stop at the first issue, same as max_issues=1
+        :type fail_fast: bool
+        :param streaming: set to True, to read the file incrementally and validate each testcase
+            as soon as it has been read, so that only a single testcase is held in memory. The
+            issues of the testcases are found first, followed by the issues of the remaining report.
+            A file which is not valid JSON raises the error only when the result is evaluated.
+        :type streaming: bool
+        :raises ValueError: max_issues is less than 1
+        :raises json.JSONDecodeError: the file does not contain valid JSON
+        :return: the validation result
+        :rtype: ValidationResult
+        """
+
+        if not streaming or self.__validators[0].schema.get("properties", {}).get("testcases") \
+                != {"$ref": "#/definitions/TestCases"}:
+            with open(json_file_path, 'r', encoding='utf-8') as file:
+                json_content = json.loads(file.read())
+            return self.check_json(json_content, max_issues, fail_fast)
+
+        if fail_fast:
+            max_issues = 1
+        if max_issues is not None and max_issues < 1:
+            raise ValueError(f"Argument 'max_issues' must be at least 1. Was {max_issues}")
+        return ValidationResult(self.__iter_file_issues(json_file_path), max_issues)
+
+    def find_issues_parallel(self, json_object: dict, chunk_size: Optional[int] = None):
+        """
+        Validates the given json object against the schema. The top-level testcases are split into
+        chunks, which are validated concurrently by the processes of the validator, while the
+        remaining report is validated in the calling process. Small reports are validated in the
+        calling process only, see :data:`MIN_PARALLEL_TESTCASES`.
+
+        :param json_object: dictionary which represents json formatted data
+        :type json_object: dict
+        :param chunk_size: number of testcases per chunk, by default four chunks per process
+        :type chunk_size: int or None
+        :return: the schema violations, sorted by their path in the report
+        :rtype: list[ValidationIssue]
+        """
+
+        return sorted(self.__iter_issues(json_object, None, chunk_size), key=lambda issue: issue.path)
+
+    def __iter_issues(self, json_object, max_issues, chunk_size=None):
+        """
+        :return: generator of the schema violations, in the processes of the validator if there
+            is more than one
+        :rtype: Iterator[ValidationIssue]
+        """
+
+        validator, compiled = self.__validators
+        if compiled is not None and compiled(json_object):
+            return
+        if not self.__uses_processes(json_object):
+            yield from (_create_issue(error, tuple) for error in validator.iter_errors(json_object))
+            return
+
+        testcases = json_object["testcases"]
+        structure = {**json_object, "testcases": [VALIDATED_TESTCASE_PLACEHOLDER] * len(testcases)}
+        structure_validator = _get_cached_validators(self.__json_schema_file_path, _STRUCTURE)[0]
+        yield from (_create_issue(error, tuple) for error in structure_validator.iter_errors(structure))
+
+        chunk_size = chunk_size or math.ceil(len(testcases) / (self.__processes * 4))
+        executor = self.__get_executor()
+        futures = [executor.submit(_validate_testcase_chunk, self.__json_schema_file_path, start,
+                                   testcases[start:start + chunk_size], max_issues)
+                   for start in range(0, len(testcases), chunk_size)]
+        try:
+            for future in futures:
+                yield from future.result()
+        finally:
+            # skips the remaining chunks, if the generator is closed early
+            for future in futures:
+                future.cancel()
+
+    def __get_executor(self):
+        """
+        :return: the process pool of the validator, which is created on the first call
+        :rtype: ProcessPoolExecutor
+        """
+        with self.__lock:
+            if self.__executor is None:
+                self.__executor = ProcessPoolExecutor(max_workers=self.__processes)
+                # the processes are stopped at the latest when the validator is garbage collected
+                weakref.finalize(self, _shutdown_executor, self.__executor)
+            return self.__executor
+
+    def __iter_file_issues(self, json_file_path):
+        """
+        :return: generator of the schema violations of the file, which is read incrementally
+        :rtype: Iterator[ValidationIssue]
+        """
+
+        validator, compiled = _get_cached_validators(self.__json_schema_file_path, "TestCases")
+        with open(json_file_path, 'r', encoding='utf-8') as file:
+            reader = JsonStreamReader(file, VALIDATED_TESTCASE_PLACEHOLDER)
+            for path, testcase in reader.iter_testcases():
+                if compiled is not None and compiled([testcase]):
+                    continue
+                # the testcase is validated as the only element of a testcases array
+                yield from (_create_issue(error, lambda error_path, prefix=path: (*prefix, *error_path[1:]))
+                            for error in validator.iter_errors([testcase]))
+
+        structure_validator, structure_compiled = _get_cached_validators(self.__json_schema_file_path, _STRUCTURE)
+        structure = reader.get_structure()
+        if structure_compiled is None or not structure_compiled(structure):
+            yield from (_create_issue(error, tuple) for error in structure_validator.iter_errors(structure))
+
+    def __uses_processes(self, json_object):
+        """
+        :return: True, if the validator has several processes, the report has enough testcases
+            and the schema validates them with the `TestCases` definition, which can be applied to
+            parts of the testcases
+        :rtype: bool
+        """
+
+        schema = self.__validators[0].schema
+        return self.__processes > 1 and isinstance(json_object, dict) \
+            and isinstance(json_object.get("testcases"), list) \
+            and len(json_object["testcases"]) >= max(MIN_PARALLEL_TESTCASES, 1) \
+            and schema.get("properties", {}).get("testcases") == {"$ref": "#/definitions/TestCases"}
+
+    def supports_testcase_validation(self):
+        """
+        :return: True, if the schema contains a `TestCase` definition, so that single testcases
+            can be validated with :meth:`validate_testcase` and :meth:`validate_structure`
+        :rtype: bool
+        """
+
+        return "TestCase" in self.__validators[0].schema.get("definitions", {})
+
+    def validate_testcase(self, testcase):
+        """
+        Validates a single testcase against the `TestCase` definition of the schema. The result
+        is cached, so each testcase is only validated again by this validator after it has been
+        modified by its own methods, see
+        :meth:`get_modification_count<testguide_report_generator.model.TestCase.TestCase.get_modification_count>`.
+        Its teststeps must not be modified after it has been validated. The artifacts are
+        validated with placeholder paths, so that lazy artifacts are not hashed.
+
+        :param testcase: the testcase to be validated
+        :type testcase: :class:`TestCase<testguide_report_generator.model.TestCase.TestCase>`
+        :return: true if the validation was successful, otherwise false
+        :rtype: boolean
+        """
+
+        result = self.get_testcase_result(testcase)
+        if result is not None:
+            return result
+
+        modification_count = testcase.get_modification_count()
+        if self.__testcase_validators is None:
+            self.__testcase_validators = _get_cached_validators(self.__json_schema_file_path, "TestCase")
+        with use_report_paths(_get_placeholder_path):
+            json_repr = testcase.create_json_repr()
+        result = self.__check(self.__testcase_validators, json_repr)
+        with self.__lock:
+            self.__testcase_results[testcase] = (modification_count, result)
+        return result
+
+    def get_testcase_result(self, testcase):
+        """
+        :param testcase: the testcase
+        :type testcase: :class:`TestCase<testguide_report_generator.model.TestCase.TestCase>`
+        :return: the cached result of :meth:`validate_testcase`, or None if the testcase has not
+            been validated yet or has been modified since
+        :rtype: boolean or None
+        """
+        with self.__lock:
+            modification_count, result = self.__testcase_results.get(testcase, (None, None))
+        return result if modification_count == testcase.get_modification_count() else None
+
+    def validate_structure(self, json_object: dict):
+        """
+        Validates the given json object against the schema, but accepts
+        :data:`VALIDATED_TESTCASE_PLACEHOLDER` for each testcase, which has been validated by
+        :meth:`validate_testcase` beforehand.
+
+        :param json_object: dictionary which represents json formatted data
+        :type json_object: dict
+        :return: true if the validation was successful, otherwise false
+        :rtype: boolean
+        """
+
+        return self.__check(_get_cached_validators(self.__json_schema_file_path, _STRUCTURE), json_object)
+
+    @staticmethod
+    def __check(validators, json_object):
+        """
+        Validates the json object with the compiled validator. Only if it fails, the jsonschema
+        validator is used to find and print the errors.
+
+        :param validators: jsonschema validator and compiled validator, or None
+        :type validators: tuple
+        :return: true if the validation was successful, otherwise false
+        :rtype: boolean
+        """
+
+        validator, compiled = validators
+        if compiled is not None and compiled(json_object):
+            return True
+
         errors = sorted(validator.iter_errors(json_object), key=lambda e: e.path)
         for error in errors:
             for sub_error in sorted(error.context, key=lambda e: e.schema_path):
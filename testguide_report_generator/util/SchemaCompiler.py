@@ -0,0 +1,329 @@
+# Copyright (c) 2023-2024 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+# -*- coding: utf-8 -*-
+
+"""
+Compiles a Draft 7 Json schema into specialized Python code, which only decides whether a Json
+object is valid. It is considerably faster than a generic jsonschema validator, but does not
+report any errors. Only the keywords used by the test.guide schema are supported.
+"""
+
+import numbers
+import re
+from typing import Optional
+
+# keywords which do not affect the validation
+ANNOTATION_KEYWORDS = {"$schema", "$id", "$comment", "title", "description", "default", "examples", "definitions"}
+
+TYPE_CHECKS = {
+    "string": "isinstance({0}, str)",
+    "integer": "(isinstance({0}, int) and not isinstance({0}, bool) "
+               "or isinstance({0}, float) and {0}.is_integer())",
+    "number": "(isinstance({0}, numbers.Number) and not isinstance({0}, bool))",
+    "boolean": "isinstance({0}, bool)",
+    "null": "{0} is None",
+    "array": "isinstance({0}, list)",
+    "object": "isinstance({0}, dict)",
+}
+
+# keywords which only apply to instances of the given type
+STRING_KEYWORDS = ("minLength", "maxLength", "pattern")
+NUMBER_KEYWORDS = ("minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum")
+ARRAY_KEYWORDS = ("minItems", "maxItems", "items")
+OBJECT_KEYWORDS = ("required", "properties")
+
+SUPPORTED_KEYWORDS = {"type", "$ref", "anyOf", "oneOf", "allOf", "const", "enum",
+                      *STRING_KEYWORDS, *NUMBER_KEYWORDS, *ARRAY_KEYWORDS, *OBJECT_KEYWORDS}
+
+
+class UnsupportedSchemaError(ValueError):
+    """
+    Raised if the schema uses a keyword or construct which cannot be compiled.
+    """
+
+
+def equal(one, two):
+    """
+    Compares two Json values like jsonschema does for `const` and `enum`, i.e. booleans are not
+    equal to numbers.
+
+    :return: True, if the values are equal
+    :rtype: bool
+    """
+    if isinstance(one, bool) or isinstance(two, bool):
+        return isinstance(one, bool) and isinstance(two, bool) and one == two
+    if isinstance(one, dict) and isinstance(two, dict):
+        return one.keys() == two.keys() and all(equal(one[key], two[key]) for key in one)
+    if isinstance(one, list) and isinstance(two, list):
+        return len(one) == len(two) and all(equal(item_one, item_two) for item_one, item_two in zip(one, two))
+    if isinstance(one, (dict, list)) or isinstance(two, (dict, list)):
+        return False
+    return one == two
+
+
+def generate_validator_source(schema, definition: Optional[str] = None):
+    """
+    Generates the Python source code of a validator for the schema.
+
+    :param schema: the Json schema
+    :type schema: dict
+    :param definition: name of a definition of the schema to be validated instead of the root
+    :type definition: str or None
+    :raises UnsupportedSchemaError: the schema cannot be compiled
+    :return: the source code, which defines the function `validate(value) -> bool`, and the
+        constants it refers to
+    :rtype: tuple
+    """
+    generator = _SourceGenerator(schema)
+    if definition is None:
+        entry = generator.get_function(schema)
+    else:
+        entry = generator.get_function({"$ref": f"#/definitions/{definition}"})
+    return generator.get_source(entry), generator.get_constants()
+
+
+def compile_validator(schema, definition: Optional[str] = None):
+    """
+    Compiles a validator for the schema.
+
+    :param schema: the Json schema
+    :type schema: dict
+    :param definition: name of a definition of the schema to be validated instead of the root
+    :type definition: str or None
+    :raises UnsupportedSchemaError: the schema cannot be compiled
+    :return: function, which returns True if the given Json object is valid
+    :rtype: Callable[[object], bool]
+    """
+    source, constants = generate_validator_source(schema, definition)
+    namespace = {"numbers": numbers, "equal": equal, **constants}
+    exec(compile(source, "<compiled json schema>", "exec"), namespace)  # pylint: disable=exec-used
+    return namespace["validate"]
+
+
+class _SourceGenerator:
+    """
+    Generates one function per schema node. References to definitions are compiled to calls of
+    the function of the definition, which also supports recursive definitions.
+    """
+
+    def __init__(self, schema):
+        self.__schema = schema
+        self.__functions: dict = {}
+        self.__definitions: dict = {}
+        self.__lines: list = ["def _valid(value):", "    return True", "",
+                              "def _invalid(value):", "    return False", ""]
+        self.__constants: dict = {}
+
+    def get_source(self, entry):
+        """
+        :return: source code of all generated functions
+        :rtype: str
+        """
+        return "\n".join([*self.__lines, f"validate = {entry}", ""])
+
+    def get_constants(self):
+        """
+        :return: constants referenced by the generated source code
+        :rtype: dict
+        """
+        return self.__constants
+
+    def get_function(self, node):
+        """
+        :return: name of the function which validates the schema node
+        :rtype: str
+        """
+        if node is True:
+            return "_valid"
+        if node is False:
+            return "_invalid"
+        if not isinstance(node, dict):
+            raise UnsupportedSchemaError(f"Schema must be an object or boolean. Was {node!r}")
+
+        if set(node) - ANNOTATION_KEYWORDS == {"$ref"}:
+            return self.__get_definition(node["$ref"])
+
+        key = id(node)
+        if key not in self.__functions:
+            name = f"_node_{len(self.__functions)}"
+            self.__functions[key] = name
+            body = self.__generate_body(node)
+            self.__lines += [f"def {name}(value):", *[f"    {line}" for line in body], "    return True", ""]
+        return self.__functions[key]
+
+    def __get_definition(self, reference):
+        """
+        :return: name of the function which validates the referenced definition
+        :rtype: str
+        """
+        prefix = "#/definitions/"
+        name = reference[len(prefix):] if isinstance(reference, str) and reference.startswith(prefix) else None
+        if not name or "/" in name or name not in self.__schema.get("definitions", {}):
+            raise UnsupportedSchemaError(f"Unsupported reference '{reference}'")
+
+        if name not in self.__definitions:
+            function = f"_definition_{len(self.__definitions)}"
+            self.__definitions[name] = function
+            target = self.get_function(self.__schema["definitions"][name])
+            # the target has been defined by now, even for recursive definitions
+            self.__lines += [f"{function} = {target}", ""]
+        return self.__definitions[name]
+
+    def __add_constant(self, value):
+        """
+        :return: name under which the value is available to the generated code
+        :rtype: str
+        """
+        name = f"_constant_{len(self.__constants)}"
+        self.__constants[name] = value
+        return name
+
+    def __generate_body(self, node):
+        """
+        :return: lines of code, which return False if the value does not match the node
+        :rtype: list
+        """
+        unsupported = set(node) - SUPPORTED_KEYWORDS - ANNOTATION_KEYWORDS
+        if "$ref" in node or unsupported:
+            # in Draft 7, keywords next to $ref are ignored, which is supported above only
+            raise UnsupportedSchemaError(f"Unsupported keywords {sorted(unsupported or {'$ref'})}")
+
+        body = []
+        types = None
+        if "type" in node:
+            types = set(node["type"] if isinstance(node["type"], list) else [node["type"]])
+            if not types or any(type_name not in TYPE_CHECKS for type_name in types):
+                raise UnsupportedSchemaError(f"Unsupported type {node['type']!r}")
+            checks = [TYPE_CHECKS[type_name].format("value") for type_name in sorted(types)]
+            body.append(f"if not ({' or '.join(checks)}):")
+            body.append("    return False")
+
+        body += self.__generate_value_checks(node)
+        body += self.__generate_combination_checks(node)
+        body += self.__generate_guarded(types, {"string"}, self.__generate_string_checks(node))
+        body += self.__generate_guarded(types, {"integer", "number"}, self.__generate_number_checks(node))
+        body += self.__generate_guarded(types, {"array"}, self.__generate_array_checks(node))
+        body += self.__generate_guarded(types, {"object"}, self.__generate_object_checks(node))
+        return body
+
+    @staticmethod
+    def __generate_guarded(types, applicable_types, checks):
+        """
+        :param types: the types allowed by the node, or None if the node does not restrict them
+        :param applicable_types: the types to which the checks apply
+        :return: the checks, which are only executed for values of the applicable types. The
+            guard is omitted if the type check of the node already ensures it.
+        :rtype: list
+        """
+        if not checks or (types is not None and not types & applicable_types):
+            return []
+        if types is not None and types <= applicable_types:
+            return checks
+        condition = " or ".join(TYPE_CHECKS[type_name].format("value") for type_name in sorted(applicable_types)
+                                if type_name != "integer")
+        return [f"if {condition}:", *[f"    {line}" for line in checks]]
+
+    def __generate_value_checks(self, node):
+        """
+        :return: lines of code for the keywords which compare the value with constants
+        :rtype: list
+        """
+        body = []
+        if "const" in node:
+            if isinstance(node["const"], str):
+                body.append(f"if not (isinstance(value, str) and value == {node['const']!r}):")
+            else:
+                body.append(f"if not equal(value, {self.__add_constant(node['const'])}):")
+            body.append("    return False")
+        if "enum" in node:
+            if not isinstance(node["enum"], list):
+                raise UnsupportedSchemaError(f"Unsupported enum {node['enum']!r}")
+            if all(isinstance(item, str) for item in node["enum"]):
+                items = self.__add_constant(frozenset(node["enum"]))
+                body.append(f"if not (isinstance(value, str) and value in {items}):")
+            else:
+                body.append(f"if not any(equal(value, item) for item in {self.__add_constant(node['enum'])}):")
+            body.append("    return False")
+        return body
+
+    def __generate_combination_checks(self, node):
+        """
+        :return: lines of code for the keywords which combine subschemas
+        :rtype: list
+        """
+        body = []
+        for keyword, operator in (("allOf", "all"), ("anyOf", "any"), ("oneOf", None)):
+            if keyword not in node:
+                continue
+            if not isinstance(node[keyword], list) or not node[keyword]:
+                raise UnsupportedSchemaError(f"Unsupported {keyword} {node[keyword]!r}")
+            calls = [f"{self.get_function(subschema)}(value)" for subschema in node[keyword]]
+            if operator == "all":
+                body.append(f"if not ({' and '.join(calls)}):")
+            elif operator == "any":
+                body.append(f"if not ({' or '.join(calls)}):")
+            else:
+                body.append(f"if sum(({', '.join(calls)},)) != 1:")
+            body.append("    return False")
+        return body
+
+    def __generate_string_checks(self, node):
+        """
+        :return: lines of code for the keywords which apply to strings
+        :rtype: list
+        """
+        body = []
+        if "minLength" in node:
+            body += [f"if len(value) < {int(node['minLength'])}:", "    return False"]
+        if "maxLength" in node:
+            body += [f"if len(value) > {int(node['maxLength'])}:", "    return False"]
+        if "pattern" in node:
+            pattern = self.__add_constant(re.compile(node["pattern"]))
+            body += [f"if not {pattern}.search(value):", "    return False"]
+        return body
+
+    def __generate_number_checks(self, node):
+        """
+        :return: lines of code for the keywords which apply to numbers
+        :rtype: list
+        """
+        body = []
+        for keyword, operator in (("minimum", "<"), ("maximum", ">"),
+                                  ("exclusiveMinimum", "<="), ("exclusiveMaximum", ">=")):
+            if keyword in node:
+                if not isinstance(node[keyword], numbers.Number) or isinstance(node[keyword], bool):
+                    raise UnsupportedSchemaError(f"Unsupported {keyword} {node[keyword]!r}")
+                body += [f"if value {operator} {node[keyword]!r}:", "    return False"]
+        return body
+
+    def __generate_array_checks(self, node):
+        """
+        :return: lines of code for the keywords which apply to arrays
+        :rtype: list
+        """
+        body = []
+        if "minItems" in node:
+            body += [f"if len(value) < {int(node['minItems'])}:", "    return False"]
+        if "maxItems" in node:
+            body += [f"if len(value) > {int(node['maxItems'])}:", "    return False"]
+        if "items" in node:
+            if isinstance(node["items"], list):
+                raise UnsupportedSchemaError("Tuple validation with 'items' is not supported")
+            body += [f"if not all(map({self.get_function(node['items'])}, value)):", "    return False"]
+        return body
+
+    def __generate_object_checks(self, node):
+        """
+        :return: lines of code for the keywords which apply to objects
+        :rtype: list
+        """
+        body = []
+        if node.get("required"):
+            missing = " or ".join(f"{key!r} not in value" for key in node["required"])
+            body += [f"if {missing}:", "    return False"]
+        for key, subschema in node.get("properties", {}).items():
+            function = self.get_function(subschema)
+            body += [f"if {key!r} in value and not {function}(value[{key!r}]):", "    return False"]
+        return body
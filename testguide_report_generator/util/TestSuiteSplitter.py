@@ -0,0 +1,191 @@
+# Copyright (c) 2023-2024 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+# -*- coding: utf-8 -*-
+
+"""
+This module contains methods to split a TestSuite into several smaller, self-contained TestSuites.
+"""
+
+from typing import Optional
+
+from testguide_report_generator.model.TestCaseFolder import TestCaseFolder
+from testguide_report_generator.model.TestSuite import TestSuite
+from testguide_report_generator.util.JsonEncoding import JsonEncoding
+
+
+def split_testsuite(testsuite: TestSuite, max_testcases: Optional[int] = None, max_bytes: Optional[int] = None,
+                    json_encoding: Optional[JsonEncoding] = None):
+    """
+    Splits the testsuite into several testsuites with the same name and timestamp. The testcases
+    keep their order and their TestCaseFolder hierarchy. A single testcase which exceeds the
+    budget on its own is put into a testsuite of its own.
+
+    :param testsuite: the testsuite to split
+    :type testsuite: TestSuite
+    :param max_testcases: maximum number of testcases per testsuite, None for no limit
+    :type max_testcases: int or None
+    :param max_bytes: maximum size of the UTF-8 encoded `.json` report, including the testsuite
+        and its TestCaseFolders, plus the uncompressed size of the artifacts per testsuite, None
+        for no limit
+    :type max_bytes: int or None
+    :param json_encoding: encoding of the `.json` reports, which determines their size, by
+        default indented by four spaces
+    :type json_encoding: JsonEncoding or None
+    :raises ValueError: neither max_testcases nor max_bytes is given, or one of them is less than 1
+    :return: list of TestSuite
+    :rtype: list
+    """
+    _check_limits(max_testcases, max_bytes)
+    encoding = json_encoding or JsonEncoding()
+    suite_bytes = 0
+    if max_bytes is not None:
+        suite_bytes = _encoded_size(encoding, {**testsuite.create_lazy_json_repr(), "testcases": [None]}) - len("null")
+
+    shards: list[list] = []
+    shard_bytes = 0
+    shard_artifacts: set[str] = set()
+    # the testsuite and the TestCaseFolders of the shard, whose testcases arrays are not empty
+    shard_parents: set = set()
+    for folders, testcase in _flatten(testsuite.get_testcases()):
+        json_bytes = 0
+        if max_bytes is not None:
+            json_bytes = _element_size(encoding, testcase.create_json_repr(), len(folders))
+        testcase_bytes = json_bytes + _structure_bytes(encoding, testsuite, folders, shard_parents, max_bytes) + \
+            _artifact_bytes(testcase, shard_artifacts, max_bytes)
+
+        is_full = bool(shards) and (
+            (max_testcases is not None and len(shards[-1]) >= max_testcases)
+            or (max_bytes is not None and shard_bytes + testcase_bytes > max_bytes)
+        )
+        if not shards or is_full:
+            shards.append([])
+            shard_artifacts = set()
+            shard_parents = set()
+            shard_bytes = suite_bytes
+            testcase_bytes = json_bytes + _structure_bytes(encoding, testsuite, folders, shard_parents, max_bytes) + \
+                _artifact_bytes(testcase, shard_artifacts, max_bytes)
+
+        shards[-1].append((folders, testcase))
+        shard_bytes += testcase_bytes
+        shard_artifacts.update(artifact.get_path_in_report() for artifact in testcase.get_artifacts())
+        shard_parents.update((testsuite, *folders))
+
+    return [_build_testsuite(testsuite, shard) for shard in shards]
+
+
+def _check_limits(max_testcases, max_bytes):
+    """
+    :raises ValueError: neither max_testcases nor max_bytes is given, or one of them is less than 1
+    """
+    if max_testcases is None and max_bytes is None:
+        raise ValueError("At least one of the arguments 'max_testcases' and 'max_bytes' is required.")
+    for name, value in (("max_testcases", max_testcases), ("max_bytes", max_bytes)):
+        if value is not None and value < 1:
+            raise ValueError(f"The argument '{name}' must be at least 1. Was {value}")
+
+
+def _flatten(nodes, folders=()):
+    """
+    Yields all testcases together with the chain of TestCaseFolders containing them.
+    """
+    for node in nodes:
+        if isinstance(node, TestCaseFolder):
+            yield from _flatten(node.get_testcases(), folders + (node,))
+        else:
+            yield folders, node
+
+
+def _encoded_size(encoding, json_repr):
+    """
+    Returns the number of bytes of the UTF-8 encoded JSON representation.
+    """
+    return len(encoding.dumps(json_repr).encode("utf-8"))
+
+
+def _nested_size(encoding, elements, depth):
+    """
+    Returns the encoded size of a `testcases` array, which is nested into the given number of
+    TestCaseFolders, together with its enclosing objects.
+    """
+    wrapped = elements
+    for _ in range(depth):
+        wrapped = [{"testcases": wrapped}]
+    return _encoded_size(encoding, {"testcases": wrapped})
+
+
+def _element_size(encoding, json_repr, depth):
+    """
+    Returns the number of bytes which the JSON representation adds as the first element of a
+    `testcases` array, which is nested into the given number of TestCaseFolders. This includes the
+    indentation.
+    """
+    return _nested_size(encoding, [json_repr], depth) - _nested_size(encoding, [None], depth) + len("null")
+
+
+def _separator_size(encoding, depth):
+    """
+    Returns the number of bytes which separate two elements of a `testcases` array, which is
+    nested into the given number of TestCaseFolders.
+    """
+    return _nested_size(encoding, [None, None], depth) - _nested_size(encoding, [None], depth) - len("null")
+
+
+def _structure_bytes(encoding, testsuite, folders, known_parents, max_bytes):
+    """
+    Sums up the sizes of the TestCaseFolders without their testcases, which are not known yet, and
+    of the separators, which are needed to add a testcase in these folders.
+    """
+    if max_bytes is None:
+        return 0
+
+    result = 0
+    for depth, parent in enumerate((testsuite, *folders)):
+        if parent in known_parents:
+            if depth == len(folders) or folders[depth] not in known_parents:
+                result += _separator_size(encoding, depth)
+        elif depth > 0:
+            result += _element_size(encoding, {**parent.create_lazy_json_repr(), "testcases": [None]},
+                                    depth - 1) - len("null")
+    return result
+
+
+def _artifact_bytes(testcase, known_paths_in_zip, max_bytes):
+    """
+    Sums up the file sizes of the distinct artifacts of the testcase, which are not known yet.
+    """
+    if max_bytes is None:
+        return 0
+
+    result = 0
+    paths_in_zip = set()
+    for artifact in testcase.get_artifacts():
+        path_in_zip = artifact.get_path_in_report()
+        if path_in_zip not in known_paths_in_zip and path_in_zip not in paths_in_zip:
+            paths_in_zip.add(path_in_zip)
+            result += artifact.get_size()
+    return result
+
+
+def _build_testsuite(original, shard):
+    """
+    Creates a testsuite from the testcases of a shard and recreates their TestCaseFolders.
+    """
+    testsuite = TestSuite(original.get_name(), original.get_timestamp())
+    copies: dict = {}
+    for folders, testcase in shard:
+        depth = 0
+        while depth < len(folders) and folders[depth] in copies:
+            depth += 1
+
+        node = testcase
+        for folder in reversed(folders[depth:]):
+            copy = TestCaseFolder(folder.get_name())
+            copy.add_testcase(node)
+            copies[folder] = copy
+            node = copy
+
+        parent = copies[folders[depth - 1]] if depth else testsuite
+        parent.add_testcase(node)
+    return testsuite
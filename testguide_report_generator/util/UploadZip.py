@@ -0,0 +1,238 @@
+# Copyright (c) 2023-2024 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+# -*- coding: utf-8 -*-
+
+"""
+This module contains the UploadZipFile class and helpers to prepare its entries.
+"""
+
+import functools
+import io
+import struct
+import time
+import zlib
+from typing import Optional
+from zipfile import BadZipFile, ZipFile, ZipInfo, ZIP_DEFLATED, ZIP_STORED
+
+from testguide_report_generator.util.File import get_extended_windows_path
+
+READ_CHUNK_SIZE = 1024 * 1024
+
+# size of the fixed part of a local file header, which ends with the lengths of the name and the extra field
+LOCAL_FILE_HEADER_SIZE = 30
+
+# private attributes of ZipFile on which write_compressed, remove_last_entry and remove_entries_from depend
+_ZIPFILE_INTERNALS = ("_lock", "_writing", "_seekable", "_writecheck", "_didModify", "start_dir", "fp", "filelist",
+                      "NameToInfo")
+
+# undocumented attributes of ZipInfo which these methods and the callers of compress_file read or set
+_ZIPINFO_INTERNALS = ("FileHeader", "header_offset", "flag_bits", "external_attr", "compress_size", "file_size",
+                      "CRC", "filename", "orig_filename")
+
+
+def _create_zipinfo(source, arcname):
+    """
+    :return: entry information for a file or for in-memory content
+    :rtype: ZipInfo
+    """
+    if isinstance(source, str):
+        return ZipInfo.from_file(get_extended_windows_path(source), arcname)
+
+    zinfo = ZipInfo(arcname, time.localtime(time.time())[:6])
+    zinfo.external_attr = 0o600 << 16
+    zinfo.file_size = memoryview(source).nbytes
+    return zinfo
+
+
+def _iter_chunks(source):
+    """
+    :return: generator of the content of a file or of in-memory content in chunks
+    :rtype: Iterator[bytes or memoryview]
+    """
+    if isinstance(source, str):
+        with open(get_extended_windows_path(source), 'rb') as file:
+            while chunk := file.read(READ_CHUNK_SIZE):
+                yield chunk
+    else:
+        view = memoryview(source).cast("B")
+        for offset in range(0, len(view), READ_CHUNK_SIZE):
+            yield view[offset:offset + READ_CHUNK_SIZE]
+
+
+def compress_file(file_path, arcname: str, compress_type: int, compresslevel: Optional[int] = None,
+                  hasher=None):
+    """
+    Reads and compresses a file into memory, so that it can be added to an
+    :class:`UploadZipFile` later on. The compressed data is identical to the data that
+    :meth:`ZipFile.write<zipfile.ZipFile.write>` would produce. This function may be called from
+    several threads at once, since zlib releases the GIL while compressing.
+
+    :param file_path: path to the file, or the content itself
+    :type file_path: str or bytes or memoryview
+    :param arcname: name of the entry in the `.zip` file
+    :type arcname: str
+    :param compress_type: ZIP_STORED or ZIP_DEFLATED
+    :type compress_type: int
+    :param compresslevel: zlib compression level, None for the zlib default
+    :type compresslevel: int or None
+    :param hasher: hash object from :mod:`hashlib`, which is updated with the file content in the
+        same pass, or None
+    :type hasher: hashlib._Hash or None
+    :raises ValueError: compress_type is not supported
+    :return: the entry information and the compressed data
+    :rtype: tuple
+    """
+    if compress_type not in (ZIP_STORED, ZIP_DEFLATED):
+        raise ValueError("Argument 'compress_type' must be ZIP_STORED or ZIP_DEFLATED.")
+
+    zinfo = _create_zipinfo(file_path, arcname)
+    zinfo.compress_type = compress_type
+    compressor = None
+    if compress_type == ZIP_DEFLATED:
+        level = zlib.Z_DEFAULT_COMPRESSION if compresslevel is None else compresslevel
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+
+    chunks = []
+    crc = 0
+    file_size = 0
+    for chunk in _iter_chunks(file_path):
+        crc = zlib.crc32(chunk, crc)
+        file_size += len(chunk)
+        if hasher is not None:
+            hasher.update(chunk)
+        chunks.append(compressor.compress(chunk) if compressor else chunk)
+    if compressor:
+        chunks.append(compressor.flush())
+
+    data = b"".join(chunks)
+    zinfo.file_size = file_size
+    zinfo.compress_size = len(data)
+    zinfo.CRC = crc
+    return zinfo, data
+
+
+@functools.lru_cache(maxsize=None)
+def supports_precompressed_entries():
+    """
+    Checks whether :meth:`UploadZipFile.write_compressed`, :meth:`UploadZipFile.remove_last_entry`
+    and :meth:`UploadZipFile.remove_entries_from` work with the :mod:`zipfile` module of the
+    running Python version. They depend on private attributes of :class:`ZipFile<zipfile.ZipFile>`
+    and :class:`ZipInfo<zipfile.ZipInfo>`, so the presence of all of them is checked first. Then
+    entries are written, removed and restored in memory and the result is read back. The result
+    is computed only once.
+
+    :return: True, if the entries of an UploadZipFile can be written and removed directly
+    :rtype: bool
+    """
+    content = b"feature check" * 100
+    buffer = io.BytesIO()
+    try:
+        with UploadZipFile(buffer, "w") as zip_obj:
+            if not all(hasattr(zip_obj, name) for name in _ZIPFILE_INTERNALS) \
+                    or not all(hasattr(ZipInfo, name) for name in _ZIPINFO_INTERNALS):
+                return False
+            zip_obj.write_compressed(*compress_file(content, "first.txt", ZIP_DEFLATED))
+            zip_obj.write_compressed(*compress_file(content, "restored.txt", ZIP_STORED))
+            zinfo, data = zip_obj.remove_last_entry("restored.txt")
+            offset = zinfo.header_offset
+            zip_obj.write_compressed(*compress_file(content, "removed.txt", ZIP_DEFLATED))
+            zip_obj.remove_entries_from(offset)
+            zip_obj.write_compressed(zinfo, data)
+            zip_obj.write_compressed(*compress_file(content, "last.txt", ZIP_STORED))
+        with ZipFile(buffer) as zip_obj:
+            return zip_obj.testzip() is None \
+                and zip_obj.namelist() == ["first.txt", "restored.txt", "last.txt"] \
+                and all(zip_obj.read(name) == content for name in zip_obj.namelist())
+    except (AttributeError, TypeError, ValueError, KeyError, struct.error, BadZipFile):
+        return False
+
+
+class UploadZipFile(ZipFile):
+    """
+    ZipFile which additionally accepts entries that have already been compressed elsewhere, for
+    instance by :func:`compress_file` in a worker thread. These additional methods depend on
+    private attributes of :class:`ZipFile<zipfile.ZipFile>` and may only be used if
+    :func:`supports_precompressed_entries` returns True.
+    """
+
+    def write_compressed(self, zinfo, data):
+        """
+        Appends an already compressed entry to the archive. See
+        :func:`supports_precompressed_entries`.
+
+        :param zinfo: entry information including compression type, sizes and CRC
+        :type zinfo: ZipInfo
+        :param data: the compressed data
+        :type data: bytes
+        :raises ValueError: another write handle of the archive is still open
+        """
+        with self._lock:
+            if self._writing:
+                raise ValueError("Can't write to ZIP archive while an open writing handle exists.")
+
+            zinfo.flag_bits = 0x00
+            if not zinfo.external_attr:
+                zinfo.external_attr = 0o600 << 16
+
+            if self._seekable:
+                self.fp.seek(self.start_dir)
+            zinfo.header_offset = self.fp.tell()
+            self._writecheck(zinfo)
+            self._didModify = True
+
+            self.fp.write(zinfo.FileHeader())
+            self.fp.write(data)
+            self.start_dir = self.fp.tell()
+
+            self.filelist.append(zinfo)
+            self.NameToInfo[zinfo.filename] = zinfo
+
+    def remove_last_entry(self, name):
+        """
+        Removes the most recently written entry from an archive by truncating the archive at the
+        beginning of that entry. The archive must be seekable and readable. The removed entry is
+        returned, so that it can be restored with :meth:`write_compressed` after
+        :meth:`remove_entries_from` its former offset. See :func:`supports_precompressed_entries`.
+
+        :param name: name of the entry
+        :type name: str
+        :raises KeyError: the archive does not contain an entry with this name
+        :raises ValueError: the entry is not the last one in the archive
+        :return: the entry information and the compressed data of the removed entry
+        :rtype: tuple
+        """
+        zinfo = self.getinfo(name)
+        if any(each.header_offset > zinfo.header_offset for each in self.filelist):
+            raise ValueError(f"The entry '{name}' is not the last entry of the archive.")
+
+        with self._lock:
+            self.fp.seek(zinfo.header_offset)
+            header = self.fp.read(LOCAL_FILE_HEADER_SIZE)
+            name_length, extra_length = struct.unpack("<HH", header[-4:])
+            self.fp.seek(zinfo.header_offset + LOCAL_FILE_HEADER_SIZE + name_length + extra_length)
+            data = self.fp.read(zinfo.compress_size)
+        self.remove_entries_from(zinfo.header_offset)
+        return zinfo, data
+
+    def remove_entries_from(self, offset):
+        """
+        Removes all entries which start at or after the given offset by truncating the archive
+        there. The archive must be seekable. See :func:`supports_precompressed_entries`.
+
+        :param offset: position in the archive at which an entry starts, or the end of the entries
+        :type offset: int
+        :raises ValueError: the offset is neither the beginning of an entry nor the end of the
+            entries
+        """
+        with self._lock:
+            if offset != self.start_dir and all(each.header_offset != offset for each in self.filelist):
+                raise ValueError(f"The offset {offset} is not the beginning of an entry.")
+            for zinfo in [each for each in self.filelist if each.header_offset >= offset]:
+                self.filelist.remove(zinfo)
+                del self.NameToInfo[zinfo.filename]
+            self.start_dir = offset
+            self.fp.seek(self.start_dir)
+            self.fp.truncate()
+            self._didModify = True
@@ -10,6 +10,8 @@ testsuite, are constructed in a valid manner. This guarantees that errors are fo
 setup of the testsuite.
 """
 
+from typing import Optional, Union
+
 
 def check_string_length(value: str, min_len: int, max_len: int, obj: str, prop: str):
     """
@@ -24,10 +26,14 @@ def check_string_length(value: str, min_len: int, max_len: int, obj: str, prop:
     :type obj: str
     :param prop: name of the property being checked
     :type prop: str
+    :raises TypeError: if the value is not a string.
     :raises ValueError: if the string length is not within the specified bounds.
     :return: The original string value if valid
     :rtype: str
     """
+    if not isinstance(value, str):
+        raise TypeError(f"The {obj}:{prop} must be of type 'str'. Was {type(value).__name__}")
+
     error_msg = (
         f"The {obj}:{prop} must have a length between {min_len} and {max_len} characters. Was {len(value)} -> {value}"
     )
@@ -36,6 +42,75 @@ def check_string_length(value: str, min_len: int, max_len: int, obj: str, prop:
     return value
 
 
+def check_optional_string_length(value: Optional[str], max_len: int, obj: str, prop: str):
+    """
+    Checks if the given optional string property of an object is either None or a string of at
+    most the given length.
+
+    :param value: string value to check, or None
+    :type value: str or None
+    :param max_len: maximum allowed length (inclusive)
+    :type max_len: int
+    :param obj: name of the object containing the property
+    :type obj: str
+    :param prop: name of the property being checked
+    :type prop: str
+    :raises TypeError: if the value is neither None nor a string.
+    :raises ValueError: if the string is longer than max_len.
+    :return: The original value if valid
+    :rtype: str or None
+    """
+    if value is None:
+        return None
+    return check_string_length(value, 0, max_len, obj, prop)
+
+
+def check_non_negative_integer(value: Union[int, float], obj: str, prop: str):
+    """
+    Checks if the given integer property of an object, e.g. a timestamp, is not negative.
+
+    :param value: integer value to check. Floats with an integral value, e.g. 1666698047000.0,
+        are accepted like the schema does and are converted to int.
+    :type value: int or float
+    :param obj: name of the object containing the property
+    :type obj: str
+    :param prop: name of the property being checked
+    :type prop: str
+    :raises TypeError: if the value is not an integer. Booleans are not accepted.
+    :raises ValueError: if the value is negative.
+    :return: The integer value if valid
+    :rtype: int
+    """
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise TypeError(f"The {obj}:{prop} must be of type 'int'. Was {type(value).__name__}")
+    if value < 0:
+        raise ValueError(f"The {obj}:{prop} must not be negative. Was {value}")
+    return value
+
+
+def check_string_or_string_list(value, obj: str, prop: str):
+    """
+    Checks if the given property of an object is a string or a list of strings.
+
+    :param value: value to check
+    :type value: str or list
+    :param obj: name of the object containing the property
+    :type obj: str
+    :param prop: name of the property being checked
+    :type prop: str
+    :raises TypeError: if the value is neither a string nor a list of strings.
+    :return: The original string, or a copy of the list
+    :rtype: str or list
+    """
+    if isinstance(value, str):
+        return value
+    if isinstance(value, list) and all(isinstance(item, str) for item in value):
+        return list(value)
+    raise TypeError(f"The {obj}:{prop} must be a string or a list of strings. Was {value!r}")
+
+
 def validate_new_teststep(teststep, stepclass, folderclass):
     """
     Checks whether the TestStep(Folder) object may be added to the TestCase.
@@ -89,3 +164,31 @@ def validate_testcase(testcase, test_case_class, test_case_folder_class):
             raise ValueError("TestCaseFolder may not be empty.")
 
     return True
+
+
+def validate_testcase_schema(testcase, validator, test_case_folder_class):
+    """
+    Checks whether the TestCase, or each TestCase within the TestCaseFolder, complies with the
+    `TestCase` definition of the schema. Results are cached by the validator, so testcases which
+    have already been checked are not validated again.
+
+    :param testcase: the testcase to be checked
+    :type testcase: :class:`TestCase<testguide_report_generator.model.TestCase.TestCase>` or
+        :class:`TestCaseFolder<testguide_report_generator.model.TestCase.TestCaseFolder>`
+    :param validator: the validator
+    :type validator: :class:`JsonValidator<testguide_report_generator.util.JsonValidator.JsonValidator>`
+    :param test_case_folder_class: TestCaseFolder class
+    :type test_case_folder_class:
+        :class:`TestCaseFolder<testguide_report_generator.model.TestCase.TestCaseFolder>`
+    :raises: ValueError, if a TestCase does not comply with the schema
+    :return: True, if checks are successful
+    :rtype: bool
+    """
+
+    if isinstance(testcase, test_case_folder_class):
+        for child in testcase.get_testcases():
+            validate_testcase_schema(child, validator, test_case_folder_class)
+    elif not validator.validate_testcase(testcase):
+        raise ValueError(f"TestCase '{testcase.get_name()}' does not comply with the schema.")
+
+    return True
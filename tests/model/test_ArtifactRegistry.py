@@ -0,0 +1,89 @@
+# Copyright (c) 2023-2024 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from testguide_report_generator.model.Artifact import Artifact
+from testguide_report_generator.model.ArtifactRegistry import ArtifactRegistry
+from testguide_report_generator.model.TestCase import TestCase, TestStep, TestStepArtifactType, Verdict
+from testguide_report_generator.util.File import get_md5_hash_from_file
+
+
+def test_same_path_is_interned(artifact_path):
+    registry = ArtifactRegistry()
+    with patch("testguide_report_generator.model.Artifact.get_md5_hash_from_file",
+               wraps=get_md5_hash_from_file) as mock:
+        testcases = [TestCase("name", 0, Verdict.PASSED).add_artifact(artifact_path, registry=registry)
+                     for _ in range(100)]
+
+    mock.assert_called_once()
+    assert 1 == len(registry)
+    assert 1 == len({id(testcase.get_artifacts()[0]) for testcase in testcases})
+
+
+def test_identity_is_interned(tmp_path, artifact_path):
+    os.mkdir(tmp_path / "link")
+    os.symlink(os.path.abspath(artifact_path), tmp_path / "link" / "artifact.txt")
+    registry = ArtifactRegistry()
+
+    artifact = registry.get_artifact(artifact_path)
+
+    assert artifact is registry.get_artifact(str(tmp_path / "link" / "artifact.txt"))
+    assert artifact is registry.get_artifact(os.path.join(os.path.dirname(artifact_path), ".", "artifact.txt"))
+    assert 1 == len(registry)
+
+
+def test_different_name_or_type_is_not_interned(tmp_path, artifact_path):
+    os.link(artifact_path, tmp_path / "other.txt")
+    registry = ArtifactRegistry()
+
+    artifact = registry.get_artifact(artifact_path)
+    teststep_artifact = registry.get_teststep_artifact(artifact_path, TestStepArtifactType.IMAGE)
+
+    assert artifact is not registry.get_artifact(str(tmp_path / "other.txt"))
+    assert artifact is not teststep_artifact
+    assert teststep_artifact is registry.get_teststep_artifact(artifact_path, TestStepArtifactType.IMAGE)
+    assert TestStepArtifactType.IMAGE == teststep_artifact.get_artifact_type()
+    assert 3 == len(registry)
+
+
+def test_errors(tmp_path, artifact_path):
+    registry = ArtifactRegistry()
+    with pytest.raises(OSError, match="File does not exist or path does not point to a file"):
+        registry.get_artifact("does/not/exist.txt")
+    with pytest.raises(OSError, match="File does not exist or path does not point to a file"):
+        registry.get_artifact(str(tmp_path))
+    with pytest.raises(TypeError, match="TestStepArtifactType"):
+        registry.get_teststep_artifact(artifact_path, "IMAGE")
+
+
+def test_add_artifact_with_registry(testsuite, artifact_path, caplog):
+    registry = testsuite.get_artifact_registry()
+    teststep = TestStep("ts", Verdict.PASSED).add_artifact(artifact_path, TestStepArtifactType.IMAGE,
+                                                           registry=registry)
+    teststep.add_artifact("does/not/exist.txt", TestStepArtifactType.IMAGE, True, registry=registry)
+    testcase = TestCase("name", 0, Verdict.PASSED).add_artifact(artifact_path, registry=registry)
+    testcase.add_artifact("does/not/exist.txt", True, registry=registry)
+
+    assert 1 == len(teststep.get_artifacts())
+    assert 1 == len(testcase.get_artifacts())
+    assert "will be ignored" in caplog.text
+    assert registry is testsuite.get_artifact_registry()
+
+
+def test_find_and_intern_artifact(artifact_path):
+    registry = ArtifactRegistry()
+    assert registry.find_artifact(artifact_path) is None
+    assert 0 == len(registry)
+
+    artifact = Artifact(artifact_path, lazy=True)
+    assert artifact is registry.intern_artifact(artifact_path, artifact)
+    assert artifact is registry.intern_artifact(artifact_path, Artifact(artifact_path, lazy=True))
+    assert artifact is registry.find_artifact(artifact_path)
+    assert registry.find_artifact(artifact_path, TestStepArtifactType.IMAGE) is None
+    with pytest.raises(OSError, match="File does not exist or path does not point to a file"):
+        registry.find_artifact("does/not/exist.txt")
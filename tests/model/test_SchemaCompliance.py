@@ -0,0 +1,257 @@
+# Copyright (c) 2023-2024 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+import copy
+import io
+import json
+import random
+import string
+from zipfile import ZipFile
+
+import jsonschema
+import pytest
+
+from testguide_report_generator.ReportGenerator import Generator
+from testguide_report_generator.model.TestCase import (
+    Constant,
+    Direction,
+    Parameter,
+    Review,
+    TestCase,
+    TestStep,
+    TestStepArtifactType,
+    TestStepFolder,
+    Verdict,
+)
+from testguide_report_generator.model.TestCaseFolder import TestCaseFolder
+from testguide_report_generator.model.TestSuite import TestSuite
+from testguide_report_generator.util.ArtifactData import ArtifactData
+
+CHARACTERS = string.ascii_letters + string.digits + " _-.:\"\\\n\tä·中😀"
+ATTRIBUTE_KEY_CHARACTERS = string.ascii_letters + string.digits + "-.:_·Àä中"
+
+# arguments which are passed to each parameter of the model, in addition to the fuzz values of the schema
+ARGUMENT_VALUES = [float("nan"), float("inf"), 2.5, -2 ** 53, "x" * 255, "x" * 256, "x" * 512,
+                   "x" * 513, "x" * 10000, "x" * 10001, "ünïcødé\n\"", ["a", "b"], ("a",), "a\n", *Verdict,
+                   *Direction, Review("comment", "author", 0), TestStep("step", Verdict.PASSED),
+                   [Parameter("param", 1, Direction.IN)], Constant("key", "value"),
+                   TestCase("testcase", 0, Verdict.PASSED), TestStepFolder("folder")]
+
+
+@pytest.fixture
+def schema_validator(json_schema_path):
+    with open(json_schema_path, "r", encoding="utf-8") as file:
+        return jsonschema.Draft7Validator(json.load(file))
+
+
+def random_string(rng, min_length, max_length):
+    length = rng.choice([min_length, max_length, rng.randint(min_length, min(max_length, min_length + 20))])
+    return "".join(rng.choice(CHARACTERS) for _ in range(length))
+
+
+def random_optional_string(rng, max_length):
+    return None if rng.random() < 0.3 else random_string(rng, 0, max_length)
+
+
+def random_integer(rng):
+    return rng.choice([0, 2 ** 53, rng.randint(0, 2 ** 41)])
+
+
+def random_constant_key(rng):
+    parts = [rng.choice(string.ascii_letters)]
+    for _ in range(rng.choice([0, 63, rng.randint(0, 10)])):
+        parts.append(rng.choice(["", "_"]) + rng.choice(string.ascii_letters + string.digits))
+    if len("".join(parts)) < 128 and rng.random() < 0.2:
+        parts.append("_")
+    return "".join(parts)
+
+
+def random_attribute_key(rng):
+    length = rng.choice([1, 255, rng.randint(1, 20)])
+    return "".join(rng.choice(ATTRIBUTE_KEY_CHARACTERS) for _ in range(length))
+
+
+def random_value(rng):
+    if rng.random() < 0.5:
+        return random_string(rng, 0, 50)
+    return [random_string(rng, 0, 10) for _ in range(rng.randint(0, 3))]
+
+
+def random_parameter_value(rng):
+    return rng.choice([random_string(rng, 0, 50), rng.random() < 0.5, rng.randint(-2 ** 53, 2 ** 53),
+                       rng.uniform(-1e9, 1e9)])
+
+
+def random_teststep(rng):
+    teststep = TestStep(random_string(rng, 1, 255), rng.choice(list(Verdict)), random_string(rng, 0, 1024))
+    teststep.set_description(random_optional_string(rng, 6144))
+    if rng.random() < 0.2:
+        teststep.add_artifact(ArtifactData(f"image_{rng.randrange(3)}.png", b"image"), TestStepArtifactType.IMAGE)
+    return teststep
+
+
+def random_teststeps(rng, depth):
+    teststeps = []
+    for _ in range(rng.randint(0, 3)):
+        if depth and rng.random() < 0.3:
+            folder = TestStepFolder(random_string(rng, 1, 255)).set_description(random_optional_string(rng, 6144))
+            for teststep in random_teststeps(rng, depth - 1) or [random_teststep(rng)]:
+                folder.add_teststep(teststep)
+            teststeps.append(folder)
+        else:
+            teststeps.append(random_teststep(rng))
+    return teststeps
+
+
+def random_review(rng):
+    review = Review(random_string(rng, 1, 10000), random_string(rng, 0, 512), random_integer(rng))
+    if rng.random() < 0.5:
+        review.set_verdict(rng.choice(list(Verdict)))
+        review.set_summary(random_string(rng, 0, 512))
+        review.set_defect(random_string(rng, 0, 64))
+        review.set_defect_priority(random_string(rng, 0, 64))
+        review.set_custom_evaluation(random_string(rng, 0, 64))
+        review.set_invalid_run(rng.random() < 0.5)
+    review.add_tickets([random_string(rng, 0, 512) for _ in range(rng.randint(0, 2))])
+    review.add_tags([random_string(rng, 0, 20) for _ in range(rng.randint(0, 2))])
+    review.add_contacts([random_string(rng, 0, 255) for _ in range(rng.randint(0, 2))])
+    return review
+
+
+def random_testcase(rng):
+    testcase = TestCase(random_string(rng, 1, 120), random_integer(rng), rng.choice(list(Verdict)))
+    testcase.set_description(random_optional_string(rng, 6144))
+    testcase.set_execution_time_in_sec(random_integer(rng))
+    parameters = [Parameter(random_string(rng, 1, 120), random_parameter_value(rng), rng.choice(list(Direction)))
+                  for _ in range(rng.randint(0, 3))]
+    testcase.add_parameter_set(random_optional_string(rng, 1024), parameters)
+    testcase.add_constants([Constant(random_constant_key(rng), random_value(rng)) for _ in range(rng.randint(0, 2))])
+    for _ in range(rng.randint(0, 2)):
+        testcase.add_attribute_pair(random_attribute_key(rng), random_value(rng))
+    for add_teststep in (testcase.add_setup_teststep, testcase.add_execution_teststep,
+                         testcase.add_teardown_teststep):
+        for teststep in random_teststeps(rng, 2):
+            add_teststep(teststep)
+    if rng.random() < 0.2:
+        testcase.add_artifact(ArtifactData(f"log_{rng.randrange(3)}.txt", random_string(rng, 0, 20).encode()))
+    if rng.random() < 0.5:
+        testcase.set_review(random_review(rng))
+    return testcase
+
+
+def random_testcases(rng, depth):
+    testcases = []
+    for _ in range(rng.randint(1, 3)):
+        if depth and rng.random() < 0.3:
+            folder = TestCaseFolder(random_string(rng, 1, 120))
+            for testcase in random_testcases(rng, depth - 1):
+                folder.add_testcase(testcase)
+            testcases.append(folder)
+        else:
+            testcases.append(random_testcase(rng))
+    return testcases
+
+
+def random_testsuite(rng):
+    testsuite = TestSuite(random_string(rng, 1, 120), random_integer(rng))
+    for testcase in random_testcases(rng, 2):
+        testsuite.add_testcase(testcase)
+    return testsuite
+
+
+def test_trusted_export_complies_with_schema(schema_validator):
+    for seed in range(30):
+        stream = io.BytesIO()
+        assert Generator(random_testsuite(random.Random(seed)), trusted=True).export_to_stream(stream)
+
+        with ZipFile(stream) as zip_obj:
+            report = json.loads(zip_obj.read("report.json"))
+        errors = [error.message for error in schema_validator.iter_errors(report)]
+        assert not errors, f"seed {seed}: {errors}"
+
+
+def new_testcase():
+    return TestCase("testcase", 0, Verdict.PASSED)
+
+
+def with_testcase(create_testcase):
+    return lambda value: TestSuite("suite", 0).add_testcase(create_testcase(value))
+
+
+def with_teststep(create_teststep):
+    return with_testcase(lambda value: new_testcase().add_execution_teststep(create_teststep(value)))
+
+
+def with_review(update_review):
+    return with_testcase(lambda value: new_testcase().set_review(update_review(Review("comment", "author", 0), value)))
+
+
+OPERATIONS = {
+    "TestSuite.name": lambda value: TestSuite(value, 0).add_testcase(new_testcase()),
+    "TestSuite.timestamp": lambda value: TestSuite("suite", value).add_testcase(new_testcase()),
+    "TestSuite.add_testcase": lambda value: TestSuite("suite", 0).add_testcase(new_testcase()).add_testcase(value),
+    "TestCaseFolder.name": with_testcase(lambda value: TestCaseFolder(value).add_testcase(new_testcase())),
+    "TestCase.name": with_testcase(lambda value: TestCase(value, 0, Verdict.PASSED)),
+    "TestCase.timestamp": with_testcase(lambda value: TestCase("testcase", value, Verdict.PASSED)),
+    "TestCase.verdict": with_testcase(lambda value: TestCase("testcase", 0, value)),
+    "TestCase.set_description": with_testcase(lambda value: new_testcase().set_description(value)),
+    "TestCase.set_execution_time_in_sec": with_testcase(lambda value: new_testcase().set_execution_time_in_sec(value)),
+    "TestCase.add_parameter_set.param_set": with_testcase(lambda value: new_testcase().add_parameter_set(value, [])),
+    "TestCase.add_parameter_set.params": with_testcase(lambda value: new_testcase().add_parameter_set("set", value)),
+    "TestCase.add_constants": with_testcase(lambda value: new_testcase().add_constants(value)),
+    "TestCase.add_constant": with_testcase(lambda value: new_testcase().add_constant(value)),
+    "TestCase.add_constant_pair.key": with_testcase(lambda value: new_testcase().add_constant_pair(value, "value")),
+    "TestCase.add_constant_pair.value": with_testcase(lambda value: new_testcase().add_constant_pair("key", value)),
+    "TestCase.add_attribute_pair.key": with_testcase(lambda value: new_testcase().add_attribute_pair(value, "value")),
+    "TestCase.add_attribute_pair.value": with_testcase(lambda value: new_testcase().add_attribute_pair("key", value)),
+    "TestCase.add_execution_teststep": with_testcase(lambda value: new_testcase().add_execution_teststep(value)),
+    "TestCase.set_review": with_testcase(lambda value: new_testcase().set_review(value)),
+    "Parameter.name": with_testcase(lambda value: new_testcase().add_parameter_set(
+        "set", [Parameter(value, 1, Direction.IN)])),
+    "Parameter.value": with_testcase(lambda value: new_testcase().add_parameter_set(
+        "set", [Parameter("param", value, Direction.IN)])),
+    "Parameter.direction": with_testcase(lambda value: new_testcase().add_parameter_set(
+        "set", [Parameter("param", 1, value)])),
+    "TestStep.name": with_teststep(lambda value: TestStep(value, Verdict.PASSED)),
+    "TestStep.verdict": with_teststep(lambda value: TestStep("step", value)),
+    "TestStep.expected_result": with_teststep(lambda value: TestStep("step", Verdict.PASSED, value)),
+    "TestStep.set_description": with_teststep(lambda value: TestStep("step", Verdict.PASSED).set_description(value)),
+    "TestStepFolder.name": with_teststep(lambda value: TestStepFolder(value).add_teststep(TestStep("step",
+                                                                                                  Verdict.PASSED))),
+    "TestStepFolder.set_description": with_teststep(lambda value: TestStepFolder("folder").set_description(
+        value).add_teststep(TestStep("step", Verdict.PASSED))),
+    "TestStepFolder.add_teststep": with_teststep(lambda value: TestStepFolder("folder").add_teststep(value)),
+    "Review.comment": with_testcase(lambda value: new_testcase().set_review(Review(value, "author", 0))),
+    "Review.author": with_testcase(lambda value: new_testcase().set_review(Review("comment", value, 0))),
+    "Review.timestamp": with_testcase(lambda value: new_testcase().set_review(Review("comment", "author", value))),
+    "Review.set_verdict": with_review(Review.set_verdict),
+    "Review.set_summary": with_review(Review.set_summary),
+    "Review.set_defect": with_review(Review.set_defect),
+    "Review.set_defect_priority": with_review(Review.set_defect_priority),
+    "Review.add_tickets": with_review(Review.add_tickets),
+    "Review.add_tickets.ticket": with_review(lambda review, value: review.add_tickets([value])),
+    "Review.set_invalid_run": with_review(Review.set_invalid_run),
+    "Review.set_custom_evaluation": with_review(Review.set_custom_evaluation),
+    "Review.add_tags": with_review(Review.add_tags),
+    "Review.add_tags.tag": with_review(lambda review, value: review.add_tags([value])),
+    "Review.add_contacts": with_review(Review.add_contacts),
+    "Review.add_contacts.contact": with_review(lambda review, value: review.add_contacts([value])),
+}
+
+
+@pytest.mark.parametrize("operation", OPERATIONS.values(), ids=OPERATIONS.keys())
+def test_model_only_accepts_schema_compliant_arguments(schema_validator, fuzz_values, operation):
+    accepted = 0
+    for value in [*fuzz_values, *ARGUMENT_VALUES]:
+        try:
+            testsuite = operation(copy.deepcopy(value))
+        except (TypeError, ValueError):
+            continue
+
+        report = json.loads(json.dumps(testsuite.create_json_repr(), allow_nan=False))
+        errors = [error.message for error in schema_validator.iter_errors(report)]
+        assert not errors, f"{value!r}: {errors}"
+        accepted += 1
+
+    assert accepted > 0
@@ -2,13 +2,17 @@
 #
 # SPDX-License-Identifier: MIT
 
+import os
 import pytest
 import json
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch
 
 from testguide_report_generator.model.TestCase import (
     Attribute,
     Constant,
+    Direction,
+    Parameter,
     TestCase,
     TestStep,
     Verdict,
@@ -17,6 +21,8 @@ from testguide_report_generator.model.TestCase import (
     TestStepArtifactType,
     Review,
 )
+from testguide_report_generator.model.Artifact import use_report_paths
+from testguide_report_generator.util.ArtifactData import ArtifactData
 
 
 class TestArtifact:
@@ -32,6 +38,78 @@ class TestArtifact:
         json_str = json.dumps(artifact_mock_hash.create_json_repr())
         assert '"hash/artifact.txt"' == json_str
 
+    def test_lazy_artifact(self, artifact_path, artifact_path2):
+        with patch("testguide_report_generator.model.Artifact.get_md5_hash_from_file", return_value="hash") as mock:
+            first = Artifact(artifact_path, lazy=True)
+            second = Artifact(artifact_path2, lazy=True)
+            assert mock.call_count == 0
+
+            assert first.get_path_in_upload_zip() == "hash/" + os.path.basename(artifact_path)
+            assert mock.call_count == 1
+            assert second.is_hash_pending()
+            assert second.get_path_in_upload_zip() == "hash/" + os.path.basename(artifact_path2)
+            assert mock.call_count == 2
+
+    def test_lazy_artifact_resolved_once(self, artifact_path):
+        artifact = Artifact(artifact_path, lazy=True)
+
+        with patch("testguide_report_generator.model.Artifact.get_md5_hash_from_file", return_value="hash") as mock:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                paths = set(executor.map(lambda _: artifact.get_path_in_upload_zip(), range(16)))
+
+        assert paths == {"hash/artifact.txt"}
+        assert mock.call_count == 1
+
+    def test_artifact_data(self):
+        artifact = Artifact(ArtifactData("screenshot.png", b"content"))
+
+        assert artifact.get_file_path() is None
+        assert artifact.get_name() == "screenshot.png"
+        assert artifact.get_size() == 7
+        assert artifact.get_data() == b"content"
+        assert artifact.create_json_repr() == "9a0364b9e99bb480dd25e1f0284c8555/screenshot.png"
+
+    def test_hash_algorithm(self, artifact_path):
+        Artifact.set_default_hash_algorithm("sha1")
+        try:
+            artifact = Artifact(artifact_path)
+        finally:
+            Artifact.set_default_hash_algorithm("md5")
+
+        assert artifact.get_hash_algorithm() == "sha1"
+        assert artifact.get_path_in_upload_zip() == "da39a3ee5e6b4b0d3255bfef95601890afd80709/artifact.txt"
+        assert Artifact(artifact_path).get_hash_algorithm() == "md5"
+
+    def test_create_path_in_upload_zip(self, artifact_path):
+        artifact = Artifact(artifact_path, lazy=True)
+
+        assert artifact.create_path_in_upload_zip("sha1") == "da39a3ee5e6b4b0d3255bfef95601890afd80709/artifact.txt"
+        assert artifact.get_hash_algorithm() == "md5"
+        assert artifact.is_hash_pending()
+        assert artifact.get_path_in_upload_zip() == "d41d8cd98f00b204e9800998ecf8427e/artifact.txt"
+
+    def test_use_report_paths(self, artifact_path):
+        artifact = Artifact(artifact_path)
+        teststep_artifact = TestStepArtifact(artifact_path, TestStepArtifactType.IMAGE)
+
+        with use_report_paths({artifact: "other/artifact.txt"}.get):
+            assert artifact.create_json_repr() == "other/artifact.txt"
+            assert teststep_artifact.create_json_repr()["path"] == "d41d8cd98f00b204e9800998ecf8427e/artifact.txt"
+        assert artifact.create_json_repr() == "d41d8cd98f00b204e9800998ecf8427e/artifact.txt"
+        assert artifact.get_path_in_upload_zip() == "d41d8cd98f00b204e9800998ecf8427e/artifact.txt"
+
+    def test_hash_algorithm_error(self, artifact_path):
+        with pytest.raises(ValueError, match="Unknown hash algorithm"):
+            Artifact.set_default_hash_algorithm("unknown")
+        with pytest.raises(ValueError, match="Unknown hash algorithm"):
+            Artifact(artifact_path).create_path_in_upload_zip("unknown")
+
+    def test_lazy_artifact_matches_eager(self, artifact_path):
+        lazy = Artifact(artifact_path, lazy=True)
+        lazy.resolve_hash()
+        assert not lazy.is_hash_pending()
+        assert lazy.create_json_repr() == Artifact(artifact_path).create_json_repr()
+
 
 class TestTestStepArtifact:
     def test_new(self, artifact_path):
@@ -50,7 +128,7 @@ class TestTestStepArtifact:
 
 class TestTestStep:
 
-    @patch("testguide_report_generator.model.TestCase.get_md5_hash_from_file")
+    @patch("testguide_report_generator.model.Artifact.get_md5_hash_from_file")
     def test_correct_json_repr(self, mock, teststep, artifact_path):
         mock.return_value = "hash"
         teststep.add_artifact(artifact_path, TestStepArtifactType.IMAGE, False)
@@ -101,12 +179,43 @@ class TestTestStepFolder:
 
         assert str(error.value) == "Argument teststep must be of type TestStep or TestStepFolder."
 
+    def test_add_empty_teststep_folder_error(self, teststep_folder, teststep_folder_empty):
+        with pytest.raises(ValueError, match="TestStepFolder may not be empty."):
+            teststep_folder.add_teststep(teststep_folder_empty)
+
+        assert len(teststep_folder.get_teststeps()) == 2
+
+    def test_description_error(self, teststep, teststep_folder):
+        with pytest.raises(ValueError):
+            teststep.set_description("x" * 6145)
+        with pytest.raises(TypeError):
+            teststep_folder.set_description(1)
+
+        assert teststep_folder.set_description(None) is teststep_folder
+
 
 class TestParameter:
     def test_correct_json_repr(self, parameter):
         json_str = json.dumps(parameter.create_json_repr())
         assert '{"name": "param", "value": 10, "direction": "OUT"}' == json_str
 
+    @pytest.mark.parametrize("value", ["", True, 1.5, 2 ** 53])
+    def test_value(self, value):
+        assert Parameter("param", value, Direction.IN).create_json_repr()["value"] == value
+
+    @pytest.mark.parametrize("name, value, direction, error", [
+        ("", 1, Direction.IN, ValueError),
+        ("x" * 121, 1, Direction.IN, ValueError),
+        ("param", None, Direction.IN, TypeError),
+        ("param", [1], Direction.IN, TypeError),
+        ("param", float("nan"), Direction.IN, ValueError),
+        ("param", float("inf"), Direction.IN, ValueError),
+        ("param", 1, "IN", TypeError),
+    ])
+    def test_error(self, name, value, direction, error):
+        with pytest.raises(error):
+            Parameter(name, value, direction)
+
 
 class TestTestCase:
     def test_add_parameter_error(self, testcase):
@@ -190,8 +299,24 @@ class TestTestCase:
 
         assert str(e.value) == "Argument 'verdict' must be of type 'Verdict'."
 
+    @pytest.mark.parametrize("timestamp, error", [(-1, ValueError), ("", TypeError), (1.5, TypeError)])
+    def test_timestamp_error(self, timestamp, error):
+        with pytest.raises(error, match="TestCase:timestamp"):
+            TestCase("a", timestamp, Verdict.PASSED)
+
+    def test_setter_errors(self, testcase):
+        with pytest.raises(ValueError, match="TestCase:executionTime"):
+            testcase.set_execution_time_in_sec(-1)
+        with pytest.raises(ValueError, match="TestCase:description"):
+            testcase.set_description("x" * 6145)
+        with pytest.raises(TypeError, match="TestCase:paramSet"):
+            testcase.add_parameter_set(1, [])
+
+        json_repr = testcase.set_description(None).add_parameter_set(None, []).create_json_repr()
+        assert json_repr["description"] is None and json_repr["paramSet"] is None
+
     def test_add_artifact(self, artifact_path):
-        tc = TestCase("name", "", Verdict.PASSED)
+        tc = TestCase("name", 0, Verdict.PASSED)
 
         with pytest.raises(OSError) as error:
             tc.add_artifact("", ignore_on_error=False)
@@ -257,17 +382,129 @@ class TestTestCase:
         assert str(error.value) == ERROR_MSG
 
 
+class TestAddArtifactsFromDir:
+    @pytest.fixture
+    def artifact_dir(self, tmp_path):
+        for name in ("b.log", "a.log", "c.txt"):
+            (tmp_path / name).write_text(name)
+        (tmp_path / "sub.log").mkdir()
+        return tmp_path
+
+    def test_testcase(self, artifact_dir):
+        testcase = TestCase("name", 0, Verdict.PASSED)
+        with patch("os.path.isfile") as isfile:
+            assert testcase.add_artifacts_from_dir(str(artifact_dir), "*.log") == []
+            isfile.assert_not_called()
+
+        artifacts = testcase.get_artifacts()
+        assert [os.path.basename(artifact.get_file_path()) for artifact in artifacts] == ["a.log", "b.log"]
+        assert [artifact.get_path_in_upload_zip() for artifact in artifacts] == [
+            Artifact(str(artifact_dir / name)).get_path_in_upload_zip() for name in ("a.log", "b.log")]
+        assert not any(artifact.is_hash_pending() for artifact in artifacts)
+
+    def test_teststep(self, artifact_dir, testsuite):
+        teststep = TestStep("ts", Verdict.PASSED)
+        registry = testsuite.get_artifact_registry()
+        teststep.add_artifacts_from_dir(str(artifact_dir), TestStepArtifactType.IMAGE, lazy=True, registry=registry)
+
+        artifacts = teststep.get_artifacts()
+        assert [artifact.get_name() for artifact in artifacts] == ["a.log", "b.log", "c.txt"]
+        assert all(artifact.is_hash_pending() for artifact in artifacts)
+        assert all(artifact.get_artifact_type() == TestStepArtifactType.IMAGE for artifact in artifacts)
+        assert artifacts[0] is registry.get_teststep_artifact(str(artifact_dir / "a.log"), TestStepArtifactType.IMAGE)
+
+        with pytest.raises(TypeError, match="TestStepArtifactType"):
+            teststep.add_artifacts_from_dir(str(artifact_dir), "IMAGE")
+
+    def test_invalid_file(self, artifact_dir, caplog):
+        os.symlink(artifact_dir / "missing.log", artifact_dir / "broken.log")
+        testcase = TestCase("name", 0, Verdict.PASSED)
+
+        with pytest.raises(OSError, match="broken.log"):
+            testcase.add_artifacts_from_dir(str(artifact_dir), "*.log")
+        assert testcase.get_artifacts() == []
+
+        skipped = testcase.add_artifacts_from_dir(str(artifact_dir), "*.log", ignore_on_error=True)
+        assert skipped == [str(artifact_dir / "broken.log")]
+        assert len(testcase.get_artifacts()) == 2
+        assert "broken.log' for testcase 'name' is invalid" in caplog.text
+
+    def test_registry_stats_each_file_once(self, artifact_dir, testsuite):
+        registry = testsuite.get_artifact_registry()
+        testcase = TestCase("name", 0, Verdict.PASSED)
+        with patch("os.stat", wraps=os.stat) as stat:
+            testcase.add_artifacts_from_dir(str(artifact_dir), "*.log", lazy=True, registry=registry)
+            stat.assert_not_called()
+
+        assert 2 == len(registry)
+        assert testcase.get_artifacts()[0] is registry.get_artifact(str(artifact_dir / "a.log"))
+
+    def test_invalid_file_with_registry(self, artifact_dir, testsuite):
+        os.symlink(artifact_dir / "missing.log", artifact_dir / "broken.log")
+        registry = testsuite.get_artifact_registry()
+        testcase = TestCase("name", 0, Verdict.PASSED)
+
+        with pytest.raises(OSError, match="broken.log"):
+            testcase.add_artifacts_from_dir(str(artifact_dir), "*.log", registry=registry)
+        assert testcase.get_artifacts() == []
+        assert 0 == len(registry)
+
+        shared = registry.get_artifact(str(artifact_dir / "b.log"))
+        testcase.add_artifacts_from_dir(str(artifact_dir), "*.log", ignore_on_error=True, registry=registry)
+        assert [artifact.get_name() for artifact in testcase.get_artifacts()] == ["a.log", "b.log"]
+        assert testcase.get_artifacts()[1] is shared
+        assert 2 == len(registry)
+
+    def test_unreadable_file(self, artifact_dir):
+        def md5_hash(file_path):
+            if file_path.endswith("b.log"):
+                raise PermissionError(13, "Permission denied", file_path)
+            return "hash"
+
+        testcase = TestCase("name", 0, Verdict.PASSED)
+        with patch("testguide_report_generator.model.Artifact.get_md5_hash_from_file", side_effect=md5_hash):
+            with pytest.raises(PermissionError):
+                testcase.add_artifacts_from_dir(str(artifact_dir), "*.log")
+            skipped = testcase.add_artifacts_from_dir(str(artifact_dir), "*.log", ignore_on_error=True)
+
+        assert skipped == [str(artifact_dir / "b.log")]
+        assert [artifact.get_path_in_upload_zip() for artifact in testcase.get_artifacts()] == ["hash/a.log"]
+
+    def test_invalid_directory(self, tmp_path, caplog):
+        testcase = TestCase("name", 0, Verdict.PASSED)
+        with pytest.raises(OSError):
+            testcase.add_artifacts_from_dir(str(tmp_path / "missing"))
+
+        assert testcase.add_artifacts_from_dir(str(tmp_path / "missing"), ignore_on_error=True) == [
+            str(tmp_path / "missing")]
+        assert "will be ignored" in caplog.text
+
+
 class TestConstant:
     def test_correct_json_repr(self, constant):
         json_str = json.dumps(constant.create_json_repr())
         assert '{"key": "const", "value": "one"}' == json_str
 
+    def test_value(self):
+        values = ["one", "two"]
+        constant = Constant("const", values)
+        values.append(3)
+
+        assert constant.create_json_repr()["value"] == ["one", "two"]
+        with pytest.raises(TypeError, match="Constant:value"):
+            Constant("const", values)
+
 
 class TestAttribute:
     def test_correct_json_repr(self, attribute):
         json_str = json.dumps(attribute.create_json_repr())
         assert '{"key": "an", "value": "attribute"}' == json_str
 
+    @pytest.mark.parametrize("value", [None, 1, ("a",)])
+    def test_value_error(self, value):
+        with pytest.raises(TypeError, match="Attribute:value"):
+            Attribute("an", value)
+
 
 class TestReview:
     def test_correct_json_repr(self, review):
@@ -333,6 +570,22 @@ class TestReview:
             review.add_contacts(["x" * 256])
         assert str(e.value) == error_msg
 
+    @pytest.mark.parametrize("timestamp, error", [(-1, ValueError), (None, TypeError)])
+    def test_timestamp_error(self, timestamp, error):
+        with pytest.raises(error, match="Review:timestamp"):
+            Review("Review-Comment", "Reviewer", timestamp)
+
+    def test_setter_type_errors(self, review):
+        with pytest.raises(TypeError, match="Argument 'invalid' must be of type 'bool'."):
+            review.set_invalid_run(1)
+        with pytest.raises(TypeError, match="Review tags must be of type 'str'."):
+            review.add_tags(["tag", None])
+        with pytest.raises(TypeError, match="Review:ticket"):
+            review.add_tickets([1])
+
+        json_repr = review.add_tags(tag for tag in ["Tag1"]).create_json_repr()
+        assert json_repr["tags"] == ["Tag1"] and json_repr["tickets"] == []
+
     def test_full_review_object(self, review):
         review.set_verdict(Verdict.PASSED)
         review.set_summary("This is a valid summary.")
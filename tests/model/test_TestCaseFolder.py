@@ -7,6 +7,8 @@ import json
 import pytest
 
 from testguide_report_generator.model.TestCase import TestCase, Verdict
+from testguide_report_generator.model.TestCaseFolder import TestCaseFolder
+from testguide_report_generator.util.JsonValidator import JsonValidator
 
 
 def test_empty(testcase_folder_empty):
@@ -47,3 +49,13 @@ def test_correct_json_repr(testcase_folder, testcase_json_path):
     assert len(json_repr["testcases"]) == 2
     assert json.dumps(expected_json_repr) == tc_json_str
     assert json_repr["testcases"][1]["verdict"] == "ERROR"
+
+
+def test_add_testcase_validated(json_schema_path, invalid_testcase):
+    folder = TestCaseFolder("folder", JsonValidator(json_schema_path))
+
+    folder.add_testcase(TestCase("valid", 0, Verdict.PASSED))
+    with pytest.raises(ValueError):
+        folder.add_testcase(TestCaseFolder("nested").add_testcase(invalid_testcase))
+
+    assert len(folder.get_testcases()) == 1
@@ -4,7 +4,9 @@
 import pytest
 
 from testguide_report_generator.model.TestCase import TestCase, Verdict
+from testguide_report_generator.model.TestCaseFolder import TestCaseFolder
 from testguide_report_generator.model.TestSuite import TestSuite
+from testguide_report_generator.util.JsonValidator import JsonValidator
 import json
 
 NAME_ERROR_MSG = "The TestSuite:name must have a length between 1 and 120 characters."
@@ -62,3 +64,18 @@ def test_correct_json_representation_it(testcase_folder_empty, testcase_folder,
         expected_json_repr = json.load(file)
 
     assert json.dumps(expected_json_repr) == json_str
+
+
+def test_add_testcase_validated(json_schema_path, invalid_testcase):
+    validator = JsonValidator(json_schema_path)
+    testsuite = TestSuite("suite", 0, validator)
+    folder = TestCaseFolder("folder").add_testcase(TestCase("nested", 0, Verdict.PASSED))
+
+    testsuite.add_testcase(TestCase("valid", 0, Verdict.PASSED)).add_testcase(folder)
+    with pytest.raises(ValueError) as error:
+        testsuite.add_testcase(invalid_testcase)
+
+    assert str(error.value) == "TestCase 'invalid' does not comply with the schema."
+    assert len(testsuite.get_testcases()) == 2
+    assert testsuite.get_validator() is validator
+    assert validator.get_testcase_result(folder.get_testcases()[0]) is True
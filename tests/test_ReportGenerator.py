@@ -2,17 +2,27 @@
 #
 # SPDX-License-Identifier: MIT
 
-from zipfile import ZipFile
+import asyncio
+import hashlib
+import io
+import json
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from zipfile import ZipFile, ZIP_DEFLATED, ZIP_STORED
 from unittest.mock import patch
 
 import pytest
 
+from testguide_report_generator.util.ArtifactData import ArtifactData, DEFAULT_MEMORY_BUDGET
+from testguide_report_generator.util.CompressionPolicy import CompressionPolicy
 from testguide_report_generator.util.File import get_md5_hash_from_file
+from testguide_report_generator.util.JsonEncoding import JsonEncoding
 from testguide_report_generator.util.JsonValidator import JsonValidator
+from testguide_report_generator.util.UploadZip import UploadZipFile
 from testguide_report_generator.ReportGenerator import Generator
 import os
 
-from testguide_report_generator.model.TestCase import TestCase, Verdict
+from testguide_report_generator.model.TestCase import TestCase, TestStep, TestStepArtifactType, Verdict
 from testguide_report_generator.model.TestCaseFolder import TestCaseFolder
 from testguide_report_generator.model.TestSuite import TestSuite
 
@@ -71,3 +81,655 @@ def test_ReportGenerator_export_wrong_testcase_format(json_schema_path):
         generator = Generator(testsuite, json_schema_path)
         with pytest.raises(TypeError):
             generator.export("out.json")
+
+
+def test_ReportGenerator_export_streaming(testsuite, testcase, json_schema_path, tmp_path):
+    testsuite.add_testcase(testcase)
+    testsuite.add_testcase(TestCaseFolder("folder").add_testcase(TestCase("name", 123, Verdict.FAILED)))
+
+    Generator(testsuite, json_schema_path).export(str(tmp_path / "regular.json"))
+    outfile_path = Generator(testsuite, json_schema_path, streaming=True).export(str(tmp_path / "streamed.json"))
+
+    assert str(tmp_path / "streamed.zip") == outfile_path
+    assert (tmp_path / "regular.json").read_bytes() == (tmp_path / "streamed.json").read_bytes()
+    assert "streamed.json" in ZipFile(outfile_path).namelist()
+
+
+def test_ReportGenerator_export_streaming_invalid_json(testsuite, json_schema_path, tmp_path, invalid_testcase):
+    generator = Generator(testsuite, json_schema_path, streaming=True)
+    assert None is generator.export(str(tmp_path / "out.json"))
+
+    testsuite.add_testcase(invalid_testcase)
+    assert None is generator.export(str(tmp_path / "out.json"))
+    assert not (tmp_path / "out.json").exists()
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_ReportGenerator_export_without_json(testsuite, testcase, json_schema_path, tmp_path, streaming):
+    testsuite.add_testcase(testcase)
+    generator = Generator(testsuite, json_schema_path, streaming=streaming)
+
+    generator.export(str(tmp_path / "kept.json"))
+    outfile_path = generator.export(str(tmp_path / "report.json"), keep_json=False)
+
+    assert str(tmp_path / "report.zip") == outfile_path
+    assert not (tmp_path / "report.json").exists()
+    with ZipFile(outfile_path) as zip_obj:
+        assert (tmp_path / "kept.json").read_bytes() == zip_obj.read("report.json")
+        assert ZIP_DEFLATED == zip_obj.getinfo("report.json").compress_type
+
+
+def test_ReportGenerator_export_skips_duplicate_artifacts(testsuite, json_schema_path, artifact_path,
+                                                          artifact_path2, tmp_path):
+    for _ in range(3):
+        testsuite.add_testcase(TestCase("name", 123, Verdict.PASSED).add_artifact(artifact_path))
+    testsuite.add_testcase(TestCase("name", 123, Verdict.PASSED).add_artifact(artifact_path2))
+    generator = Generator(testsuite, json_schema_path)
+
+    for _ in range(2):
+        outfile_path = generator.export(str(tmp_path / "out.json"))
+
+        assert 2 == generator.get_written_artifact_count()
+        assert 2 == generator.get_skipped_duplicate_count()
+        with ZipFile(outfile_path) as zip_obj:
+            assert 3 == len(zip_obj.namelist())
+
+
+def test_ReportGenerator_export_compression_policy(testsuite, json_schema_path, tmp_path):
+    image_path = tmp_path / "image.png"
+    image_path.write_bytes(b"\x89PNG" * 100)
+    testcase = TestCase("name", 123, Verdict.PASSED)
+    testcase.add_artifact(str(image_path))
+    testcase.add_artifact(json_schema_path)
+    testsuite.add_testcase(testcase)
+
+    generator = Generator(testsuite, json_schema_path, compression_policy=CompressionPolicy(compresslevel=1))
+    with ZipFile(generator.export(str(tmp_path / "out.json"))) as zip_obj:
+        compress_types = {os.path.basename(info.filename): info.compress_type for info in zip_obj.infolist()}
+
+    assert {"out.json": ZIP_DEFLATED, "image.png": ZIP_STORED, "schema.json": ZIP_DEFLATED} == compress_types
+
+
+def test_ReportGenerator_export_parallel(testsuite, json_schema_path, artifact_path, tmp_path):
+    for index in range(20):
+        path = tmp_path / f"artifact_{index}.txt"
+        path.write_text(str(index) * 1000 * index)
+        testsuite.add_testcase(TestCase("name", 123, Verdict.PASSED).add_artifact(str(path)))
+    testsuite.add_testcase(TestCase("name", 123, Verdict.PASSED).add_artifact(artifact_path))
+
+    sequential_path = Generator(testsuite, json_schema_path).export(str(tmp_path / "sequential.json"))
+    generator = Generator(testsuite, json_schema_path, workers=4)
+    with patch("testguide_report_generator.ReportGenerator.MAX_IN_MEMORY_ARTIFACT_SIZE", 10000):
+        parallel_path = generator.export(str(tmp_path / "parallel.json"))
+
+    assert 21 == generator.get_written_artifact_count()
+    with ZipFile(sequential_path) as sequential, ZipFile(parallel_path) as parallel:
+        assert parallel.testzip() is None
+        assert sequential.namelist()[1:] == parallel.namelist()[1:]
+        for sequential_info, parallel_info in zip(sequential.infolist()[1:], parallel.infolist()[1:]):
+            assert (sequential_info.CRC, sequential_info.compress_size) == (parallel_info.CRC,
+                                                                            parallel_info.compress_size)
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+@pytest.mark.parametrize("max_in_memory", [0, 10000])
+@pytest.mark.parametrize("precompressed", [True, False])
+def test_ReportGenerator_export_lazy_artifacts(testsuite, json_schema_path, tmp_path, workers, max_in_memory,
+                                               precompressed):
+    paths = []
+    with patch("testguide_report_generator.model.Artifact.get_md5_hash_from_file",
+               wraps=get_md5_hash_from_file) as mock:
+        for index in range(5):
+            path = tmp_path / f"artifact_{index}.txt"
+            path.write_text(str(index) * 100)
+            paths.append(str(path))
+            testsuite.add_testcase(TestCase("name", 123, Verdict.PASSED).add_artifact(str(path), lazy=True))
+        # same content and name as artifact_0.txt
+        (tmp_path / "copy").mkdir()
+        (tmp_path / "copy" / "artifact_0.txt").write_text("0" * 100)
+        testsuite.add_testcase(TestCase("name", 123, Verdict.PASSED)
+                               .add_artifact(str(tmp_path / "copy" / "artifact_0.txt"), lazy=True))
+        assert 0 == mock.call_count
+
+        generator = Generator(testsuite, json_schema_path, workers=workers)
+        with patch("testguide_report_generator.ReportGenerator.MAX_IN_MEMORY_ARTIFACT_SIZE", max_in_memory), \
+                patch("testguide_report_generator.ReportGenerator.supports_precompressed_entries",
+                      return_value=precompressed), \
+                patch.object(UploadZipFile, "write_compressed", autospec=True,
+                             side_effect=UploadZipFile.write_compressed) as write_compressed:
+            outfile_path = generator.export(str(tmp_path / "out.json"))
+        # hashed while compressing, unless too large to be compressed into memory
+        assert (0 if max_in_memory and precompressed else 6) == mock.call_count
+        assert write_compressed.called == (max_in_memory > 0 and precompressed)
+
+    assert (5, 1) == (generator.get_written_artifact_count(), generator.get_skipped_duplicate_count())
+    with ZipFile(outfile_path) as zip_obj:
+        assert zip_obj.testzip() is None
+        expected = [f"{get_md5_hash_from_file(path)}/{os.path.basename(path)}" for path in paths]
+        assert [*expected, "out.json"] == zip_obj.namelist()
+        report = json.loads(zip_obj.read("out.json"))
+    assert expected == [testcase["artifacts"][0] for testcase in report["testcases"]][:5]
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_ReportGenerator_export_without_precompressed_entries(json_schema_path, artifact_path, artifact_path2,
+                                                              tmp_path, workers):
+    def export(precompressed):
+        testsuite = TestSuite("MyTestSuite", 1666698047000)
+        testsuite.add_testcase(TestCase("eager", 123, Verdict.PASSED).add_artifact(artifact_path))
+        testsuite.add_testcase(TestCase("lazy", 123, Verdict.PASSED).add_artifact(artifact_path2, lazy=True))
+        testsuite.add_testcase(TestCase("memory", 123, Verdict.PASSED)
+                               .add_artifact(ArtifactData("memory.txt", b"in memory" * 1000)))
+        (tmp_path / str(precompressed)).mkdir()
+        # entries written from memory are stamped with the current time
+        with patch("time.time", return_value=1666698047.0), \
+                patch("testguide_report_generator.ReportGenerator.supports_precompressed_entries",
+                      return_value=precompressed):
+            outfile_path = Generator(testsuite, json_schema_path, workers=workers) \
+                .export(str(tmp_path / str(precompressed) / "out.json"))
+        with open(outfile_path, "rb") as file:
+            return file.read()
+
+    with patch.object(UploadZipFile, "write_compressed", autospec=True,
+                      side_effect=UploadZipFile.write_compressed) as write_compressed:
+        expected = export(True)
+        assert write_compressed.called
+        write_compressed.reset_mock()
+        assert expected == export(False)
+        assert not write_compressed.called
+
+
+@pytest.mark.parametrize("export", ["export", "export_to_stream"])
+def test_ReportGenerator_export_hashes_own_lazy_artifacts(testsuite, json_schema_path, artifact_path,
+                                                          artifact_path2, tmp_path, export):
+    testsuite.add_testcase(TestCase("name", 123, Verdict.PASSED).add_artifact(artifact_path, lazy=True))
+    unrelated = TestCase("unrelated", 123, Verdict.PASSED).add_artifact(artifact_path2, lazy=True)
+
+    generator = Generator(testsuite, json_schema_path)
+    assert generator.export(str(tmp_path / "out.json")) if export == "export" \
+        else generator.export_to_stream(io.BytesIO())
+
+    assert not testsuite.get_testcases()[0].get_artifacts()[0].is_hash_pending()
+    assert unrelated.get_artifacts()[0].is_hash_pending()
+
+
+def test_ReportGenerator_export_lazy_artifacts_invalid(testsuite, json_schema_path, artifact_path, tmp_path):
+    testsuite.add_testcase(TestCase("name", 123, Verdict.PASSED).add_artifact(artifact_path, lazy=True))
+
+    with patch.object(JsonValidator, "validate_json", return_value=False):
+        assert Generator(testsuite, json_schema_path).export(str(tmp_path / "out.json")) is None
+    assert not (tmp_path / "out.zip").exists()
+    assert not (tmp_path / "out.json").exists()
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_ReportGenerator_export_hash_algorithm(testsuite, json_schema_path, artifact_path, tmp_path, lazy):
+    artifact_testcase = TestCase("name", 123, Verdict.PASSED).add_artifact(artifact_path, lazy=lazy)
+    testsuite.add_testcase(artifact_testcase)
+    blake2b_hash = hashlib.blake2b(b"").hexdigest()
+    md5_hash = hashlib.md5(b"").hexdigest()
+
+    generator = Generator(testsuite, json_schema_path, hash_algorithm="blake2b")
+    outfile_path = generator.export(str(tmp_path / "out.json"))
+
+    with ZipFile(outfile_path) as zip_obj:
+        assert f"{blake2b_hash}/artifact.txt" in zip_obj.namelist()
+        assert [f"{blake2b_hash}/artifact.txt"] == json.loads(zip_obj.read("out.json"))["testcases"][0]["artifacts"]
+
+    stream = io.BytesIO()
+    assert generator.export_to_stream(stream, "out.json")
+    with ZipFile(stream) as zip_obj:
+        assert [f"{blake2b_hash}/artifact.txt"] == json.loads(zip_obj.read("out.json"))["testcases"][0]["artifacts"]
+
+    # the artifacts of the testsuite are not changed
+    artifact = artifact_testcase.get_artifacts()[0]
+    assert artifact.get_hash_algorithm() == "md5"
+    assert artifact.is_hash_pending() == lazy
+    assert artifact.create_json_repr() == f"{md5_hash}/artifact.txt"
+
+    outfile_path = Generator(testsuite, json_schema_path).export(str(tmp_path / "plain.json"))
+    with ZipFile(outfile_path) as zip_obj:
+        assert [f"{md5_hash}/artifact.txt"] == json.loads(zip_obj.read("plain.json"))["testcases"][0]["artifacts"]
+
+
+def test_ReportGenerator_export_sharded_hash_algorithm(testsuite, json_schema_path, artifact_path, tmp_path):
+    for index in range(2):
+        testsuite.add_testcase(TestCase(f"name {index}", 123, Verdict.PASSED).add_artifact(artifact_path, lazy=True))
+    blake2b_hash = hashlib.blake2b(b"").hexdigest()
+
+    zip_file_paths = Generator(testsuite, json_schema_path, hash_algorithm="blake2b", workers=2) \
+        .export_sharded(str(tmp_path / "out.json"), max_testcases=1)
+
+    assert len(zip_file_paths) == 2
+    for index, zip_file_path in enumerate(zip_file_paths, 1):
+        with ZipFile(zip_file_path) as zip_obj:
+            assert f"{blake2b_hash}/artifact.txt" in zip_obj.namelist()
+            report = json.loads(zip_obj.read(f"out_{index}.json"))
+            assert [f"{blake2b_hash}/artifact.txt"] == report["testcases"][0]["artifacts"]
+    assert testsuite.get_testcases()[0].get_artifacts()[0].is_hash_pending()
+
+
+def test_ReportGenerator_invalid_hash_algorithm(testsuite, json_schema_path):
+    with pytest.raises(ValueError, match="Unknown hash algorithm"):
+        Generator(testsuite, json_schema_path, hash_algorithm="unknown")
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+@pytest.mark.parametrize("lazy", [False, True])
+def test_ReportGenerator_export_artifact_data(testsuite, json_schema_path, tmp_path, workers, lazy):
+    contents = {"memory.txt": b"in memory" * 100, "spilled.png": b"spilled" * 100}
+    ArtifactData.set_memory_budget(1000, str(tmp_path))
+    try:
+        memory = ArtifactData("memory.txt", contents["memory.txt"])
+        spilled = ArtifactData("spilled.png", io.BytesIO(contents["spilled.png"]))
+    finally:
+        ArtifactData.set_memory_budget(DEFAULT_MEMORY_BUDGET)
+    assert spilled.get_file_path() is not None
+    testcase = TestCase("name", 123, Verdict.PASSED).add_artifact(memory, lazy=lazy)
+    testcase.add_setup_teststep(TestStep("step", Verdict.PASSED)
+                                .add_artifact(spilled, TestStepArtifactType.IMAGE, lazy=lazy))
+    testsuite.add_testcase(testcase)
+
+    outfile_path = Generator(testsuite, json_schema_path, workers=workers).export(str(tmp_path / "out.json"))
+
+    with ZipFile(outfile_path) as zip_obj:
+        assert zip_obj.testzip() is None
+        for name, content in contents.items():
+            assert content == zip_obj.read(f"{hashlib.md5(content).hexdigest()}/{name}")
+        assert ZIP_STORED == zip_obj.getinfo(f"{hashlib.md5(contents['spilled.png']).hexdigest()}/spilled.png") \
+            .compress_type
+
+
+def test_ReportGenerator_invalid_workers(testsuite, json_schema_path):
+    with pytest.raises(ValueError, match="workers"):
+        Generator(testsuite, json_schema_path, workers=0)
+
+
+def test_ReportGenerator_export_async(testsuite, testcase, json_schema_path, tmp_path):
+    testsuite.add_testcase(testcase)
+    generator = Generator(testsuite, json_schema_path)
+
+    sync_path = generator.export(str(tmp_path / "sync.json"))
+    async_path = asyncio.run(generator.export_async(str(tmp_path / "async.json")))
+
+    assert str(tmp_path / "async.zip") == async_path
+    assert (tmp_path / "sync.json").read_bytes() == (tmp_path / "async.json").read_bytes()
+    with ZipFile(sync_path) as sync_zip, ZipFile(async_path) as async_zip:
+        assert sync_zip.namelist()[1:] == async_zip.namelist()[1:]
+
+
+def test_ReportGenerator_export_async_cancel(testsuite, json_schema_path, artifact_path, tmp_path):
+    testsuite.add_testcase(TestCase("name", 123, Verdict.PASSED).add_artifact(artifact_path))
+    testsuite.add_testcase(TestCase("name", 123, Verdict.PASSED).add_artifact(json_schema_path))
+    started = threading.Event()
+    release = threading.Event()
+
+    def blocking_get_compression(file_path):
+        started.set()
+        release.wait(5)
+        return ZIP_DEFLATED, None
+
+    policy = CompressionPolicy()
+    policy.get_compression = blocking_get_compression
+    generator = Generator(testsuite, json_schema_path, compression_policy=policy)
+
+    async def export_and_cancel():
+        task = asyncio.create_task(generator.export_async(str(tmp_path / "out.json")))
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+        task.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        await task
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(export_and_cancel())
+
+    assert 1 == generator.get_written_artifact_count()
+    assert not (tmp_path / "out.zip").exists()
+    assert not (tmp_path / "out.json").exists()
+
+
+def test_ReportGenerator_export_async_cancel_after_completion(testsuite, testcase, json_schema_path, tmp_path):
+    testsuite.add_testcase(testcase)
+    generator = Generator(testsuite, json_schema_path)
+    finished = threading.Event()
+    export = generator._Generator__export
+
+    def export_and_notify(*args):
+        try:
+            return export(*args)
+        finally:
+            finished.set()
+
+    async def export_and_cancel():
+        with patch.object(generator, "_Generator__export", export_and_notify):
+            task = asyncio.create_task(generator.export_async(str(tmp_path / "out.json")))
+            await asyncio.sleep(0)
+            # blocks the event loop, so that the task cannot pick up the result before it is cancelled
+            assert finished.wait(5)
+            assert (tmp_path / "out.zip").exists()
+            task.cancel()
+            await task
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(export_and_cancel())
+
+    assert not (tmp_path / "out.zip").exists()
+    assert not (tmp_path / "out.json").exists()
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_ReportGenerator_export_sharded(testsuite, json_schema_path, artifact_path, artifact_path2, tmp_path,
+                                        workers):
+    testsuite.add_testcase(TestCase("one", 123, Verdict.PASSED).add_artifact(artifact_path))
+    testsuite.add_testcase(TestCaseFolder("folder").add_testcase(
+        TestCase("two", 123, Verdict.PASSED).add_artifact(artifact_path2)))
+    testsuite.add_testcase(TestCase("three", 123, Verdict.PASSED).add_artifact(artifact_path))
+    generator = Generator(testsuite, json_schema_path, workers=workers)
+
+    zip_file_paths = generator.export_sharded(str(tmp_path / "report.json"), max_testcases=1)
+
+    assert [str(tmp_path / f"report_{index}.zip") for index in (1, 2, 3)] == zip_file_paths
+    assert 3 == generator.get_written_artifact_count()
+    validator = JsonValidator(json_schema_path)
+    for index, (zip_file_path, artifact) in enumerate(zip(zip_file_paths, [artifact_path, artifact_path2,
+                                                                          artifact_path]), 1):
+        assert validator.validate_file(str(tmp_path / f"report_{index}.json"))
+        with ZipFile(zip_file_path) as zip_obj:
+            artifact_name = f"{get_md5_hash_from_file(artifact)}/{os.path.basename(artifact)}"
+            assert [f"report_{index}.json", artifact_name] == zip_obj.namelist()
+
+
+def test_ReportGenerator_export_sharded_invalid(testsuite, json_schema_path, tmp_path, invalid_testcase):
+    testsuite.add_testcase(TestCase("valid", 123, Verdict.PASSED))
+    testsuite.add_testcase(invalid_testcase)
+    generator = Generator(testsuite, json_schema_path)
+
+    assert None is generator.export_sharded(str(tmp_path / "report.json"), max_testcases=1)
+    assert [] == list(tmp_path.iterdir())
+
+
+def test_ReportGenerator_export_sharded_empty(testsuite, json_schema_path, tmp_path, capsys):
+    generator = Generator(testsuite, json_schema_path)
+
+    assert None is generator.export_sharded(str(tmp_path / "report.json"), max_testcases=1)
+    assert [] == list(tmp_path.iterdir())
+    assert "at least one TestCase" in capsys.readouterr().out
+
+
+def test_ReportGenerator_export_incremental(testsuite, json_schema_path, artifact_path, artifact_path2, tmp_path):
+    json_path = str(tmp_path / "report.json")
+    testsuite.add_testcase(TestCase("one", 123, Verdict.PASSED).add_artifact(artifact_path))
+    generator = Generator(testsuite, json_schema_path)
+
+    zip_file_path = generator.export_incremental(json_path)
+    assert str(tmp_path / "report.zip") == zip_file_path
+    assert 1 == generator.get_written_artifact_count()
+
+    testsuite.add_testcase(TestCase("two", 123, Verdict.PASSED).add_artifact(artifact_path))
+    testsuite.add_testcase(TestCaseFolder("folder").add_testcase(
+        TestCase("three", 123, Verdict.PASSED).add_artifact(artifact_path2)))
+    with patch.object(JsonValidator, "validate_json", autospec=True) as mock_validate:
+        assert zip_file_path == generator.export_incremental(json_path)
+    mock_validate.assert_not_called()
+    # the artifact of "two" has been exported by the previous checkpoint already
+    assert 1 == generator.get_written_artifact_count()
+    assert 0 == generator.get_skipped_duplicate_count()
+
+    assert zip_file_path == generator.export_incremental(json_path)
+    assert 0 == generator.get_written_artifact_count()
+    assert 0 == generator.get_skipped_duplicate_count()
+
+    expected = json.dumps(testsuite.create_json_repr(), indent=4).encode()
+    with ZipFile(zip_file_path) as zip_obj:
+        assert zip_obj.testzip() is None
+        assert [f"{get_md5_hash_from_file(artifact_path)}/artifact.txt",
+                f"{get_md5_hash_from_file(artifact_path2)}/artifact2.txt",
+                "report.json"] == zip_obj.namelist()
+        assert expected == zip_obj.read("report.json")
+    assert expected == (tmp_path / "report.json").read_bytes()
+
+
+def test_ReportGenerator_export_incremental_invalid(testsuite, json_schema_path, artifact_path, tmp_path,
+                                                   invalid_testcase):
+    json_path = str(tmp_path / "report.json")
+    generator = Generator(testsuite, json_schema_path)
+    assert None is generator.export_incremental(json_path)
+
+    testsuite.add_testcase(TestCase("one", 123, Verdict.PASSED).add_artifact(artifact_path))
+    zip_file_path = generator.export_incremental(json_path)
+    content = (tmp_path / "report.zip").read_bytes()
+
+    testsuite.add_testcase(invalid_testcase)
+    assert None is generator.export_incremental(json_path)
+    assert content == (tmp_path / "report.zip").read_bytes()
+
+    # a regular export in between starts the checkpoints from scratch
+    testsuite.get_testcases().pop()
+    assert zip_file_path == generator.export(json_path)
+    assert zip_file_path == generator.export_incremental(json_path)
+    with ZipFile(zip_file_path) as zip_obj:
+        assert "report.json" == zip_obj.namelist()[-1]
+
+
+def test_ReportGenerator_export_incremental_into_exported_folder(testsuite, json_schema_path, artifact_path,
+                                                                artifact_path2, tmp_path, invalid_testcase):
+    json_path = str(tmp_path / "report.json")
+    folder = TestCaseFolder("folder").add_testcase(TestCase("one", 123, Verdict.PASSED).add_artifact(artifact_path))
+    testsuite.add_testcase(folder)
+    generator = Generator(testsuite, json_schema_path)
+    zip_file_path = generator.export_incremental(json_path)
+    content = (tmp_path / "report.zip").read_bytes()
+
+    folder.add_testcase(invalid_testcase)
+    assert None is generator.export_incremental(json_path)
+    assert content == (tmp_path / "report.zip").read_bytes()
+
+    folder.get_testcases().pop()
+    folder.add_testcase(TestCase("two", 123, Verdict.PASSED).add_artifact(artifact_path2))
+    assert zip_file_path == generator.export_incremental(json_path)
+    assert 1 == generator.get_written_artifact_count()
+
+    with ZipFile(zip_file_path) as zip_obj:
+        assert zip_obj.testzip() is None
+        assert [f"{get_md5_hash_from_file(artifact_path)}/artifact.txt",
+                f"{get_md5_hash_from_file(artifact_path2)}/artifact2.txt",
+                "report.json"] == zip_obj.namelist()
+        assert json.dumps(testsuite.create_json_repr(), indent=4).encode() == zip_obj.read("report.json")
+
+
+def test_ReportGenerator_export_incremental_failure(testsuite, json_schema_path, artifact_path, artifact_path2,
+                                                   tmp_path):
+    json_path = str(tmp_path / "report.json")
+    testsuite.add_testcase(TestCase("one", 123, Verdict.PASSED).add_artifact(artifact_path))
+    generator = Generator(testsuite, json_schema_path)
+    with patch.object(JsonEncoding, "create_stream_writer", side_effect=OSError):
+        with pytest.raises(OSError):
+            generator.export_incremental(json_path)
+    assert [] == list(tmp_path.iterdir())
+
+    zip_file_path = generator.export_incremental(json_path)
+    zip_content = (tmp_path / "report.zip").read_bytes()
+    json_content = (tmp_path / "report.json").read_bytes()
+
+    testsuite.add_testcase(TestCase("two", 123, Verdict.PASSED).add_artifact(artifact_path2))
+    with patch.object(JsonEncoding, "create_stream_writer", side_effect=OSError):
+        with pytest.raises(OSError):
+            generator.export_incremental(json_path)
+    assert zip_content == (tmp_path / "report.zip").read_bytes()
+    assert json_content == (tmp_path / "report.json").read_bytes()
+    assert ["report.json", "report.zip"] == sorted(path.name for path in tmp_path.iterdir())
+
+    assert zip_file_path == generator.export_incremental(json_path)
+    assert 1 == generator.get_written_artifact_count()
+    with ZipFile(zip_file_path) as zip_obj:
+        assert zip_obj.testzip() is None
+        assert [f"{get_md5_hash_from_file(artifact_path)}/artifact.txt",
+                f"{get_md5_hash_from_file(artifact_path2)}/artifact2.txt",
+                "report.json"] == zip_obj.namelist()
+        assert (tmp_path / "report.json").read_bytes() == zip_obj.read("report.json")
+
+
+class _UnseekableStream(io.RawIOBase):
+    def __init__(self):
+        self.content = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.content.extend(data)
+        return len(data)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_ReportGenerator_export_to_stream(testsuite, testcase, json_schema_path, artifact_path, tmp_path, workers):
+    testsuite.add_testcase(testcase)
+    testsuite.add_testcase(TestCase("name", 123, Verdict.PASSED).add_artifact(json_schema_path))
+    generator = Generator(testsuite, json_schema_path, workers=workers)
+    generator.export(str(tmp_path / "file.json"))
+
+    buffer = io.BytesIO()
+    assert generator.export_to_stream(buffer, "custom.json")
+    unseekable = _UnseekableStream()
+    assert generator.export_to_stream(unseekable)
+
+    assert ["file.json"] == [path.name for path in tmp_path.iterdir() if path.suffix == ".json"]
+    for content, json_name in ((buffer.getvalue(), "custom.json"), (bytes(unseekable.content), "report.json")):
+        with ZipFile(io.BytesIO(content)) as zip_obj, ZipFile(tmp_path / "file.zip") as expected:
+            assert zip_obj.testzip() is None
+            assert [json_name, *expected.namelist()[1:]] == zip_obj.namelist()
+            assert (tmp_path / "file.json").read_bytes() == zip_obj.read(json_name)
+
+
+def test_ReportGenerator_export_to_stream_invalid_json(testsuite, json_schema_path):
+    buffer = io.BytesIO()
+    assert not Generator(testsuite, json_schema_path).export_to_stream(buffer)
+    assert b"" == buffer.getvalue()
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_ReportGenerator_export_compact(testsuite, testcase, json_schema_path, tmp_path, streaming):
+    testsuite.add_testcase(testcase)
+    generator = Generator(testsuite, json_schema_path, streaming=streaming,
+                          json_encoding=JsonEncoding.compact(backend="json"))
+
+    with ZipFile(generator.export(str(tmp_path / "out.json"))) as zip_obj:
+        content = zip_obj.read("out.json").decode("utf-8")
+
+    assert json.dumps(testsuite.create_json_repr(), separators=(",", ":"), ensure_ascii=False) == content
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_ReportGenerator_export_validated_testcases(testcase, json_schema_path, tmp_path, streaming):
+    testsuite = TestSuite("suite", 1666698047000, JsonValidator(json_schema_path))
+    testsuite.add_testcase(testcase)
+    testsuite.add_testcase(TestCaseFolder("folder").add_testcase(TestCase("name", 123, Verdict.FAILED)))
+    reference = TestSuite("suite", 1666698047000)
+    for node in testsuite.get_testcases():
+        reference.add_testcase(node)
+
+    Generator(reference, json_schema_path).export(str(tmp_path / "reference.json"))
+    with patch.object(JsonValidator, "validate_json") as mock:
+        outfile_path = Generator(testsuite, json_schema_path, streaming=streaming).export(str(tmp_path / "out.json"))
+
+    mock.assert_not_called()
+    assert str(tmp_path / "out.zip") == outfile_path
+    assert (tmp_path / "reference.json").read_bytes() == (tmp_path / "out.json").read_bytes()
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_ReportGenerator_export_validated_testcases_invalid(json_schema_path, tmp_path, streaming, invalid_testcase):
+    testsuite = TestSuite("suite", 1666698047000, JsonValidator(json_schema_path))
+    generator = Generator(testsuite, json_schema_path, streaming=streaming)
+    assert None is generator.export(str(tmp_path / "out.json"))
+
+    # testcases added to a folder without validator after the folder was added are checked on export
+    folder = TestCaseFolder("folder").add_testcase(TestCase("valid", 0, Verdict.PASSED))
+    testsuite.add_testcase(folder)
+    assert str(tmp_path / "out.zip") == generator.export(str(tmp_path / "out.json"))
+    folder.add_testcase(invalid_testcase)
+    assert None is generator.export(str(tmp_path / "other.json"))
+
+
+def test_ReportGenerator_export_validated_testcases_other_schema(testcase, json_schema_path, tmp_path):
+    schema_path = tmp_path / "schema.json"
+    schema_path.write_text(open(json_schema_path, encoding="utf-8").read())
+    testsuite = TestSuite("suite", 1666698047000, JsonValidator(str(schema_path)))
+    testsuite.add_testcase(testcase)
+
+    with patch.object(JsonValidator, "validate_json", return_value=True) as mock:
+        Generator(testsuite, json_schema_path).export(str(tmp_path / "out.json"))
+
+    mock.assert_called_once()
+
+
+def test_ReportGenerator_export_validation_processes(testsuite, json_schema_path, tmp_path, invalid_testcase):
+    for index in range(4):
+        testsuite.add_testcase(TestCase(f"testcase {index}", 0, Verdict.PASSED))
+    generator = Generator(testsuite, json_schema_path, validation_processes=2)
+    with patch("testguide_report_generator.util.JsonValidator.MIN_PARALLEL_TESTCASES", 0), \
+            patch("testguide_report_generator.util.JsonValidator.ProcessPoolExecutor",
+                  wraps=ProcessPoolExecutor) as mock:
+        assert str(tmp_path / "out.zip") == generator.export(str(tmp_path / "out.json"))
+        mock.assert_not_called()
+
+        testsuite.add_testcase(invalid_testcase)
+        assert None is generator.export(str(tmp_path / "invalid.json"))
+        mock.assert_called_once()
+
+    with pytest.raises(ValueError):
+        Generator(testsuite, json_schema_path, streaming=True, validation_processes=0)
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_ReportGenerator_export_trusted(testsuite, testcase, json_schema_path, tmp_path, streaming):
+    testsuite.add_testcase(testcase)
+    Generator(testsuite, json_schema_path, streaming=streaming).export(str(tmp_path / "validated.json"))
+
+    with patch.object(JsonValidator, "validate_json") as validate_json, \
+            patch.object(JsonValidator, "validate_testcase") as validate_testcase:
+        generator = Generator(testsuite, json_schema_path, streaming=streaming, trusted=True)
+        assert str(tmp_path / "trusted.zip") == generator.export(str(tmp_path / "trusted.json"))
+
+    validate_json.assert_not_called()
+    validate_testcase.assert_not_called()
+    assert (tmp_path / "validated.json").read_bytes() == (tmp_path / "trusted.json").read_bytes()
+
+
+def test_ReportGenerator_export_trusted_sharded_incremental(testsuite, tmp_path):
+    for index in range(3):
+        testsuite.add_testcase(TestCase(f"testcase {index}", 0, Verdict.PASSED))
+    generator = Generator(testsuite, trusted=True)
+
+    with patch.object(JsonValidator, "validate_json") as validate_json:
+        assert 3 == len(generator.export_sharded(str(tmp_path / "report.json"), max_testcases=1))
+        assert str(tmp_path / "incremental.zip") == generator.export_incremental(str(tmp_path / "incremental.json"))
+
+    validate_json.assert_not_called()
+
+
+def test_ReportGenerator_export_trusted_empty(testsuite, tmp_path, capsys):
+    generator = Generator(testsuite, trusted=True)
+
+    assert None is generator.export(str(tmp_path / "out.json"))
+    assert None is generator.export_incremental(str(tmp_path / "out.json"))
+    assert not generator.export_to_stream(io.BytesIO())
+    assert "The testsuite must contain at least one TestCase or TestCaseFolder." in capsys.readouterr().out
+    assert [] == list(tmp_path.iterdir())
+
+
+def test_ReportGenerator_export_trusted_subclass(testsuite, invalid_testcase, tmp_path):
+    # reports changed by subclasses of the model are not validated in trusted mode
+    testsuite.add_testcase(invalid_testcase)
+
+    assert None is Generator(testsuite).export(str(tmp_path / "validated.json"))
+    assert str(tmp_path / "trusted.zip") == Generator(testsuite, trusted=True).export(str(tmp_path / "trusted.json"))
+
+
+def test_ReportGenerator_trusted_other_schema(testsuite, json_schema_path, tmp_path):
+    schema_path = tmp_path / "schema.json"
+    schema_path.write_text(open(json_schema_path, encoding="utf-8").read())
+
+    with pytest.raises(ValueError, match="Trusted exports only support the default schema."):
+        Generator(testsuite, str(schema_path), trusted=True)
@@ -0,0 +1,103 @@
+# Copyright (c) 2023-2024 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+import gc
+import io
+import os
+
+import pytest
+
+from testguide_report_generator.util.ArtifactData import ArtifactData, DEFAULT_MEMORY_BUDGET
+
+
+@pytest.fixture
+def memory_budget(tmp_path):
+    def set_memory_budget(max_bytes):
+        ArtifactData.set_memory_budget(max_bytes, str(tmp_path))
+
+    yield set_memory_budget
+    ArtifactData.set_memory_budget(DEFAULT_MEMORY_BUDGET)
+
+
+@pytest.mark.parametrize("content", [b"content", bytearray(b"content"), memoryview(b"content"),
+                                     io.BytesIO(b"content"), [b"con", bytearray(b"te"), memoryview(b"nt")]])
+def test_in_memory(content):
+    used = ArtifactData.get_memory_used()
+    data = ArtifactData("screenshot.png", content)
+
+    assert "screenshot.png" == data.get_name()
+    assert 7 == data.get_size()
+    assert b"content" == data.get_data()
+    assert data.get_file_path() is None
+    assert used + 7 == ArtifactData.get_memory_used()
+
+    del data
+    gc.collect()
+    assert used == ArtifactData.get_memory_used()
+
+
+def test_bytes_are_not_copied():
+    content = b"content" * 100
+    assert content is ArtifactData("a.bin", content).get_data().obj
+
+
+def test_spill_to_disk(memory_budget, tmp_path):
+    memory_budget(10)
+    used = ArtifactData.get_memory_used()
+
+    data = ArtifactData("log.txt", iter([b"12345", b"67890", b"abc"]))
+
+    assert data.get_data() is None
+    assert 13 == data.get_size()
+    assert used == ArtifactData.get_memory_used()
+    file_path = data.get_file_path()
+    assert "log.txt" == os.path.basename(file_path)
+    assert str(tmp_path) == os.path.dirname(os.path.dirname(file_path))
+    with open(file_path, "rb") as file:
+        assert b"1234567890abc" == file.read()
+
+    del data
+    gc.collect()
+    assert not os.path.exists(os.path.dirname(file_path))
+
+
+def test_spill_file_is_removed_on_error(memory_budget, tmp_path):
+    def chunks():
+        yield b"12345"
+        yield b"67890"
+        raise OSError("read error")
+
+    memory_budget(5)
+    used = ArtifactData.get_memory_used()
+
+    with pytest.raises(OSError, match="read error"):
+        ArtifactData("log.txt", chunks())
+
+    assert used == ArtifactData.get_memory_used()
+    assert [] == os.listdir(tmp_path)
+
+
+def test_budget_is_shared(memory_budget):
+    memory_budget(10)
+    first = ArtifactData("first.txt", b"123456")
+    second = ArtifactData("second.txt", b"123456")
+
+    assert first.get_data() is not None
+    assert second.get_data() is None
+
+
+@pytest.mark.parametrize("name", ["", ".", "..", "dir/name.txt", "dir\\name.txt"])
+def test_invalid_name(name):
+    with pytest.raises(ValueError, match="file name without directories"):
+        ArtifactData(name, b"")
+
+
+def test_invalid_content():
+    with pytest.raises(TypeError, match="content"):
+        ArtifactData("name.txt", 123)
+
+
+def test_invalid_budget():
+    with pytest.raises(ValueError):
+        ArtifactData.set_memory_budget(-1)
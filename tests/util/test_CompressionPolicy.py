@@ -0,0 +1,51 @@
+# Copyright (c) 2023-2024 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+import os
+from zipfile import ZIP_DEFLATED, ZIP_STORED
+
+import pytest
+
+from testguide_report_generator.util.CompressionPolicy import CompressionPolicy
+
+
+@pytest.fixture
+def random_file(tmp_path):
+    path = tmp_path / "random.bin"
+    path.write_bytes(os.urandom(4096))
+    return str(path)
+
+
+@pytest.mark.parametrize("file_path", ["shot.png", "SHOT.JPG", "video.mp4", "nested.zip"])
+def test_compressed_types_are_stored(file_path):
+    assert (ZIP_STORED, None) == CompressionPolicy(compresslevel=9).get_compression(file_path)
+
+
+def test_other_types_are_deflated(artifact_path):
+    assert (ZIP_DEFLATED, None) == CompressionPolicy().get_compression(artifact_path)
+    assert (ZIP_DEFLATED, 3) == CompressionPolicy(compresslevel=3).get_compression(artifact_path)
+
+
+def test_custom_stored_extensions():
+    policy = CompressionPolicy(stored_extensions=[".mf4"])
+    assert not policy.is_compressible("trace.mf4")
+    assert policy.is_compressible("shot.png")
+
+
+def test_sample_compressibility(random_file, json_schema_path):
+    assert CompressionPolicy().is_compressible(random_file)
+
+    policy = CompressionPolicy(sample_size=1024)
+    assert not policy.is_compressible(random_file)
+    assert policy.is_compressible(json_schema_path)
+
+
+def test_sample_empty_file(artifact_path):
+    assert CompressionPolicy(sample_size=1024).is_compressible(artifact_path)
+
+
+@pytest.mark.parametrize("compresslevel", [-1, 10])
+def test_invalid_compresslevel(compresslevel):
+    with pytest.raises(ValueError, match="compresslevel"):
+        CompressionPolicy(compresslevel=compresslevel)
@@ -2,10 +2,14 @@
 #
 # SPDX-License-Identifier: MIT
 
+import hashlib
+import os
 from unittest.mock import patch
 
+import pytest
+
 from testguide_report_generator.util.File import get_extended_windows_path
-from testguide_report_generator.util.File import get_md5_hash_from_file
+from testguide_report_generator.util.File import create_hasher, get_hash_from_file, get_md5_hash_from_file
 
 
 def test_get_extended_windows_path_no_windows_path():
@@ -35,3 +39,34 @@ def __os_mock_side_effect(mock_input):
 
 def test_get_md5_hash_from_file(artifact_path):
     assert "d41d8cd98f00b204e9800998ecf8427e" == get_md5_hash_from_file(artifact_path)
+
+
+def test_get_md5_hash_from_file_chunked(tmp_path):
+    content = os.urandom(2500)
+    path = tmp_path / "chunked.bin"
+    path.write_bytes(content)
+
+    with patch("testguide_report_generator.util.File.HASH_CHUNK_SIZE", 1024):
+        assert hashlib.md5(content).hexdigest() == get_md5_hash_from_file(str(path))
+
+
+@pytest.mark.parametrize("algorithm", ["md5", "sha1", "sha256", "blake2b", "blake2s"])
+def test_get_hash_from_file(tmp_path, algorithm):
+    content = os.urandom(5000)
+    path = tmp_path / "content.bin"
+    path.write_bytes(content)
+
+    assert hashlib.new(algorithm, content).hexdigest() == get_hash_from_file(str(path), algorithm)
+
+
+@pytest.mark.parametrize("algorithm, message", [("unknown", "Unknown hash algorithm"),
+                                                ("shake_128", "no fixed digest size")])
+def test_create_hasher_error(algorithm, message):
+    with pytest.raises(ValueError, match=message):
+        create_hasher(algorithm)
+
+
+def test_create_hasher_missing_package():
+    with patch("importlib.import_module", side_effect=ImportError):
+        with pytest.raises(ValueError, match="requires the package 'xxhash'"):
+            create_hasher("xxh3_128")
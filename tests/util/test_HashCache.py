@@ -0,0 +1,142 @@
+# Copyright (c) 2023-2024 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+import hashlib
+import os
+from unittest.mock import patch
+
+import pytest
+
+from testguide_report_generator.model.TestCase import Artifact
+from testguide_report_generator.util.HashCache import HashCache
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "hashes.json")
+
+
+def test_cache_hit_and_miss(cache_path, artifact_path):
+    cache = HashCache(cache_path)
+    with patch("testguide_report_generator.util.HashCache.get_hash_from_file",
+               return_value="hash") as mock:
+        assert "hash" == cache.get_md5_hash(artifact_path)
+        assert "hash" == cache.get_md5_hash(artifact_path)
+
+    mock.assert_called_once()
+    assert 1 == cache.get_hits()
+    assert 1 == cache.get_misses()
+
+
+def test_cache_changed_file(cache_path, tmp_path):
+    path = tmp_path / "changing.txt"
+    path.write_text("first")
+    cache = HashCache(cache_path)
+    cache.get_md5_hash(str(path))
+
+    path.write_text("second content")
+
+    assert hashlib.md5(b"second content").hexdigest() == cache.get_md5_hash(str(path))
+    assert 2 == cache.get_misses()
+
+
+def test_cache_file_changed_while_hashing(cache_path, tmp_path):
+    path = tmp_path / "changing.txt"
+    path.write_text("first")
+
+    def hash_and_change(file_path, algorithm):
+        path.write_text("second content")
+        return "hash"
+
+    cache = HashCache(cache_path)
+    with patch("testguide_report_generator.util.HashCache.get_hash_from_file", side_effect=hash_and_change):
+        assert "hash" == cache.get_md5_hash(str(path))
+
+    assert hashlib.md5(b"second content").hexdigest() == cache.get_md5_hash(str(path))
+    assert 0 == cache.get_hits()
+    assert 2 == cache.get_misses()
+
+
+def test_cache_persistence(cache_path, artifact_path):
+    with HashCache(cache_path) as cache:
+        cache.get_md5_hash(artifact_path)
+
+    cache = HashCache(cache_path)
+    assert "d41d8cd98f00b204e9800998ecf8427e" == cache.get_md5_hash(artifact_path)
+    assert 1 == cache.get_hits()
+    assert 0 == cache.get_misses()
+
+
+def test_cache_eviction(cache_path, tmp_path):
+    cache = HashCache(cache_path, max_entries=2)
+    paths = []
+    for index in range(3):
+        path = tmp_path / f"file_{index}.txt"
+        path.write_text(str(index))
+        paths.append(str(path))
+
+    cache.get_md5_hash(paths[0])
+    cache.get_md5_hash(paths[1])
+    cache.get_md5_hash(paths[0])
+    cache.get_md5_hash(paths[2])
+
+    assert 2 == len(cache)
+    cache.get_md5_hash(paths[0])
+    cache.get_md5_hash(paths[1])
+    assert (2, 4) == (cache.get_hits(), cache.get_misses())
+
+
+def test_cache_corrupt_file(cache_path, artifact_path, caplog):
+    with open(cache_path, "w", encoding="utf-8") as file:
+        file.write("{not json")
+
+    cache = HashCache(cache_path)
+
+    assert 0 == len(cache)
+    assert "could not be read" in caplog.text
+    cache.get_md5_hash(artifact_path)
+    cache.save()
+    assert 1 == len(HashCache(cache_path))
+    assert not os.path.exists(f"{cache_path}.{os.getpid()}.tmp")
+
+
+def test_cache_invalid_max_entries(cache_path):
+    with pytest.raises(ValueError):
+        HashCache(cache_path, max_entries=0)
+
+
+def test_artifact_uses_hash_cache(cache_path, artifact_path):
+    cache = HashCache(cache_path)
+    Artifact.set_hash_cache(cache)
+    try:
+        first = Artifact(artifact_path)
+        second = Artifact(artifact_path)
+    finally:
+        Artifact.set_hash_cache(None)
+
+    assert first.get_path_in_upload_zip() == second.get_path_in_upload_zip()
+    assert (1, 1) == (cache.get_hits(), cache.get_misses())
+
+
+def test_cache_separates_algorithms(cache_path, artifact_path):
+    cache = HashCache(cache_path)
+
+    assert hashlib.md5(b"").hexdigest() == cache.get_hash(artifact_path, "md5")
+    assert hashlib.sha1(b"").hexdigest() == cache.get_hash(artifact_path, "sha1")
+    assert hashlib.md5(b"").hexdigest() == cache.get_md5_hash(artifact_path)
+    assert (1, 2) == (cache.get_hits(), cache.get_misses())
+
+
+def test_cache_dir_entry(cache_path, artifact_path):
+    cache = HashCache(cache_path)
+    assert hashlib.md5(b"").hexdigest() == cache.get_md5_hash(artifact_path)
+
+    with os.scandir(os.path.dirname(artifact_path)) as entries:
+        entry = next(entry for entry in entries if entry.name == "artifact.txt")
+        entry.stat()
+        with patch("os.stat", wraps=os.stat) as stat:
+            assert hashlib.md5(b"").hexdigest() == cache.get_hash(entry, "md5")
+
+    stat.assert_not_called()
+    assert (1, 1) == (cache.get_hits(), cache.get_misses())
@@ -0,0 +1,80 @@
+# Copyright (c) 2023-2024 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+import json
+import types
+from unittest.mock import patch
+
+import pytest
+
+from testguide_report_generator.model.TestCase import TestCase, Verdict
+from testguide_report_generator.util.JsonEncoding import JsonEncoding
+
+
+@pytest.fixture
+def unicode_testsuite(testsuite, testcase):
+    testsuite.add_testcase(testcase.set_description("Prüfung des Bremsdrucks"))
+    testsuite.add_testcase(TestCase("Tür", 1, Verdict.PASSED))
+    return testsuite
+
+
+def test_default_encoding(unicode_testsuite):
+    encoding = JsonEncoding()
+    json_repr = unicode_testsuite.create_json_repr()
+
+    assert "json" == encoding.get_backend()
+    assert json.dumps(json_repr, indent=4) == encoding.dumps(json_repr)
+    assert encoding.dumps(json_repr) == "".join(encoding.create_stream_writer().iterencode(unicode_testsuite))
+
+
+def test_compact_encoding(unicode_testsuite):
+    encoding = JsonEncoding.compact(backend="json")
+    json_repr = unicode_testsuite.create_json_repr()
+
+    expected = json.dumps(json_repr, separators=(",", ":"), ensure_ascii=False)
+    assert expected == encoding.dumps(json_repr)
+    assert expected == "".join(encoding.create_stream_writer().iterencode(unicode_testsuite))
+    assert "Prüfung" in expected
+    assert len(expected) < len(JsonEncoding().dumps(json_repr))
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_orjson_backend(unicode_testsuite, indent):
+    pytest.importorskip("orjson")
+    encoding = JsonEncoding(indent=indent, ensure_ascii=False, backend="orjson")
+    json_repr = unicode_testsuite.create_json_repr()
+
+    assert "orjson" == encoding.get_backend()
+    assert json_repr == json.loads(encoding.dumps(json_repr))
+
+
+def test_ujson_backend(unicode_testsuite):
+    fake_ujson = types.ModuleType("ujson")
+    fake_ujson.dumps = lambda obj, **kwargs: json.dumps([obj, kwargs])
+    json_repr = unicode_testsuite.create_json_repr()
+
+    with patch.dict("sys.modules", {"ujson": fake_ujson, "orjson": None}):
+        encoding = JsonEncoding(indent=4, backend="auto")
+
+    assert "ujson" == encoding.get_backend()
+    assert [json_repr, {"indent": 4, "ensure_ascii": True, "escape_forward_slashes": False}] == json.loads(
+        encoding.dumps(json_repr))
+
+
+def test_fallback_to_json(caplog):
+    with patch.dict("sys.modules", {"ujson": None, "orjson": None}):
+        assert "json" == JsonEncoding.compact().get_backend()
+        assert "json" == JsonEncoding(backend="ujson").get_backend()
+
+    assert "JSON encoder 'ujson' is not installed" in caplog.text
+
+
+def test_orjson_unsupported_options(caplog):
+    assert "json" == JsonEncoding(indent=4, backend="orjson").get_backend()
+    assert "falling back to 'json'" in caplog.text
+
+
+def test_invalid_backend():
+    with pytest.raises(ValueError, match="backend"):
+        JsonEncoding(backend="simplejson")
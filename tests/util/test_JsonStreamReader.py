@@ -0,0 +1,75 @@
+# Copyright (c) 2023-2024 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+import io
+import json
+from unittest.mock import patch
+
+import pytest
+
+from testguide_report_generator.util.JsonStreamReader import JsonStreamReader
+
+PLACEHOLDER = {"placeholder": True}
+
+
+def read(content):
+    reader = JsonStreamReader(io.StringIO(content), PLACEHOLDER)
+    testcases = list(reader.iter_testcases())
+    return testcases, reader.get_structure()
+
+
+@pytest.mark.parametrize("buffer_size", [1, 7, 1024 * 1024])
+def test_iter_testcases(testsuite_json_path, buffer_size):
+    with open(testsuite_json_path, "r", encoding="utf-8") as file:
+        content = file.read()
+    report = json.loads(content)
+
+    with patch("testguide_report_generator.util.JsonStreamReader.READ_BUFFER_SIZE", buffer_size):
+        testcases, structure = read(content)
+
+    testcase, *folders = report["testcases"]
+    assert [path for path, _ in testcases] == [("testcases", 0), ("testcases", 1, "testcases", 0),
+                                               ("testcases", 2, "testcases", 0)]
+    assert [testcase for _, testcase in testcases] == [testcase, *[folder["testcases"][0] for folder in folders]]
+    assert structure == {**report, "testcases": [PLACEHOLDER, *[{**folder, "testcases": [PLACEHOLDER]}
+                                                               for folder in folders]]}
+
+
+@pytest.mark.parametrize("content, testcases, structure", [
+    ('{"name": "a", "testcases": []}', [], {"name": "a", "testcases": []}),
+    ('{"testcases": [1, {"a": 12345}] , "b": [1]}', [(("testcases", 0), 1), (("testcases", 1), {"a": 12345})],
+     {"testcases": [PLACEHOLDER, PLACEHOLDER], "b": [1]}),
+    ('{"testcases": {"testcases": []}}', [], {"testcases": {"testcases": []}}),
+    ('{"testcases": [{"testcases": [{}], "testcases": []}]}', [(("testcases", 0, "testcases", 0), {})],
+     {"testcases": [{"testcases": []}]}),
+    ('{}', [], {}),
+    (' [1, 2] ', [], [1, 2]),
+    ('12345', [], 12345),
+])
+def test_iter_testcases_values(content, testcases, structure):
+    with patch("testguide_report_generator.util.JsonStreamReader.READ_BUFFER_SIZE", 2):
+        assert read(content) == (testcases, structure)
+
+
+@pytest.mark.parametrize("content", ['{"testcases": [{}', '{"a": 1} x', '{"a" 1}', '{"a": 1 "b": 2}', '{1: 2}',
+                                     '{"testcases": [{} {}]}', '', '{"a": tru}'])
+def test_iter_testcases_invalid_json(content):
+    with pytest.raises(json.JSONDecodeError):
+        read(content)
+
+
+@pytest.mark.parametrize("buffer_size", [1, 3, 1024 * 1024])
+@pytest.mark.parametrize("content", ['{\n  "a": 1,\n  "b": tru\n}', '{\n  "a": 1\n}\n x', '{\n  "a"\n 1}',
+                                     '{"testcases": [\n{"a": [1, 2,\n 3]},\n {"b": }]}'])
+def test_iter_testcases_error_position(content, buffer_size):
+    with pytest.raises(json.JSONDecodeError) as expected:
+        json.loads(content)
+
+    with patch("testguide_report_generator.util.JsonStreamReader.READ_BUFFER_SIZE", buffer_size):
+        with pytest.raises(json.JSONDecodeError) as error:
+            read(content)
+
+    assert (error.value.pos, error.value.lineno, error.value.colno) == \
+           (expected.value.pos, expected.value.lineno, expected.value.colno)
+    assert str(error.value) == str(expected.value)
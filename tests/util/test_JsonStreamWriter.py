@@ -0,0 +1,56 @@
+# Copyright (c) 2023-2024 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+import io
+import json
+
+import pytest
+
+from testguide_report_generator.model.TestCaseFolder import TestCaseFolder
+from testguide_report_generator.util.JsonStreamWriter import JsonStreamWriter
+
+
+def test_iterencode_equals_json_dumps(testsuite, testcase, testcase_folder):
+    testsuite.add_testcase(testcase_folder)
+    testsuite.add_testcase(TestCaseFolder("nested").add_testcase(testcase_folder))
+
+    expected = json.dumps(testsuite.create_json_repr(), indent=4)
+    assert expected == "".join(JsonStreamWriter().iterencode(testsuite))
+
+
+@pytest.mark.parametrize(
+    "value", [{}, [], "Ünïcødé \"quoted\"\n", 1.5, -3, True, None, {"a": [1, {"b": []}, "c"], "d": {}}]
+)
+def test_iterencode_plain_values(value):
+    assert json.dumps(value, indent=4) == "".join(JsonStreamWriter().iterencode(value))
+
+
+def test_iterencode_custom_indent(testcase):
+    expected = json.dumps(testcase.create_json_repr(), indent=2)
+    assert expected == "".join(JsonStreamWriter(indent=2).iterencode(testcase))
+
+
+def test_write(testsuite, testcase):
+    testsuite.add_testcase(testcase)
+    file = io.StringIO()
+
+    JsonStreamWriter().write(testsuite, file)
+
+    assert json.dumps(testsuite.create_json_repr(), indent=4) == file.getvalue()
+
+
+def test_write_multiple_files(testsuite, testcase):
+    testsuite.add_testcase(testcase)
+    files = [io.StringIO(), io.StringIO()]
+
+    JsonStreamWriter().write(testsuite, *files)
+
+    assert files[0].getvalue() == files[1].getvalue() != ""
+
+
+def test_iterencode_compact(testsuite, testcase):
+    testsuite.add_testcase(testcase.set_description("Prüfung"))
+
+    expected = json.dumps(testsuite.create_json_repr(), separators=(",", ":"), ensure_ascii=False)
+    assert expected == "".join(JsonStreamWriter(indent=None, ensure_ascii=False).iterencode(testsuite))
@@ -2,7 +2,27 @@
 #
 # SPDX-License-Identifier: MIT
 
-from testguide_report_generator.util.JsonValidator import JsonValidator
+import copy
+import io
+import json
+import os
+import shutil
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from conftest import fuzz
+from testguide_report_generator.model.TestCase import TestCase, Verdict
+from testguide_report_generator.util.JsonValidator import (
+    MAX_PRINTED_MESSAGE_LENGTH,
+    VALIDATED_TESTCASE_PLACEHOLDER,
+    JsonValidator,
+    clear_schema_validator_cache,
+    get_compiled_validator,
+    get_schema_validator,
+)
 
 
 def test_json_file_valid(json_schema_path, path_to_valid_json):
@@ -35,3 +55,335 @@ def test_testsuite_invalid(json_schema_path, testsuite_json_obj):
 def test_default_valid(testsuite_json_obj):
     validator = JsonValidator()
     assert validator.validate_json(testsuite_json_obj)
+
+
+def test_validator_is_cached(json_schema_path):
+    clear_schema_validator_cache()
+    with patch("jsonschema.Draft7Validator", wraps=get_schema_validator(json_schema_path).__class__) as mock:
+        clear_schema_validator_cache()
+        validators = [get_schema_validator(json_schema_path) for _ in range(3)]
+        JsonValidator(json_schema_path)
+        JsonValidator(os.path.join(os.path.dirname(json_schema_path), ".", "schema.json"))
+
+    mock.assert_called_once()
+    assert all(validator is validators[0] for validator in validators)
+
+
+def test_validator_cache_reloads_modified_schema(json_schema_path, tmp_path, testsuite_json_obj):
+    schema_path = tmp_path / "schema.json"
+    shutil.copy(json_schema_path, schema_path)
+    validator = get_schema_validator(str(schema_path))
+    assert JsonValidator(str(schema_path)).validate_json(testsuite_json_obj)
+
+    schema_path.write_text('{"type": "array"}')
+    os.utime(schema_path, ns=(0, os.stat(schema_path).st_mtime_ns + 1000))
+
+    assert validator is not get_schema_validator(str(schema_path))
+    assert not JsonValidator(str(schema_path)).validate_json(testsuite_json_obj)
+
+
+def test_validate_testcase(json_schema_path, invalid_testcase):
+    validator = JsonValidator(json_schema_path)
+    valid = TestCase("valid", 0, Verdict.PASSED)
+
+    assert validator.get_testcase_result(valid) is None
+    assert validator.validate_testcase(valid)
+    assert not validator.validate_testcase(invalid_testcase)
+    assert validator.get_testcase_result(valid) is True
+    assert validator.get_testcase_result(invalid_testcase) is False
+
+
+def test_validate_testcase_is_cached(json_schema_path):
+    validator = JsonValidator(json_schema_path)
+    testcase = TestCase("valid", 0, Verdict.PASSED)
+
+    with patch.object(TestCase, "create_json_repr", wraps=testcase.create_json_repr) as mock:
+        assert validator.validate_testcase(testcase)
+        assert validator.validate_testcase(testcase)
+
+    mock.assert_called_once()
+
+
+def test_validate_testcase_after_modification(json_schema_path):
+    validator = JsonValidator(json_schema_path)
+    testcase = TestCase("valid", 0, Verdict.PASSED)
+    assert validator.validate_testcase(testcase)
+
+    testcase.add_attribute_pair("key", "value")
+    assert validator.get_testcase_result(testcase) is None
+    with patch.object(TestCase, "create_json_repr", wraps=testcase.create_json_repr) as mock:
+        assert validator.validate_testcase(testcase)
+        assert validator.validate_testcase(testcase)
+
+    mock.assert_called_once()
+    assert validator.get_testcase_result(testcase) is True
+
+
+def test_validate_testcase_keeps_artifacts_lazy(json_schema_path, artifact_path):
+    validator = JsonValidator(json_schema_path)
+    testcase = TestCase("valid", 0, Verdict.PASSED).add_artifact(artifact_path, lazy=True)
+
+    assert validator.validate_testcase(testcase)
+    assert testcase.get_artifacts()[0].is_hash_pending()
+
+
+def test_validate_structure(json_schema_path):
+    validator = JsonValidator(json_schema_path)
+    report = {"name": "suite", "timestamp": 0, "testcases": [
+        VALIDATED_TESTCASE_PLACEHOLDER,
+        {"@type": "testcasefolder", "name": "folder", "testcases": [VALIDATED_TESTCASE_PLACEHOLDER]}]}
+
+    assert validator.validate_structure(report)
+    report["testcases"][1]["testcases"] = []
+    assert not validator.validate_structure(report)
+    assert not validator.validate_structure({"name": "suite", "timestamp": 0, "testcases": []})
+
+
+def test_unknown_definition(json_schema_path):
+    with pytest.raises(KeyError):
+        get_schema_validator(json_schema_path, "Unknown")
+
+
+@pytest.fixture
+def parallel_small_reports():
+    with patch("testguide_report_generator.util.JsonValidator.MIN_PARALLEL_TESTCASES", 0):
+        yield
+
+
+def create_invalid_report(testsuite_json_obj):
+    testcase, folder = testsuite_json_obj["testcases"]
+    testcases = [copy.deepcopy(testcase if index % 2 else folder) for index in range(20)]
+    testcases[3]["verdict"] = "UNKNOWN"
+    testcases[4]["testcases"][0]["timestamp"] = -1
+    testcases[11]["name"] = ""
+    testcases[19] = {"@type": "testcase"}
+    return {**testsuite_json_obj, "name": "x" * 121, "testcases": testcases}
+
+
+@pytest.mark.usefixtures("parallel_small_reports")
+def test_find_issues_parallel(json_schema_path, testsuite_json_obj):
+    report = create_invalid_report(testsuite_json_obj)
+    serial = sorted(get_schema_validator(json_schema_path).iter_errors(report), key=lambda e: e.path)
+
+    issues = JsonValidator(json_schema_path, processes=2).find_issues_parallel(report, chunk_size=3)
+
+    assert [(list(error.path), error.message) for error in serial] == \
+        [(list(issue.path), issue.message) for issue in issues]
+    assert [issue.path for issue in issues] == [("name",), ("testcases", 3), ("testcases", 4), ("testcases", 11),
+                                                ("testcases", 19)]
+    assert [[list(sub_error.schema_path) for sub_error in sorted(error.context, key=lambda e: e.schema_path)]
+            for error in serial] == [[list(sub_issue.schema_path) for sub_issue in issue.context] for issue in issues]
+
+
+@pytest.mark.usefixtures("parallel_small_reports")
+def test_validate_json_parallel_prints_like_serial(json_schema_path, testsuite_json_obj, capsys):
+    report = create_invalid_report(testsuite_json_obj)
+
+    assert not JsonValidator(json_schema_path).validate_json(report)
+    serial = capsys.readouterr().out
+    assert not JsonValidator(json_schema_path, processes=2).validate_json(report)
+
+    assert serial and serial == capsys.readouterr().out
+
+
+def test_validate_json_parallel_valid(json_schema_path, testsuite_json_obj):
+    with patch("testguide_report_generator.util.JsonValidator.ProcessPoolExecutor") as mock:
+        assert JsonValidator(json_schema_path, processes=2).validate_json(testsuite_json_obj)
+
+    mock.assert_not_called()
+
+
+@pytest.mark.usefixtures("parallel_small_reports")
+def test_validate_json_parallel_without_compiled_validator(json_schema_path, testsuite_json_obj, tmp_path):
+    schema = json.loads(open(json_schema_path, encoding="utf-8").read())
+    schema["definitions"]["ArtifactRef"]["properties"]["md5"]["format"] = "regex"
+    schema_path = tmp_path / "schema.json"
+    schema_path.write_text(json.dumps(schema))
+    report = create_invalid_report(testsuite_json_obj)
+
+    assert get_compiled_validator(str(schema_path)) is None
+    assert JsonValidator(str(schema_path), processes=2).validate_json({**testsuite_json_obj, "testcases": report["testcases"][:3]})
+    issues = JsonValidator(str(schema_path), processes=3).find_issues_parallel(report)
+    assert [issue.path for issue in issues] == [("name",), ("testcases", 3), ("testcases", 4), ("testcases", 11),
+                                                ("testcases", 19)]
+
+
+@pytest.mark.usefixtures("parallel_small_reports")
+def test_parallel_processes_are_reused(json_schema_path, testsuite_json_obj):
+    report = create_invalid_report(testsuite_json_obj)
+
+    with patch("testguide_report_generator.util.JsonValidator.ProcessPoolExecutor", wraps=ProcessPoolExecutor) as mock:
+        with JsonValidator(json_schema_path, processes=2) as validator:
+            assert len(validator.check_json(report).get_issues()) == 5
+            assert len(validator.check_json(report).get_issues()) == 5
+            assert mock.call_count == 1
+
+        # a closed validator starts new processes
+        assert len(validator.check_json(report).get_issues()) == 5
+        assert mock.call_count == 2
+        validator.close()
+
+
+def test_small_reports_are_validated_serially(json_schema_path, testsuite_json_obj):
+    report = create_invalid_report(testsuite_json_obj)
+
+    with patch("testguide_report_generator.util.JsonValidator.ProcessPoolExecutor") as mock:
+        issues = JsonValidator(json_schema_path, processes=2).find_issues_parallel(report)
+
+    mock.assert_not_called()
+    assert [issue.path for issue in issues] == [("name",), ("testcases", 3), ("testcases", 4), ("testcases", 11),
+                                                ("testcases", 19)]
+
+
+def test_invalid_processes(json_schema_path):
+    with pytest.raises(ValueError):
+        JsonValidator(json_schema_path, processes=0)
+
+
+def test_check_json_valid(json_schema_path, testsuite_json_obj, capsys):
+    result = JsonValidator(json_schema_path).check_json(testsuite_json_obj)
+
+    assert result
+    assert result.is_valid()
+    assert result.get_issues() == []
+    assert not result.is_truncated()
+    assert capsys.readouterr().out == ""
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+@pytest.mark.usefixtures("parallel_small_reports")
+def test_check_json_invalid(json_schema_path, testsuite_json_obj, capsys, processes):
+    report = create_invalid_report(testsuite_json_obj)
+    validator = JsonValidator(json_schema_path, processes)
+
+    result = validator.check_json(report)
+    assert not result
+    assert sorted(issue.path for issue in result) == [("name",), ("testcases", 3), ("testcases", 4),
+                                                      ("testcases", 11), ("testcases", 19)]
+    assert not result.is_truncated()
+
+    result = validator.check_json(report, max_issues=2)
+    assert len(result.get_issues()) == 2
+    assert result.is_truncated()
+
+    result = validator.check_json(report, fail_fast=True)
+    assert not result.is_valid()
+    assert len(list(result)) == 1
+    assert capsys.readouterr().out == ""
+
+
+def test_check_json_is_lazy(json_schema_path, testsuite_json_obj):
+    validator = get_schema_validator(json_schema_path)
+    consumed = []
+
+    def iter_errors(instance):
+        for error in get_schema_validator(json_schema_path).__class__.iter_errors(validator, instance):
+            consumed.append(error)
+            yield error
+
+    with patch.object(validator, "iter_errors", side_effect=iter_errors):
+        result = JsonValidator(json_schema_path).check_json(create_invalid_report(testsuite_json_obj))
+        assert consumed == []
+        assert not result.is_valid()
+        assert len(consumed) == 1
+        assert len(result.get_issues()) == 5
+        assert len(consumed) == 5
+
+
+def test_check_file(json_schema_path, path_to_valid_json, path_to_invalid_json):
+    validator = JsonValidator(json_schema_path)
+
+    assert validator.check_file(path_to_valid_json).is_valid()
+    assert not validator.check_file(path_to_invalid_json, fail_fast=True).is_valid()
+
+
+def test_print_issues(json_schema_path, testsuite_json_obj):
+    output = io.StringIO()
+    JsonValidator(json_schema_path).check_json(create_invalid_report(testsuite_json_obj), 2).print_issues(output)
+
+    lines = output.getvalue().splitlines()
+    assert lines[0].startswith("name: ")
+    assert lines[1].startswith("testcases/3: ")
+    assert lines[2].startswith("  testcases/3")
+    assert lines[-1] == "Stopped after 2 issues."
+
+
+def test_check_json_invalid_max_issues(json_schema_path, testsuite_json_obj):
+    with pytest.raises(ValueError):
+        JsonValidator(json_schema_path).check_json(testsuite_json_obj, max_issues=0)
+
+
+def test_print_issues_shortens_messages(json_schema_path, testsuite_json_obj):
+    testsuite_json_obj["testcases"][0]["description"] = "x" * 10000
+    testsuite_json_obj["testcases"][0]["verdict"] = "UNKNOWN"
+    output = io.StringIO()
+    JsonValidator(json_schema_path).check_json(testsuite_json_obj).print_issues(output)
+
+    assert max(len(line) for line in output.getvalue().splitlines()) < MAX_PRINTED_MESSAGE_LENGTH + 50
+
+
+@pytest.mark.parametrize("fixture", ["path_to_valid_json", "path_to_invalid_json", "testsuite_json_path"])
+def test_check_file_streaming(json_schema_path, fixture, request):
+    path = request.getfixturevalue(fixture)
+    validator = JsonValidator(json_schema_path)
+
+    expected = validator.check_file(path).get_issues()
+    issues = validator.check_file(path, streaming=True).get_issues()
+
+    assert sorted((issue.path, issue.message) for issue in issues) == \
+        sorted((issue.path, issue.message) for issue in expected)
+
+
+def test_check_file_streaming_nested_issues(json_schema_path, testsuite_json_obj, tmp_path):
+    report = create_invalid_report(testsuite_json_obj)
+    (tmp_path / "report.json").write_text(json.dumps(report))
+
+    result = JsonValidator(json_schema_path).check_file(str(tmp_path / "report.json"), streaming=True)
+
+    # the invalid testcase of a folder is reported itself, the invalid name of the testsuite last
+    assert [issue.path for issue in result] == [("testcases", 3), ("testcases", 4, "testcases", 0),
+                                                ("testcases", 11), ("testcases", 19), ("name",)]
+
+
+def test_check_file_streaming_agrees_on_fuzzed_reports(json_schema_path, testsuite_json_path, tmp_path):
+    with open(testsuite_json_path, "r", encoding="utf-8") as file:
+        report = json.load(file)
+    validator = JsonValidator(json_schema_path)
+
+    for index, mutated in enumerate(fuzz(report, 100, seed=24)):
+        path = tmp_path / f"{index}.json"
+        path.write_text(json.dumps(mutated, indent=4))
+        assert validator.check_json(mutated).is_valid() == validator.check_file(str(path), streaming=True).is_valid()
+
+
+def test_check_file_streaming_fail_fast(json_schema_path, testsuite_json_obj, tmp_path):
+    report = create_invalid_report(testsuite_json_obj)
+    report["testcases"].append("truncated")
+    (tmp_path / "report.json").write_text(json.dumps(report)[:-10])
+
+    validator = JsonValidator(json_schema_path)
+    result = validator.check_file(str(tmp_path / "report.json"), fail_fast=True, streaming=True)
+
+    # the file is only read until the first issue has been found
+    assert [issue.path for issue in result] == [("testcases", 3)]
+    assert result.is_truncated()
+    with pytest.raises(json.JSONDecodeError):
+        validator.check_file(str(tmp_path / "report.json"), streaming=True).get_issues()
+
+
+def test_check_file_streaming_memory(json_schema_path, testsuite_json_obj, tmp_path):
+    testcase = testsuite_json_obj["testcases"][0]
+    with open(tmp_path / "report.json", "w", encoding="utf-8") as file:
+        json.dump({**testsuite_json_obj, "testcases": [testcase] * 500}, file, indent=4)
+    validator = JsonValidator(json_schema_path)
+    assert validator.check_file(str(tmp_path / "report.json"), streaming=True).is_valid()
+
+    peaks = []
+    for streaming in (False, True):
+        tracemalloc.start()
+        with patch("testguide_report_generator.util.JsonStreamReader.READ_BUFFER_SIZE", 16 * 1024):
+            assert validator.check_file(str(tmp_path / "report.json"), streaming=streaming).is_valid()
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    assert peaks[1] * 4 < peaks[0]
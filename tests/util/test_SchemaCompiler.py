@@ -0,0 +1,136 @@
+# Copyright (c) 2023-2024 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+import json
+
+import jsonschema
+import pytest
+
+from conftest import fuzz
+from testguide_report_generator.util.JsonValidator import JsonValidator, get_compiled_validator
+from testguide_report_generator.util.SchemaCompiler import (
+    UnsupportedSchemaError,
+    compile_validator,
+    equal,
+    generate_validator_source,
+)
+
+
+@pytest.fixture
+def schema(json_schema_path):
+    with open(json_schema_path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def test_compiled_validator_agrees_on_fixtures(schema, path_to_valid_json, path_to_invalid_json,
+                                               testsuite_json_path, testsuite_json_obj):
+    compiled = compile_validator(schema)
+    validator = jsonschema.Draft7Validator(schema)
+
+    reports = [testsuite_json_obj]
+    for path in (path_to_valid_json, path_to_invalid_json, testsuite_json_path):
+        with open(path, "r", encoding="utf-8") as file:
+            reports.append(json.load(file))
+
+    assert [compiled(report) for report in reports] == [True, True, False, True]
+    assert [compiled(report) for report in reports] == [validator.is_valid(report) for report in reports]
+
+
+@pytest.mark.parametrize("fixture", ["path_to_valid_json", "testsuite_json_path"])
+def test_compiled_validator_agrees_on_fuzzed_reports(schema, fixture, request):
+    with open(request.getfixturevalue(fixture), "r", encoding="utf-8") as file:
+        report = json.load(file)
+    compiled = compile_validator(schema)
+    validator = jsonschema.Draft7Validator(schema)
+
+    results = []
+    for mutated in fuzz(report, 300, seed=fixture):
+        result = compiled(mutated)
+        assert result == validator.is_valid(mutated), json.dumps(mutated)
+        results.append(result)
+
+    # the fuzzer creates both valid and invalid reports
+    assert True in results and False in results
+
+
+def test_compiled_definition_agrees_on_fuzzed_testcases(schema, testcase_json_path):
+    with open(testcase_json_path, "r", encoding="utf-8") as file:
+        testcase = json.load(file)
+    compiled = compile_validator(schema, "TestCase")
+    validator = jsonschema.Draft7Validator({"$ref": "#/definitions/TestCase", "definitions": schema["definitions"]})
+
+    assert compiled(testcase)
+    for mutated in fuzz(testcase, 300, seed=1):
+        assert compiled(mutated) == validator.is_valid(mutated), json.dumps(mutated)
+
+
+@pytest.mark.parametrize("subschema, instance", [
+    ({"type": "integer"}, 1.0),
+    ({"type": "integer"}, True),
+    ({"type": "number"}, False),
+    ({"type": ["string", "null"], "maxLength": 2}, None),
+    ({"type": ["string", "null"], "maxLength": 2}, "abc"),
+    ({"minimum": 0}, "not a number"),
+    ({"exclusiveMaximum": 1}, 1),
+    ({"const": 1}, True),
+    ({"const": [1, {"a": False}]}, [1, {"a": False}]),
+    ({"enum": [0, "a"]}, False),
+    ({"enum": ["a", "b"]}, ["a"]),
+    ({"oneOf": [{"type": "number"}, {"type": "integer"}]}, 1),
+    ({"allOf": [{"type": "string"}, {"minLength": 2}]}, "a"),
+    ({"items": False}, []),
+    ({"items": {"type": "string"}, "maxItems": 1}, ["a", "b"]),
+    ({"pattern": "^a"}, "ba"),
+    ({"required": ["a"], "properties": {"a": True}}, {"b": 1}),
+])
+def test_compiled_keywords(subschema, instance):
+    compiled = compile_validator(subschema)
+    assert compiled(instance) == jsonschema.Draft7Validator(subschema).is_valid(instance)
+
+
+def test_recursive_definition():
+    schema = {"definitions": {"Node": {"type": "object", "properties": {"children": {
+        "type": "array", "items": {"$ref": "#/definitions/Node"}}}}}, "$ref": "#/definitions/Node"}
+    compiled = compile_validator(schema)
+
+    assert compiled({"children": [{"children": []}]})
+    assert not compiled({"children": [{"children": [1]}]})
+
+
+@pytest.mark.parametrize("subschema", [
+    {"not": {"type": "string"}},
+    {"type": "string", "format": "date"},
+    {"$ref": "other.json#/definitions/Node"},
+    {"$ref": "#/definitions/Missing"},
+    {"items": [{"type": "string"}]},
+    {"type": "unknown"},
+])
+def test_unsupported_schema(subschema):
+    with pytest.raises(UnsupportedSchemaError):
+        generate_validator_source(subschema)
+
+
+def test_equal():
+    assert equal(1, 1.0)
+    assert not equal(1, True)
+    assert not equal([0], [False])
+    assert equal({"a": [1, None]}, {"a": [1, None]})
+    assert not equal({"a": 1}, [1])
+
+
+def test_json_validator_without_compiled_validator(tmp_path, testsuite_json_obj):
+    schema_path = tmp_path / "schema.json"
+    schema_path.write_text('{"type": "object", "required": ["name"], "properties": {"name": {"format": "date"}}}')
+
+    assert get_compiled_validator(str(schema_path)) is None
+    assert JsonValidator(str(schema_path)).validate_json(testsuite_json_obj)
+    assert not JsonValidator(str(schema_path)).validate_json({})
+
+
+def test_json_validator_falls_back_for_errors(json_schema_path, testsuite_json_obj, capsys):
+    testsuite_json_obj["testcases"][0]["verdict"] = "UNKNOWN"
+
+    assert get_compiled_validator(json_schema_path) is not None
+    assert not JsonValidator(json_schema_path).validate_json(testsuite_json_obj)
+    assert "UNKNOWN" in capsys.readouterr().out
@@ -0,0 +1,107 @@
+# Copyright (c) 2023-2024 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+import json
+
+import pytest
+
+from testguide_report_generator.model.TestCase import TestCase, Verdict
+from testguide_report_generator.model.TestCaseFolder import TestCaseFolder
+from testguide_report_generator.model.TestSuite import TestSuite
+from testguide_report_generator.util.JsonEncoding import JsonEncoding
+from testguide_report_generator.util.TestSuiteSplitter import split_testsuite
+
+
+def _names(testsuite):
+    def collect(nodes):
+        return [collect(node.get_testcases()) if isinstance(node, TestCaseFolder) else
+                node.create_json_repr()["name"] for node in nodes]
+
+    return collect(testsuite.get_testcases())
+
+
+@pytest.fixture
+def nested_testsuite(testsuite):
+    inner = TestCaseFolder("inner")
+    for name in ("c", "d"):
+        inner.add_testcase(TestCase(name, 1, Verdict.PASSED))
+    outer = TestCaseFolder("outer").add_testcase(TestCase("b", 1, Verdict.PASSED)).add_testcase(inner)
+    testsuite.add_testcase(TestCase("a", 1, Verdict.PASSED))
+    testsuite.add_testcase(outer)
+    testsuite.add_testcase(TestCase("e", 1, Verdict.PASSED))
+    return testsuite
+
+
+def test_split_by_testcases(nested_testsuite):
+    shards = split_testsuite(nested_testsuite, max_testcases=2)
+
+    assert [["a", ["b"]], [[["c", "d"]]], ["e"]] == [_names(shard) for shard in shards]
+    assert all(shard.get_name() == "MyTestSuite" and shard.get_timestamp() == 1666698047000 for shard in shards)
+
+
+def test_split_keeps_json_equivalent(nested_testsuite):
+    shards = split_testsuite(nested_testsuite, max_testcases=100)
+
+    assert 1 == len(shards)
+    assert json.dumps(nested_testsuite.create_json_repr()) == json.dumps(shards[0].create_json_repr())
+
+
+def test_split_by_bytes(testsuite, artifact_path, json_schema_path):
+    for name in ("a", "b", "c"):
+        testsuite.add_testcase(TestCase(name, 1, Verdict.PASSED).add_artifact(json_schema_path))
+    testsuite.add_testcase(TestCase("d", 1, Verdict.PASSED).add_artifact(artifact_path))
+    expected = TestSuite(testsuite.get_name(), testsuite.get_timestamp())
+    for testcase in testsuite.get_testcases()[:2]:
+        expected.add_testcase(testcase)
+    with open(json_schema_path, "rb") as file:
+        schema_size = len(file.read())
+    report_size = len(json.dumps(expected.create_json_repr(), indent=4).encode("utf-8"))
+
+    # the duplicate artifact only counts once per shard, the name of the last artifact is longer
+    shards = split_testsuite(testsuite, max_bytes=schema_size + report_size)
+    assert [["a", "b"], ["c"], ["d"]] == [_names(shard) for shard in shards]
+
+    # a testcase exceeding the budget on its own gets its own shard
+    for max_bytes in (schema_size + report_size - 1, 1):
+        shards = split_testsuite(testsuite, max_bytes=max_bytes)
+        assert [["a"], ["b"], ["c"], ["d"]] == [_names(shard) for shard in shards]
+
+
+@pytest.mark.parametrize("encoding", [JsonEncoding(), JsonEncoding(indent=2, ensure_ascii=False),
+                                      JsonEncoding.compact(backend="json")])
+@pytest.mark.parametrize("max_bytes", [300, 700, 1500])
+def test_split_by_encoded_bytes(testsuite, encoding, max_bytes):
+    folder = TestCaseFolder("Ordner \u00e4\u00f6\u00fc")
+    inner = TestCaseFolder("inner \u2713")
+    for index in range(4):
+        inner.add_testcase(TestCase(f"Testfall \u00df {index}", 1, Verdict.PASSED).set_description("\u20ac" * 20))
+    folder.add_testcase(TestCase("\u00c4", 1, Verdict.FAILED)).add_testcase(inner)
+    testsuite.add_testcase(folder).add_testcase(TestCase("last \u00e9", 1, Verdict.PASSED))
+
+    shards = split_testsuite(testsuite, max_bytes=max_bytes, json_encoding=encoding)
+    sizes = [len(encoding.dumps(shard.create_json_repr()).encode("utf-8")) for shard in shards]
+
+    for shard, size in zip(shards, sizes):
+        assert size <= max_bytes or sum(1 for _ in _flat_names(_names(shard))) == 1
+    assert [name for shard in shards for name in _flat_names(_names(shard))] == \
+           list(_flat_names(_names(testsuite)))
+
+    # the size of the report is calculated exactly
+    report_size = len(encoding.dumps(testsuite.create_json_repr()).encode("utf-8"))
+    assert 1 == len(split_testsuite(testsuite, max_bytes=report_size, json_encoding=encoding))
+    assert 2 == len(split_testsuite(testsuite, max_bytes=report_size - 1, json_encoding=encoding))
+
+
+def _flat_names(names):
+    for name in names:
+        if isinstance(name, list):
+            yield from _flat_names(name)
+        else:
+            yield name
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"max_testcases": 0}, {"max_bytes": -1}])
+def test_split_invalid_arguments(nested_testsuite, kwargs):
+    with pytest.raises(ValueError, match="max_"):
+        split_testsuite(nested_testsuite, **kwargs)
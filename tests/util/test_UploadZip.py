@@ -0,0 +1,138 @@
+# Copyright (c) 2023-2024 tracetronic GmbH
+#
+# SPDX-License-Identifier: MIT
+
+import hashlib
+import io
+from unittest.mock import patch
+from zipfile import ZipFile, ZIP_BZIP2, ZIP_DEFLATED, ZIP_STORED
+
+import pytest
+
+from testguide_report_generator.util.UploadZip import UploadZipFile, compress_file, supports_precompressed_entries
+
+
+@pytest.mark.parametrize("compress_type, compresslevel", [(ZIP_STORED, None), (ZIP_DEFLATED, None), (ZIP_DEFLATED, 1)])
+def test_compress_file_equals_zipfile_write(json_schema_path, compress_type, compresslevel):
+    expected = io.BytesIO()
+    with ZipFile(expected, "w") as zip_obj:
+        zip_obj.write(json_schema_path, "schema.json", compress_type, compresslevel)
+        expected_info = zip_obj.getinfo("schema.json")
+
+    zinfo, data = compress_file(json_schema_path, "schema.json", compress_type, compresslevel)
+
+    assert (expected_info.CRC, expected_info.file_size, expected_info.compress_size) == (
+        zinfo.CRC,
+        zinfo.file_size,
+        zinfo.compress_size,
+    )
+    assert expected.getvalue()[expected_info.header_offset + 30 + len("schema.json"):].startswith(data)
+
+
+def test_compress_file_unsupported_type(json_schema_path):
+    with pytest.raises(ValueError, match="compress_type"):
+        compress_file(json_schema_path, "schema.json", ZIP_BZIP2)
+
+
+@pytest.mark.parametrize("seekable", [True, False])
+def test_write_compressed(json_schema_path, artifact_path, seekable):
+    class UnseekableBuffer(io.BytesIO):
+        def seekable(self):
+            return False
+
+    buffer = io.BytesIO() if seekable else UnseekableBuffer()
+    with UploadZipFile(buffer, "w") as zip_obj:
+        zip_obj.write_compressed(*compress_file(json_schema_path, "a/schema.json", ZIP_DEFLATED))
+        zip_obj.writestr("between.txt", "text")
+        zip_obj.write_compressed(*compress_file(artifact_path, "b/artifact.txt", ZIP_STORED))
+
+    with ZipFile(io.BytesIO(buffer.getvalue())) as zip_obj:
+        assert zip_obj.testzip() is None
+        assert ["a/schema.json", "between.txt", "b/artifact.txt"] == zip_obj.namelist()
+        with open(json_schema_path, "rb") as file:
+            assert file.read() == zip_obj.read("a/schema.json")
+
+
+def test_write_compressed_while_writing(json_schema_path):
+    with UploadZipFile(io.BytesIO(), "w") as zip_obj:
+        with zip_obj.open("open.txt", "w"):
+            with pytest.raises(ValueError, match="open writing handle"):
+                zip_obj.write_compressed(*compress_file(json_schema_path, "schema.json", ZIP_DEFLATED))
+
+
+def test_remove_last_entry(tmp_path, json_schema_path):
+    zip_path = tmp_path / "test.zip"
+    with UploadZipFile(zip_path, "w") as zip_obj:
+        zip_obj.writestr("first.txt", "first")
+        zip_obj.writestr("last.txt", "last")
+
+    with UploadZipFile(zip_path, "a") as zip_obj:
+        with pytest.raises(ValueError, match="not the last entry"):
+            zip_obj.remove_last_entry("first.txt")
+        with pytest.raises(KeyError):
+            zip_obj.remove_last_entry("unknown.txt")
+        zip_obj.remove_last_entry("last.txt")
+        zip_obj.write_compressed(*compress_file(json_schema_path, "schema.json", ZIP_DEFLATED))
+        zip_obj.writestr("last.txt", "new")
+
+    with ZipFile(zip_path) as zip_obj:
+        assert zip_obj.testzip() is None
+        assert ["first.txt", "schema.json", "last.txt"] == zip_obj.namelist()
+        assert b"new" == zip_obj.read("last.txt")
+
+
+def test_restore_removed_entry(tmp_path):
+    zip_path = tmp_path / "test.zip"
+    with UploadZipFile(zip_path, "w") as zip_obj:
+        zip_obj.writestr("first.txt", "first")
+        zip_obj.writestr("last.txt", "last")
+
+    with UploadZipFile(zip_path, "a") as zip_obj:
+        zinfo, data = zip_obj.remove_last_entry("last.txt")
+        offset = zinfo.header_offset
+        zip_obj.writestr("added.txt", "added")
+        zip_obj.writestr("other.txt", "other")
+        with pytest.raises(ValueError, match="not the beginning of an entry"):
+            zip_obj.remove_entries_from(offset + 1)
+        zip_obj.remove_entries_from(offset)
+        zip_obj.write_compressed(zinfo, data)
+
+    with ZipFile(zip_path) as zip_obj:
+        assert zip_obj.testzip() is None
+        assert ["first.txt", "last.txt"] == zip_obj.namelist()
+        assert b"last" == zip_obj.read("last.txt")
+
+
+def test_compress_file_hash(json_schema_path):
+    hasher = hashlib.md5()
+    compress_file(json_schema_path, "schema.json", ZIP_DEFLATED, hasher=hasher)
+    with open(json_schema_path, "rb") as file:
+        assert hashlib.md5(file.read()).hexdigest() == hasher.hexdigest()
+
+
+def test_write_compressed_in_memory():
+    content = b"in memory" * 1000
+    buffer = io.BytesIO()
+    with UploadZipFile(buffer, "w") as zip_obj:
+        zip_obj.write_compressed(*compress_file(memoryview(content), "compressed.txt", ZIP_DEFLATED))
+
+    with ZipFile(buffer) as zip_obj:
+        assert zip_obj.testzip() is None
+        assert content == zip_obj.read("compressed.txt")
+
+
+def test_supports_precompressed_entries():
+    assert supports_precompressed_entries()
+
+    supports_precompressed_entries.cache_clear()
+    try:
+        with patch("testguide_report_generator.util.UploadZip._ZIPFILE_INTERNALS", ("_missing",)):
+            assert not supports_precompressed_entries()
+        supports_precompressed_entries.cache_clear()
+        with patch("testguide_report_generator.util.UploadZip._ZIPINFO_INTERNALS", ("_missing",)):
+            assert not supports_precompressed_entries()
+        supports_precompressed_entries.cache_clear()
+        with patch.object(UploadZipFile, "remove_last_entry", side_effect=AttributeError):
+            assert not supports_precompressed_entries()
+    finally:
+        supports_precompressed_entries.cache_clear()
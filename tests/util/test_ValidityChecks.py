@@ -4,7 +4,14 @@
 
 import pytest
 
-from testguide_report_generator.util.ValidityChecks import check_string_length, validate_new_teststep, validate_testcase
+from testguide_report_generator.util.ValidityChecks import (
+    check_non_negative_integer,
+    check_optional_string_length,
+    check_string_length,
+    check_string_or_string_list,
+    validate_new_teststep,
+    validate_testcase,
+)
 from testguide_report_generator.model.TestCase import TestCase, TestStep, TestStepFolder
 from testguide_report_generator.model.TestCaseFolder import TestCaseFolder
 
@@ -23,6 +30,51 @@ def test_check_string_length_error(name):
     assert str(e.value) == error_msg
 
 
+@pytest.mark.parametrize("name", [None, 1, ["a"]])
+def test_check_string_length_type_error(name):
+    with pytest.raises(TypeError) as e:
+        check_string_length(name, 1, 120, "TestCase", "name")
+
+    assert str(e.value) == f"The TestCase:name must be of type 'str'. Was {type(name).__name__}"
+
+
+def test_check_optional_string_length():
+    assert check_optional_string_length(None, 2, "TestCase", "description") is None
+    assert check_optional_string_length("", 2, "TestCase", "description") == ""
+    with pytest.raises(ValueError):
+        check_optional_string_length("abc", 2, "TestCase", "description")
+
+
+@pytest.mark.parametrize("value", [0, 1670248341000])
+def test_check_non_negative_integer(value):
+    assert value == check_non_negative_integer(value, "TestCase", "timestamp")
+
+
+def test_check_non_negative_integer_integral_float():
+    value = check_non_negative_integer(1666698047000.0, "TestCase", "timestamp")
+
+    assert value == 1666698047000
+    assert isinstance(value, int)
+
+
+@pytest.mark.parametrize("value, error", [(-1, ValueError), (-1.0, ValueError), (True, TypeError), (1.5, TypeError),
+                                          (float("nan"), TypeError), (float("inf"), TypeError), ("1", TypeError)])
+def test_check_non_negative_integer_error(value, error):
+    with pytest.raises(error):
+        check_non_negative_integer(value, "TestCase", "timestamp")
+
+
+def test_check_string_or_string_list():
+    values = ["a", "b"]
+
+    assert "a" == check_string_or_string_list("a", "Constant", "value")
+    assert values == check_string_or_string_list(values, "Constant", "value")
+    assert values is not check_string_or_string_list(values, "Constant", "value")
+    for value in (None, 1, ("a",), ["a", 1]):
+        with pytest.raises(TypeError):
+            check_string_or_string_list(value, "Constant", "value")
+
+
 def test_teststep_checks(teststep_folder):
     assert validate_new_teststep(teststep_folder, TestStep, TestStepFolder)
 